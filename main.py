@@ -2,14 +2,22 @@ import sys
 import os
 from pathlib import Path
 
-from PySide6.QtCore import QUrl, QObject, Slot
+from PySide6.QtCore import Qt, QUrl, QObject, Signal, Slot, Property
 from PySide6.QtGui import QGuiApplication
 from PySide6.QtQml import QQmlApplicationEngine
 from PySide6.QtQuickControls2 import QQuickStyle
 
-from src.backend import TimerBackend, TasksBackend, SettingsBackend, ProjectsBackend
+from src.backend import (
+    TimerBackend,
+    TasksBackend,
+    SettingsBackend,
+    ProjectsBackend,
+    StatsBackend,
+)
 from src.project_tasks import ProjectTasksBackend
-from src.highlighter import MarkdownHighlighter
+from src.database import Database
+from src.workers import DatabaseWorker
+from src.highlighter import HighlighterRegistry
 from src.markdown_renderer import MarkdownRenderer
 
 
@@ -27,15 +35,35 @@ def main() -> int:
     timer_backend = TimerBackend()
     tasks_backend = TasksBackend()
     settings_backend = SettingsBackend()
-    projects_backend = ProjectsBackend()
+    # One worker for all backends: its read threads plus its write thread
+    # use exactly the connections the database pools for background work
+    db_worker = DatabaseWorker(
+        read_threads=Database.get_instance().worker_pool_size - 1
+    )
+    projects_backend = ProjectsBackend(db_worker)
     project_tasks_backend = ProjectTasksBackend()
+    stats_backend = StatsBackend(db_worker)
     markdown_renderer = MarkdownRenderer()
 
+    # Flush buffered markdown edits before the database is closed
+    app.aboutToQuit.connect(projects_backend.shutdown)
+    app.aboutToQuit.connect(db_worker.shutdown)
+    app.aboutToQuit.connect(Database.get_instance().dispose)
+    app.applicationStateChanged.connect(
+        lambda state: projects_backend.flush()
+        if state != Qt.ApplicationState.ApplicationActive
+        else None
+    )
+
     # Initial sync
     timer_backend.setWorkDuration(settings_backend.workDuration)
     timer_backend.setShortBreakDuration(settings_backend.shortBreakDuration)
     timer_backend.setLongBreakDuration(settings_backend.longBreakDuration)
     timer_backend.set_settings_backend(settings_backend)
+    timer_backend.set_completed_sessions(stats_backend.getTodaySummary()["completed"])
+
+    # Session history
+    timer_backend.sessionEvent.connect(stats_backend.recordEvent)
 
     # Reactive sync for timer settings
     settings_backend.workDurationChanged.connect(
@@ -61,21 +89,44 @@ def main() -> int:
         "ProjectTasksBackend", project_tasks_backend
     )
     engine.rootContext().setContextProperty("MarkdownRenderer", markdown_renderer)
+    engine.rootContext().setContextProperty("StatsBackend", stats_backend)
 
     class HighlighterBridge(QObject):
+        highlighterCountChanged = Signal()
+
         def __init__(self):
             super().__init__()
-            self._highlighters = []
+            self._registry = HighlighterRegistry(self)
+            self._registry.countChanged.connect(self.highlighterCountChanged)
 
-        @Slot(QObject)
-        def apply(self, text_area):
+        def _document(self, text_area):
             if not text_area:
-                return
+                return None
             quick_doc = text_area.property("textDocument")
-            if quick_doc:
-                doc = quick_doc.textDocument()
-                highlighter = MarkdownHighlighter(doc)
-                self._highlighters.append(highlighter)
+            return quick_doc.textDocument() if quick_doc else None
+
+        @Slot(QObject)
+        def apply(self, text_area):
+            # Text is often loaded after this, so any document may grow
+            # large; the incremental highlighter never blocks on it
+            doc = self._document(text_area)
+            if doc is not None:
+                self._registry.attach(doc)
+
+        @Slot(QObject, int, int)
+        def showRange(self, text_area, first_position, last_position):
+            """Highlight the visible part of ``text_area`` first."""
+            doc = self._document(text_area)
+            highlighter = self._registry.get(doc) if doc is not None else None
+            if highlighter is not None:
+                highlighter.highlightRange(first_position, last_position)
+
+        def _get_highlighter_count(self):
+            return self._registry.count
+
+        highlighterCount = Property(
+            int, _get_highlighter_count, notify=highlighterCountChanged
+        )
 
     class ClipboardHelper(QObject):
         @Slot(str)
@@ -9,6 +9,7 @@ Item {
     property string text: ""
     property string placeholder: "No content yet. Click Edit to start writing..."
     signal contentUpdated(string newText)
+    signal editingFinished
 
     property string mode: "preview" // "preview" or "edit"
 
@@ -128,6 +129,30 @@ Item {
                 ScrollView {
                     id: editorScrollView
                     clip: true
+
+                    // Large documents are highlighted in the background;
+                    // ask for whatever scrolls into view to go first
+                    Timer {
+                        id: visibleRangeTimer
+                        interval: 50
+                        onTriggered: {
+                            if (typeof Highlighter !== 'undefined') {
+                                const top = editorScrollView.contentItem.contentY;
+                                const bottom = top + editorScrollView.height;
+                                Highlighter.showRange(editorArea,
+                                    editorArea.positionAt(0, top),
+                                    editorArea.positionAt(editorArea.width, bottom));
+                            }
+                        }
+                    }
+
+                    Connections {
+                        target: editorScrollView.contentItem
+                        function onContentYChanged() {
+                            visibleRangeTimer.restart();
+                        }
+                    }
+
                     TextArea {
                         id: editorArea
                         width: editorScrollView.width
@@ -166,6 +191,12 @@ Item {
                                 root.contentUpdated(text);
                             }
                         }
+
+                        onActiveFocusChanged: {
+                            if (!activeFocus) {
+                                root.editingFinished();
+                            }
+                        }
                     }
                 }
             }
@@ -236,9 +236,9 @@ Rectangle {
                     onClicked: {
                         const tags = tagsInput.text.split(",").map(t => t.trim()).filter(t => t.length > 0)
                         if (root.projectData.id) {
-                            ProjectsBackend.updateProject(root.projectData.id, titleInput.text, headlineInput.text, clientNameInput.text, startDateInput.text, deadlineInput.text, statusModel.get(statusCombo.currentIndex).text, tags)
+                            ProjectsBackend.updateProjectAsync(root.projectData.id, titleInput.text, headlineInput.text, clientNameInput.text, startDateInput.text, deadlineInput.text, statusModel.get(statusCombo.currentIndex).text, tags)
                         } else {
-                            ProjectsBackend.createProject(titleInput.text, headlineInput.text, clientNameInput.text, startDateInput.text, deadlineInput.text, statusModel.get(statusCombo.currentIndex).text, tags)
+                            ProjectsBackend.createProjectAsync(titleInput.text, headlineInput.text, clientNameInput.text, startDateInput.text, deadlineInput.text, statusModel.get(statusCombo.currentIndex).text, tags)
                         }
                         root.visible = false
                         root.projectSaved(root.projectData.id || "new")
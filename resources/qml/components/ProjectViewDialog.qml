@@ -150,6 +150,7 @@ Rectangle {
                     onContentUpdated: newText => {
                         ProjectsBackend.updateProjectMarkdown(root.projectData.id, "details", newText);
                     }
+                    onEditingFinished: ProjectsBackend.flush()
                 }
 
                 // Tasks Tab
@@ -210,7 +211,8 @@ Rectangle {
                                     height: 60
                                     radius: 12
                                     color: Theme.colors.surface
-                                    border.color: Theme.colors.divider
+                                    // The task the timer's sessions are recorded against
+                                    border.color: TimerBackend.activeTaskId === modelData.id ? Theme.colors.primary : Theme.colors.divider
                                     border.width: 1
 
                                     RowLayout {
@@ -246,6 +248,13 @@ Rectangle {
                                             font.strikeout: modelData.completed
                                             elide: Text.ElideRight
                                             font.family: Theme.fontFamily
+
+                                            MouseArea {
+                                                anchors.fill: parent
+                                                cursorShape: Qt.PointingHandCursor
+                                                onClicked: TimerBackend.setActiveTask(
+                                                    TimerBackend.activeTaskId === modelData.id ? "" : modelData.id)
+                                            }
                                         }
 
                                         MouseArea {
@@ -258,7 +267,11 @@ Rectangle {
                                                 color: parent.containsMouse ? Theme.colors.error : Theme.colors.textMuted
                                                 font.pixelSize: 18
                                             }
-                                            onClicked: ProjectTasksBackend.deleteTask(modelData.id)
+                                            onClicked: {
+                                                if (TimerBackend.activeTaskId === modelData.id)
+                                                    TimerBackend.setActiveTask("");
+                                                ProjectTasksBackend.deleteTask(modelData.id);
+                                            }
                                         }
                                     }
                                 }
@@ -442,8 +455,16 @@ Rectangle {
         }
     }
 
+    onVisibleChanged: {
+        if (!visible) {
+            ProjectsBackend.flush();
+        }
+    }
+
     onProjectDataChanged: {
         if (projectData && projectData.id) {
+            // Sessions run from here on count towards the opened project
+            TimerBackend.setActiveProject(projectData.id);
             root.projectTasks = ProjectTasksBackend.getProjectTasks(projectData.id);
         }
     }
@@ -492,6 +492,7 @@ Item {
                     border.color: Theme.colors.divider
 
                     ColumnLayout {
+                        id: latestCard
                         anchors.fill: parent
                         anchors.margins: Theme.spacing.xl
                         spacing: Theme.spacing.lg
@@ -508,9 +509,24 @@ Item {
                             Layout.fillHeight: true
                         }
 
-                        property var latestProject: {
-                            var projects = ProjectsBackend.getActiveProjects();
-                            return projects.length > 0 ? projects[0] : null;
+                        property var latestProject: null
+                        property int latestRequest: 0
+
+                        function loadLatestProject() {
+                            latestRequest = ProjectsBackend.getActiveProjectsAsync();
+                        }
+
+                        Component.onCompleted: loadLatestProject()
+
+                        Connections {
+                            target: ProjectsBackend
+                            function onProjectsChanged() {
+                                latestCard.loadLatestProject();
+                            }
+                            function onProjectsLoaded(requestId, projects) {
+                                if (requestId !== latestCard.latestRequest) return;
+                                latestCard.latestProject = projects.length > 0 ? projects[0] : null;
+                            }
                         }
 
                         ColumnLayout {
@@ -8,20 +8,20 @@ import "../components"
 Item {
     id: root
 
-    property var allProjects: ProjectsBackend.getProjects()
-    property var projects: {
-        var filtered = [];
-        for (var i = 0; i < allProjects.length; i++) {
-            if (root.currentFilter === "all" || allProjects[i].status === root.currentFilter) {
-                filtered.push(allProjects[i]);
-            }
-        }
-        return filtered;
-    }
-    property string currentFilter: "all"
+    property var projectsModel: ProjectsBackend.projectsModel
+    property string currentFilter: projectsModel.statusFilter
+    // Id of the project load whose result opens the view dialog
+    property int openRequest: 0
 
-    onAllProjectsChanged: {
-        // Trigger recalculation of filtered projects
+    Connections {
+        target: ProjectsBackend
+        function onProjectLoaded(requestId, project) {
+            if (requestId !== root.openRequest) return
+            root.openRequest = 0
+            if (!project.id) return
+            projectView.projectData = project
+            projectView.visible = true
+        }
     }
 
     Rectangle {
@@ -84,10 +84,7 @@ Item {
                         MouseArea {
                             anchors.fill: parent
                             cursorShape: Qt.PointingHandCursor
-                            onClicked: {
-                                root.currentFilter = modelData.filter
-                                root.allProjects = ProjectsBackend.getProjects()
-                            }
+                            onClicked: root.projectsModel.statusFilter = modelData.filter
                         }
                     }
                 }
@@ -119,33 +116,31 @@ Item {
             }
         }
 
-        // Projects Grid - 2 columns
-        ScrollView {
+        // Projects Grid - 2 columns, pages are fetched as the view scrolls
+        GridView {
+            id: projectsGrid
             Layout.fillWidth: true
             Layout.fillHeight: true
             clip: true
-            ScrollBar.vertical.policy: ScrollBar.AsNeeded
+            cellWidth: Math.floor(width / 2)
+            cellHeight: 220 + Theme.spacing.md
+            ScrollBar.vertical: ScrollBar { policy: ScrollBar.AsNeeded }
 
-            GridLayout {
-                width: parent.width - 40
-                columns: 2
-                rowSpacing: Theme.spacing.md
-                columnSpacing: Theme.spacing.md
+            model: root.projectsModel
+            delegate: Item {
+                width: projectsGrid.cellWidth
+                height: projectsGrid.cellHeight
 
-                Repeater {
-                    model: root.projects
-                    ProjectCard {
-                        Layout.fillWidth: true
-                        Layout.minimumWidth: 220
-                        Layout.preferredHeight: 220
-                        projectData: modelData
-                        onOpenProject: function(projectId) {
-                            projectView.projectData = ProjectsBackend.getProject(projectId)
-                            projectView.visible = true
-                        }
-                        onDeleteProject: function(projectId) {
-                            ProjectsBackend.deleteProject(projectId)
-                        }
+                ProjectCard {
+                    anchors.fill: parent
+                    anchors.rightMargin: Theme.spacing.md
+                    anchors.bottomMargin: Theme.spacing.md
+                    projectData: model.project
+                    onOpenProject: function(projectId) {
+                        root.openRequest = ProjectsBackend.getProjectAsync(projectId)
+                    }
+                    onDeleteProject: function(projectId) {
+                        ProjectsBackend.deleteProjectAsync(projectId)
                     }
                 }
             }
@@ -155,7 +150,7 @@ Item {
     // Empty state
     Rectangle {
         anchors.fill: parent
-        visible: root.projects.length === 0
+        visible: root.projectsModel.count === 0 && !root.projectsModel.loading
         color: "transparent"
 
         Column {
@@ -185,18 +180,10 @@ Item {
         id: projectDialog
         anchors.centerIn: parent
         visible: false
-        onProjectSaved: root.projects = ProjectsBackend.getProjects()
     }
 
     ProjectViewDialog {
         id: projectView
         visible: false
     }
-
-    Connections {
-        target: ProjectsBackend
-        function onProjectsChanged() {
-            root.allProjects = ProjectsBackend.getProjects()
-        }
-    }
 }
@@ -8,7 +8,7 @@ import "../components" as Components
 Item {
     id: root
 
-    property var tasks: TasksBackend.getTasks()
+    property var tasksModel: TasksBackend.tasksModel
 
     Rectangle {
         anchors.fill: parent
@@ -84,7 +84,7 @@ Item {
                     anchors.margins: Theme.spacing.md
 
                     Text {
-                        text: TasksBackend.getTaskCount().toString()
+                        text: TasksBackend.taskCount.toString()
                         color: Theme.colors.primary
                         font.pixelSize: 20
                         font.bold: true
@@ -109,7 +109,7 @@ Item {
                     anchors.margins: Theme.spacing.md
 
                     Text {
-                        text: TasksBackend.getCompletedCount().toString()
+                        text: TasksBackend.completedCount.toString()
                         color: Theme.colors.success
                         font.pixelSize: 20
                         font.bold: true
@@ -134,7 +134,7 @@ Item {
                     anchors.margins: Theme.spacing.md
 
                     Text {
-                        text: (TasksBackend.getTaskCount() - TasksBackend.getCompletedCount()).toString()
+                        text: TasksBackend.pendingCount.toString()
                         color: Theme.colors.warning
                         font.pixelSize: 20
                         font.bold: true
@@ -150,35 +150,29 @@ Item {
         }
 
         // Tasks List
-        ScrollView {
+        ListView {
+            id: tasksList
             Layout.fillWidth: true
             Layout.fillHeight: true
             clip: true
-            ScrollBar.vertical.policy: ScrollBar.AsNeeded
+            spacing: Theme.spacing.sm
+            model: root.tasksModel
+            ScrollBar.vertical: ScrollBar { policy: ScrollBar.AsNeeded }
 
-            ColumnLayout {
-                width: parent.width - 20
-                spacing: Theme.spacing.sm
-
-                Repeater {
-                    model: root.tasks
-
-                    TaskCard {
-                        Layout.fillWidth: true
-                        taskData: modelData
+            delegate: TaskCard {
+                width: tasksList.width - 20
+                taskData: model.task
 
-                        onToggleTask: function(taskId) {
-                            TasksBackend.toggleTask(taskId)
-                        }
+                onToggleTask: function(taskId) {
+                    TasksBackend.toggleTask(taskId)
+                }
 
-                        onDeleteTask: function(taskId) {
-                            TasksBackend.deleteTask(taskId)
-                        }
+                onDeleteTask: function(taskId) {
+                    TasksBackend.deleteTask(taskId)
+                }
 
-                        onEditTask: function(taskId, title, description) {
-                            TasksBackend.updateTask(taskId, title, description)
-                        }
-                    }
+                onEditTask: function(taskId, title, description) {
+                    TasksBackend.updateTask(taskId, title, description)
                 }
             }
         }
@@ -187,7 +181,7 @@ Item {
     // Empty state
     Rectangle {
         anchors.fill: parent
-        visible: root.tasks.length === 0
+        visible: root.tasksModel.count === 0
         color: "transparent"
 
         Column {
@@ -221,11 +215,4 @@ Item {
             TasksBackend.addTask(title, description)
         }
     }
-
-    Connections {
-        target: TasksBackend
-        function onTasksChanged() {
-            root.tasks = TasksBackend.getTasks()
-        }
-    }
 }
@@ -4,5 +4,12 @@ from .timer import TimerBackend
 from .tasks import TasksBackend
 from .settings import SettingsBackend
 from .projects import ProjectsBackend
+from .stats import StatsBackend
 
-__all__ = ["TimerBackend", "TasksBackend", "SettingsBackend", "ProjectsBackend"]
+__all__ = [
+    "TimerBackend",
+    "TasksBackend",
+    "SettingsBackend",
+    "ProjectsBackend",
+    "StatsBackend",
+]
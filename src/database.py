@@ -1,12 +1,30 @@
 """Database models using SQLAlchemy."""
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
-from sqlalchemy import create_engine, Column, String, DateTime, Text, JSON
-from sqlalchemy.orm import declarative_base, sessionmaker, Session
+from sqlalchemy import (
+    create_engine,
+    event,
+    func,
+    select,
+    tuple_,
+    Boolean,
+    Column,
+    Integer,
+    String,
+    DateTime,
+    Text,
+    JSON,
+    ForeignKey,
+    Index,
+)
+from sqlalchemy.orm import declarative_base, defer, sessionmaker, Query, Session
+from sqlalchemy.pool import QueuePool
 from pathlib import Path
 
+from .migrations import migrate
+
 Base = declarative_base()
 
 
@@ -29,10 +47,23 @@ class Project(Base):
     tasks_markdown = Column(Text, default="")
 
     created_at = Column(DateTime, default=datetime.now)
-    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+    updated_at = Column(
+        DateTime, nullable=False, default=datetime.now, onupdate=datetime.now
+    )
+
+    # Kept in step with the migrations that create them on existing databases
+    __table_args__ = (
+        Index("ix_projects_updated_at", updated_at.desc(), id.desc()),
+        Index(
+            "ix_projects_status_updated_at", status, updated_at.desc(), id.desc()
+        ),
+        Index(
+            "ix_projects_client_name", client_name, updated_at.desc(), id.desc()
+        ),
+    )
 
-    def to_dict(self) -> dict:
-        return {
+    def to_dict(self, include_markdown: bool = True) -> dict:
+        data = {
             "id": self.id,
             "title": self.title,
             "headline": self.headline,
@@ -45,8 +76,6 @@ class Project(Base):
             else None,
             "status": self.status,
             "tags": self.tags or [],
-            "details_markdown": self.details_markdown or "",
-            "tasks_markdown": self.tasks_markdown or "",
             "created_at": self.created_at.isoformat()
             if self.created_at is not None
             else None,
@@ -54,19 +83,341 @@ class Project(Base):
             if self.updated_at is not None
             else None,
         }
+        if include_markdown:
+            data["details_markdown"] = self.details_markdown or ""
+            data["tasks_markdown"] = self.tasks_markdown or ""
+        return data
+
+
+class ProjectTag(Base):
+    """One row per (project, tag), mirroring ``Project.tags`` for lookups."""
+
+    __tablename__ = "project_tags"
+
+    project_id = Column(
+        String, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True
+    )
+    tag = Column(String(255), primary_key=True)
+
+    __table_args__ = (Index("ix_project_tags_tag", tag, project_id),)
+
+
+class TaskRecord(Base):
+    """Stored general task; exposed to QML through ``tasks.Task``."""
+
+    __tablename__ = "tasks"
+
+    id = Column(String, primary_key=True)
+    title = Column(String, nullable=False)
+    description = Column(Text, default="")
+    completed = Column(Boolean, default=False, nullable=False)
+    created_at = Column(DateTime, default=datetime.now, nullable=False)
+    pomodoros_completed = Column(Integer, default=0, nullable=False)
+
+    __table_args__ = (
+        Index("ix_tasks_created_at", created_at.desc(), id.desc()),
+        Index("ix_tasks_completed", completed),
+    )
+
+
+class ProjectTaskRecord(Base):
+    """Stored project task; exposed to QML through ``project_tasks.ProjectTask``.
+
+    Deliberately not a foreign key to ``projects``: legacy task files may
+    reference projects that no longer exist.
+    """
+
+    __tablename__ = "project_tasks"
+
+    id = Column(String, primary_key=True)
+    project_id = Column(String, nullable=False)
+    title = Column(String, nullable=False)
+    completed = Column(Boolean, default=False, nullable=False)
+    created_at = Column(DateTime, default=datetime.now, nullable=False)
+
+    __table_args__ = (
+        Index("ix_project_tasks_project_created", project_id, created_at.desc()),
+        Index("ix_project_tasks_project_completed", project_id, completed),
+    )
+
+
+class SessionEvent(Base):
+    """One timer event: start, pause, reset, skip or complete.
+
+    ``duration_seconds`` is the running time that ended with this event
+    (zero for ``start``). The rollup tables below are derived from these
+    rows; see ``stats.record_session_event``.
+    """
+
+    __tablename__ = "sessions"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    event = Column(String(16), nullable=False)
+    session_type = Column(String(16), nullable=False)
+    occurred_at = Column(DateTime, default=datetime.now, nullable=False)
+    duration_seconds = Column(Integer, default=0, nullable=False)
+    project_id = Column(String, nullable=True)
+    task_id = Column(String, nullable=True)
+
+    __table_args__ = (
+        Index("ix_sessions_occurred_at", occurred_at),
+        Index("ix_sessions_project_occurred", project_id, occurred_at),
+    )
+
+
+class DailySessionStat(Base):
+    """Per-day totals by session type and project ("" for none)."""
+
+    __tablename__ = "session_stats_daily"
+
+    session_type = Column(String(16), primary_key=True)
+    day = Column(String(10), primary_key=True)  # YYYY-MM-DD, local time
+    project_id = Column(String, primary_key=True, default="")
+    seconds = Column(Integer, default=0, nullable=False)
+    completed = Column(Integer, default=0, nullable=False)
+    skipped = Column(Integer, default=0, nullable=False)
+
+
+class WeeklySessionStat(Base):
+    """Per-week totals by session type and project ("" for none)."""
+
+    __tablename__ = "session_stats_weekly"
+
+    session_type = Column(String(16), primary_key=True)
+    week = Column(String(10), primary_key=True)  # the week's Monday, YYYY-MM-DD
+    project_id = Column(String, primary_key=True, default="")
+    seconds = Column(Integer, default=0, nullable=False)
+    completed = Column(Integer, default=0, nullable=False)
+    skipped = Column(Integer, default=0, nullable=False)
+
+
+def normalize_tags(tags: Optional[list[str]]) -> list[str]:
+    """Strip, drop empty and de-duplicate tags, keeping their order."""
+    seen: dict[str, None] = {}
+    for tag in tags or []:
+        tag = str(tag).strip()
+        if tag:
+            seen.setdefault(tag)
+    return list(seen)
+
+
+def set_project_tags(session: Session, project_id: str, tags: list[str]) -> None:
+    """Replace the tag index rows for a project within ``session``."""
+    session.query(ProjectTag).filter(ProjectTag.project_id == project_id).delete(
+        synchronize_session=False
+    )
+    session.add_all(ProjectTag(project_id=project_id, tag=tag) for tag in tags)
+
+
+def summary_query(session: Session) -> Query:
+    """Query projects without loading the markdown columns.
+
+    Accessing a deferred markdown attribute on the result raises instead of
+    silently issuing one extra SELECT per row.
+    """
+    return session.query(Project).options(
+        defer(Project.details_markdown, raiseload=True),
+        defer(Project.tasks_markdown, raiseload=True),
+    )
+
+
+def encode_cursor(project: Project) -> str:
+    """Opaque keyset cursor pointing just past ``project``."""
+    return f"{project.updated_at.isoformat()}|{project.id}"
+
+
+def filtered_query(
+    session: Session,
+    status: Optional[str] = None,
+    tags: Optional[list[str]] = None,
+    client_name: Optional[str] = None,
+    match_all: bool = True,
+) -> Query:
+    """Summary query restricted to the given status, tags and client.
+
+    With ``match_all`` a project must carry every tag in ``tags``, otherwise
+    any one of them is enough. Tag matching goes through ``project_tags``.
+    """
+    query = summary_query(session)
+    if status:
+        query = query.filter(Project.status == status)
+    if client_name:
+        query = query.filter(Project.client_name == client_name)
+    tags = normalize_tags(tags)
+    if tags:
+        tagged = select(ProjectTag.project_id).where(ProjectTag.tag.in_(tags))
+        if match_all and len(tags) > 1:
+            tagged = tagged.group_by(ProjectTag.project_id).having(
+                func.count() == len(tags)
+            )
+        query = query.filter(Project.id.in_(tagged))
+    return query
+
+
+def projects_query(session: Session, status: Optional[str] = None) -> Query:
+    """Summary query for every project, or those with ``status``, newest first."""
+    query = summary_query(session)
+    if status is not None:
+        query = query.filter(Project.status == status)
+    return query.order_by(Project.updated_at.desc())
+
+
+def page_query(
+    session: Session,
+    after: str = "",
+    limit: int = 50,
+    status: Optional[str] = None,
+    tags: Optional[list[str]] = None,
+    client_name: Optional[str] = None,
+    match_all: bool = True,
+) -> Query:
+    """The query behind :func:`project_page`, fetching one row extra."""
+    query = filtered_query(session, status, tags, client_name, match_all)
+    if after:
+        updated_at, _, project_id = after.partition("|")
+        query = query.filter(
+            tuple_(Project.updated_at, Project.id)
+            < tuple_(datetime.fromisoformat(updated_at), project_id)
+        )
+    return query.order_by(Project.updated_at.desc(), Project.id.desc()).limit(
+        limit + 1
+    )
+
+
+def project_page(
+    session: Session,
+    after: str = "",
+    limit: int = 50,
+    status: Optional[str] = None,
+    tags: Optional[list[str]] = None,
+    client_name: Optional[str] = None,
+    match_all: bool = True,
+) -> tuple[list[Project], str]:
+    """Fetch one page of project summaries, newest first.
+
+    Paging is keyset-based on ``(updated_at, id)``, so the cost of a page
+    doesn't depend on how deep into the list it is. Returns the projects and
+    the cursor for the next page, which is empty when there are no more.
+    """
+    rows = page_query(
+        session, after, limit, status, tags, client_name, match_all
+    ).all()
+    if len(rows) > limit:
+        return rows[:limit], encode_cursor(rows[limit - 1])
+    return rows, ""
 
 
 class Database:
-    """Database manager for SQLAlchemy."""
+    """Database manager for SQLAlchemy.
+
+    The engine runs SQLite in WAL mode with ``synchronous=NORMAL`` so commits
+    don't wait on a journal fsync and readers aren't blocked by a writer.
+    Connections are pooled and kept open for the lifetime of the process:
+    one for the GUI thread plus ``worker_pool_size`` for background work.
+    """
 
     _instance: Optional["Database"] = None
 
-    def __init__(self) -> None:
-        self.db_path = Path.home() / ".pomcraft" / "pomcraft.db"
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        cache_size_kib: int = 16 * 1024,
+        mmap_size: int = 64 * 1024 * 1024,
+        worker_pool_size: int = 2,
+    ) -> None:
+        self.db_path = db_path or Path.home() / ".pomcraft" / "pomcraft.db"
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.engine = create_engine(f"sqlite:///{self.db_path}")
+        self.worker_pool_size = worker_pool_size
+        self.cache_size_kib = cache_size_kib
+        self.mmap_size = mmap_size
+        self.engine = create_engine(
+            f"sqlite:///{self.db_path}",
+            poolclass=QueuePool,
+            pool_size=1 + worker_pool_size,
+            max_overflow=0,
+            pool_timeout=30,
+            connect_args={"check_same_thread": False},
+        )
+        event.listen(self.engine, "connect", self._configure_connection)
         Base.metadata.create_all(self.engine)
-        self.SessionLocal = sessionmaker(bind=self.engine)
+        self.schema_version = self._migrate()
+        self.SessionLocal = sessionmaker(bind=self.engine, expire_on_commit=False)
+
+    def _configure_connection(self, dbapi_connection, connection_record) -> None:
+        """Apply the storage pragmas to every new SQLite connection."""
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute("PRAGMA foreign_keys=ON")
+            # Negative values are interpreted by SQLite as KiB, not pages
+            cursor.execute(f"PRAGMA cache_size=-{int(self.cache_size_kib)}")
+            cursor.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+            cursor.execute("PRAGMA busy_timeout=5000")
+        finally:
+            cursor.close()
+
+    def _migrate(self) -> int:
+        with self.engine.connect() as conn:
+            # Table rebuilds need foreign keys off, or dropping a table
+            # cascades into the tables referencing it. The pragma is a no-op
+            # inside a transaction, so it is switched before BEGIN.
+            conn.exec_driver_sql("PRAGMA foreign_keys=OFF")
+            try:
+                # Explicit BEGIN so DDL and the version bump commit atomically
+                conn.exec_driver_sql("BEGIN IMMEDIATE")
+                try:
+                    version = migrate(conn)
+                except Exception:
+                    conn.rollback()
+                    raise
+                conn.commit()
+            finally:
+                # The connection goes back to the pool for regular use
+                conn.exec_driver_sql("PRAGMA foreign_keys=ON")
+        return version
+
+    def explain(self, statement: Any) -> list[str]:
+        """Return the ``EXPLAIN QUERY PLAN`` details for a query.
+
+        ``statement`` is an ORM ``Query``, a Core statement or plain SQL.
+        Statements are compiled exactly as they would be executed.
+        """
+        params: tuple = ()
+        if isinstance(statement, Query):
+            statement = statement.statement
+        if isinstance(statement, str):
+            sql = statement
+        else:
+            compiled = statement.compile(
+                dialect=self.engine.dialect,
+                compile_kwargs={"render_postcompile": True},
+            )
+            sql = str(compiled)
+            values = compiled.construct_params()
+            params = tuple(values[name] for name in compiled.positiontup or ())
+        with self.engine.connect() as conn:
+            rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+        return [row[-1] for row in rows]
+
+    def unindexed_queries(
+        self, queries: dict[str, Any], allow_sort: bool = False
+    ) -> dict[str, list[str]]:
+        """Return those of ``queries`` whose plan has a full scan or a sort.
+
+        With ``allow_sort``, sorting is accepted: for lookups whose rows are
+        found through an index, sorting just those rows is the right plan.
+        """
+        offenders = {}
+        for name, statement in queries.items():
+            plan = self.explain(statement)
+            # "SCAN projects" is a full scan; "SCAN projects USING INDEX" is not
+            if any(
+                step.startswith("SCAN") and "USING" not in step for step in plan
+            ) or (not allow_sort and any("TEMP B-TREE" in step for step in plan)):
+                offenders[name] = plan
+        return offenders
 
     @classmethod
     def get_instance(cls) -> "Database":
@@ -76,3 +427,9 @@ class Database:
 
     def get_session(self) -> Session:
         return self.SessionLocal()
+
+    def dispose(self) -> None:
+        """Checkpoint the WAL and close all pooled connections."""
+        with self.engine.connect() as conn:
+            conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+        self.engine.dispose()
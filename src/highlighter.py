@@ -1,120 +1,578 @@
+import bisect
 import re
-from PySide6.QtGui import QSyntaxHighlighter, QTextCharFormat, QColor, QFont
-from PySide6.QtCore import Qt
+import time
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Mapping
 
+import shiboken6
+from PySide6.QtGui import (
+    QSyntaxHighlighter,
+    QTextBlock,
+    QTextCharFormat,
+    QTextDocument,
+    QTextLayout,
+    QColor,
+    QFont,
+)
+from PySide6.QtCore import Qt, QObject, QTimer, Signal, Slot, Property
 
-class MarkdownHighlighter(QSyntaxHighlighter):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self._formats = {}
-        self._setup_formats()
-
-    def _setup_formats(self):
-        # Header Format
-        header = QTextCharFormat()
-        header.setForeground(QColor("#6366F1"))
-        header.setFontWeight(QFont.Weight.Bold)
-        header.setFontPointSize(18)
-        self._formats["header"] = header
-
-        # Bold Format
-        bold = QTextCharFormat()
-        bold.setForeground(QColor("#8B5CF6"))
-        bold.setFontWeight(QFont.Weight.Bold)
-        self._formats["bold"] = bold
-
-        # Italic Format
-        italic = QTextCharFormat()
-        italic.setFontItalic(True)
-        italic.setForeground(QColor("#EC4899"))
-        self._formats["italic"] = italic
-
-        # Code Format
-        code = QTextCharFormat()
-        code.setForeground(QColor("#10B981"))
-        code.setBackground(QColor("#1F1F35"))
-        code.setFontFamily("Consolas, monospace")
-        self._formats["code"] = code
-
-        # List/Bullet Format
-        list_fmt = QTextCharFormat()
-        list_fmt.setForeground(QColor("#F59E0B"))
-        list_fmt.setFontWeight(QFont.Weight.Bold)
-        self._formats["list"] = list_fmt
-
-        # Link Format
-        link = QTextCharFormat()
-        link.setForeground(QColor("#3B82F6"))
-        link.setFontUnderline(True)
-        self._formats["link"] = link
-
-        # Blockquote Format
-        quote = QTextCharFormat()
-        quote.setForeground(QColor("#9CA3AF"))
-        quote.setFontItalic(True)
-        self._formats["quote"] = quote
-
-        # Task Format
-        task = QTextCharFormat()
-        task.setForeground(QColor("#10B981"))
-        task.setFontWeight(QFont.Weight.Bold)
-        self._formats["task"] = task
-
-        # Strikethrough Format
-        strike = QTextCharFormat()
-        strike.setForeground(QColor("#6B7280"))
-        strike.setFontStrikeOut(True)
-        self._formats["strike"] = strike
+# Inline span kinds in the order they are applied; a later kind wins where
+# spans overlap, so code overrides emphasis and a link overrides code
+INLINE_KINDS = ("strike", "bold", "italic", "code", "link")
+# Where an inline span can start: one pass over the text finds them all,
+# and each is tried against the kinds that start with that character, as
+# (index into INLINE_KINDS, pattern)
+INLINE_START_PATTERN = re.compile(r"[~*`\[]")
+INLINE_SPANS = {
+    "~": ((0, re.compile(r"~~[^~]+~~")),),
+    "*": (
+        (1, re.compile(r"\*\*[^*]+\*\*")),
+        (2, re.compile(r"(?<!\*)\*[^*]+\*(?!\*)")),
+    ),
+    "`": ((3, re.compile(r"`[^`]+`")),),
+    "[": ((4, re.compile(r"\[[^\]]+\]\([^)]+\)")),),
+}
+LIST_ITEM_PATTERN = re.compile(r"\s*(?:(?P<bullet>[-*+])|\d+\.)(?=\s)")
+TASK_BOX_PATTERN = re.compile(r"\s+\[[ xX]\]")
+FENCE_PATTERN = re.compile(r" {0,3}(`{3,}|~{3,})")
+
+# Block states carried from one block to the next. Inside a fence the
+# state also records the fence character and length, which the closing
+# fence has to match: FENCE_BACKTICK/FENCE_TILDE + (length << 4).
+STATE_NORMAL = 0
+STATE_COMMENT = 1
+STATE_FRONT_MATTER = 2
+STATE_FENCE_BACKTICK = 3
+STATE_FENCE_TILDE = 4
+
+
+def _build_formats() -> dict[str, QTextCharFormat]:
+    formats = {}
+
+    # Header Format
+    header = QTextCharFormat()
+    header.setForeground(QColor("#6366F1"))
+    header.setFontWeight(QFont.Weight.Bold)
+    header.setFontPointSize(18)
+    formats["header"] = header
+
+    # Bold Format
+    bold = QTextCharFormat()
+    bold.setForeground(QColor("#8B5CF6"))
+    bold.setFontWeight(QFont.Weight.Bold)
+    formats["bold"] = bold
+
+    # Italic Format
+    italic = QTextCharFormat()
+    italic.setFontItalic(True)
+    italic.setForeground(QColor("#EC4899"))
+    formats["italic"] = italic
+
+    # Code Format
+    code = QTextCharFormat()
+    code.setForeground(QColor("#10B981"))
+    code.setBackground(QColor("#1F1F35"))
+    code.setFontFamily("Consolas, monospace")
+    formats["code"] = code
+
+    # List/Bullet Format
+    list_fmt = QTextCharFormat()
+    list_fmt.setForeground(QColor("#F59E0B"))
+    list_fmt.setFontWeight(QFont.Weight.Bold)
+    formats["list"] = list_fmt
+
+    # Link Format
+    link = QTextCharFormat()
+    link.setForeground(QColor("#3B82F6"))
+    link.setFontUnderline(True)
+    formats["link"] = link
+
+    # Blockquote Format
+    quote = QTextCharFormat()
+    quote.setForeground(QColor("#9CA3AF"))
+    quote.setFontItalic(True)
+    formats["quote"] = quote
+
+    # Task Format
+    task = QTextCharFormat()
+    task.setForeground(QColor("#10B981"))
+    task.setFontWeight(QFont.Weight.Bold)
+    formats["task"] = task
+
+    # HTML comment Format
+    comment = QTextCharFormat()
+    comment.setForeground(QColor("#6B7280"))
+    comment.setFontItalic(True)
+    formats["comment"] = comment
+
+    # Front matter Format
+    meta = QTextCharFormat()
+    meta.setForeground(QColor("#9CA3AF"))
+    meta.setFontFamily("Consolas, monospace")
+    formats["meta"] = meta
+
+    # Strikethrough Format
+    strike = QTextCharFormat()
+    strike.setForeground(QColor("#6B7280"))
+    strike.setFontStrikeOut(True)
+    formats["strike"] = strike
+    return formats
+
+
+_shared_formats = None
+
+
+def shared_formats() -> Mapping[str, QTextCharFormat]:
+    """The format table, built once and shared by every highlighter.
+
+    Read-only: highlighters must not modify the formats in it.
+    """
+    global _shared_formats
+    if _shared_formats is None:
+        _shared_formats = MappingProxyType(_build_formats())
+    return _shared_formats
+
+
+class _MarkdownRules:
+    """Markdown highlighting rules, written against the QSyntaxHighlighter
+    API (``setFormat``, ``previousBlockState``, ``setCurrentBlockState``,
+    ``currentBlock``) so they can also be driven outside of one."""
 
     def highlightBlock(self, text):
-        # Apply header styling for lines starting with #
-        if text.startswith("#"):
-            self.setFormat(0, len(text), self._formats["header"])
-            return  # Don't apply other formats to headers for clarity
-            
-        # Apply blockquote styling
-        if text.startswith(">"):
-            self.setFormat(0, len(text), self._formats["quote"])
+        # Qt calls this again for the following block only while the
+        # block state keeps changing, so opening or closing a fence
+        # re-highlights the blocks up to where the states agree again,
+        # not the whole document.
+        state = self.previousBlockState()
+
+        if state >= STATE_FENCE_BACKTICK:
+            self.setFormat(0, len(text), self._formats["code"])
+            closing = FENCE_PATTERN.match(text)
+            if (
+                closing
+                and self._fence_state(closing.group(1)) == state & 0xF
+                and len(closing.group(1)) >= state >> 4
+                and not text[closing.end():].strip()
+            ):
+                state = STATE_NORMAL
+            self.setCurrentBlockState(state)
+            return
+
+        if state == STATE_FRONT_MATTER or (
+            state == -1 and self.currentBlock().blockNumber() == 0 and text == "---"
+        ):
+            self.setFormat(0, len(text), self._formats["meta"])
+            closes = state == STATE_FRONT_MATTER and text.rstrip() in ("---", "...")
+            self.setCurrentBlockState(STATE_NORMAL if closes else STATE_FRONT_MATTER)
             return
 
-        # Apply strikethrough
-        for match in re.finditer(r"~~[^~]+~~", text):
-            self.setFormat(
-                match.start(), match.end() - match.start(), self._formats["strike"]
-            )
-
-        # Apply bold: **text**
-        for match in re.finditer(r"\*\*[^\*]+\*\*", text):
-            self.setFormat(
-                match.start(), match.end() - match.start(), self._formats["bold"]
-            )
-
-        # Apply italic: *text* (avoiding ** matches)
-        for match in re.finditer(r"(?<!\*)\*[^\*]+\*(?!\*)", text):
-            self.setFormat(
-                match.start(), match.end() - match.start(), self._formats["italic"]
-            )
-
-        # Apply inline code: `code`
-        for match in re.finditer(r"`[^`]+`", text):
-            self.setFormat(
-                match.start(), match.end() - match.start(), self._formats["code"]
-            )
-
-        # Apply links [text](url)
-        for match in re.finditer(r"\[([^\]]+)\]\([^\)]+\)", text):
-            self.setFormat(
-                match.start(), match.end() - match.start(), self._formats["link"]
-            )
+        self.setCurrentBlockState(STATE_NORMAL)
+        pos = 0
+        if state == STATE_COMMENT:
+            end = text.find("-->")
+            if end == -1:
+                self.setFormat(0, len(text), self._formats["comment"])
+                self.setCurrentBlockState(STATE_COMMENT)
+                return
+            pos = end + 3
+            self.setFormat(0, pos, self._formats["comment"])
+        else:
+            opening = FENCE_PATTERN.match(text)
+            # A backtick fence's info string can't contain backticks;
+            # ```like this``` is inline code
+            if opening and not (
+                opening.group(1)[0] == "`" and "`" in text[opening.end():]
+            ):
+                self.setFormat(0, len(text), self._formats["code"])
+                fence = opening.group(1)
+                self.setCurrentBlockState(self._fence_state(fence) + (len(fence) << 4))
+                return
+
+        # Apply header styling for lines starting with #, and blockquote
+        # styling for lines starting with >; no other formats on those
+        line_format = None
+        if pos == 0 and text.startswith("#"):
+            line_format = self._formats["header"]
+        elif pos == 0 and text.startswith(">"):
+            line_format = self._formats["quote"]
+
+        # Split the rest of the line around HTML comments
+        while pos < len(text):
+            opening = text.find("<!--", pos)
+            end = len(text) if opening == -1 else opening
+            if line_format is not None:
+                self.setFormat(pos, end - pos, line_format)
+            else:
+                self._highlight_inline(text, pos, end)
+            if opening == -1:
+                break
+            closing = text.find("-->", opening + 4)
+            if closing == -1:
+                self.setFormat(opening, len(text) - opening, self._formats["comment"])
+                self.setCurrentBlockState(STATE_COMMENT)
+                break
+            pos = closing + 3
+            self.setFormat(opening, pos - opening, self._formats["comment"])
 
         # Apply list bullet styling and tasks
-        if re.match(r"^\s*([-*+]|\d+\.)\s", text):
-            # Format tasks
-            task_match = re.search(r"^\s*[-*+]\s+\[[ xX]\]", text)
-            if task_match:
-                self.setFormat(0, task_match.end(), self._formats["task"])
+        if line_format is None and state != STATE_COMMENT:
+            item = LIST_ITEM_PATTERN.match(text)
+            if item:
+                task = item.group("bullet") and TASK_BOX_PATTERN.match(text, item.end())
+                if task:
+                    self.setFormat(0, task.end(), self._formats["task"])
+                else:
+                    # Format just the bullet/number
+                    self.setFormat(0, item.end(), self._formats["list"])
+
+    @staticmethod
+    def _fence_state(fence: str) -> int:
+        return STATE_FENCE_BACKTICK if fence[0] == "`" else STATE_FENCE_TILDE
+
+    def _highlight_inline(self, text: str, pos: int, endpos: int) -> None:
+        # Spans of one kind don't overlap each other, so a kind is only
+        # tried again past the end of its last span
+        resume = [pos] * len(INLINE_KINDS)
+        spans = []
+        for opening in INLINE_START_PATTERN.finditer(text, pos, endpos):
+            start = opening.start()
+            for kind, pattern in INLINE_SPANS[text[start]]:
+                if start >= resume[kind]:
+                    match = pattern.match(text, start, endpos)
+                    if match:
+                        resume[kind] = match.end()
+                        spans.append((kind, start, match.end()))
+        if not spans:
+            return
+
+        # Apply kind by kind, so the later kinds win where spans overlap
+        formats = self._formats
+        set_format = self.setFormat
+        spans.sort(key=itemgetter(0))
+        for kind, start, end in spans:
+            set_format(start, end - start, formats[INLINE_KINDS[kind]])
+
+
+class MarkdownHighlighter(_MarkdownRules, QSyntaxHighlighter):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._formats = shared_formats()
+
+
+class IncrementalMarkdownHighlighter(_MarkdownRules, QObject):
+    """Highlights a large document a slice at a time from the event loop.
+
+    QSyntaxHighlighter highlights the whole document synchronously as soon
+    as it is attached, which for a multi-megabyte document blocks the GUI
+    thread for a long time. This applies the same rules, but it writes
+    block formats and states itself: up to ``INITIAL_BLOCKS`` blocks from
+    the top of a new document or from an edit (what the editor is showing)
+    before returning, then at most ``budgetMs`` of work per event-loop
+    turn. Like QSyntaxHighlighter, a pass continues past the edited blocks
+    only while block states keep changing; blocks never highlighted yet
+    are always processed. ``highlightRange`` moves a scrolled-to range
+    ahead of the queue.
+
+    Only blocks whose formats changed are handed to the document layout,
+    once per run. Qt records every ``setFormats`` as a document change
+    and lays it out on the next edit anyway, so a run never leaves them
+    for later: an edit then costs what it would without a highlighter.
+    """
+
+    # Highlighted before returning, on attach and after an edit
+    INITIAL_BLOCKS = 120
+
+    progressChanged = Signal(float)
+    finished = Signal()
+    budgetMsChanged = Signal()
+
+    def __init__(self, document: QTextDocument, budget_ms: int = 8, parent=None):
+        super().__init__(parent or document)
+        self._doc = document
+        self._budget_ms = budget_ms
+        self._block_count = document.blockCount()
+        self._formats = shared_formats()
+        # Blocks before this have been highlighted in document order
+        self._processed_until = 0
+        # Where the pending pass resumes, and how far it must go regardless
+        # of states settling; None when idle
+        self._resume_at = None
+        self._force_until = 0
+        self._applying = False
+        # The blocks reformatted since the document layout last laid them
+        # out, as (position, end position), and how long it last took
+        self._dirty = None
+        self._relayout_ms = 0.0
+        # Laying out blocks also has the document layout move every block
+        # after them; the time that takes per block, measured as the pass
+        # goes on
+        self._walk_ms_per_block = 0.001
+
+        # The block being highlighted, as seen through the rules' API
+        self._block = QTextBlock()
+        self._previous_state = -1
+        self._state = -1
+        # Its formats so far, as sorted, non-overlapping (start, end, format)
+        self._length = 0
+        self._runs: list = []
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._run_slice)
+        document.contentsChange.connect(self._on_contents_change)
+
+        self._schedule(0, 0)
+        self._run(max_blocks=self.INITIAL_BLOCKS)
+
+    def document(self) -> QTextDocument:
+        return self._doc
+
+    # --- The QSyntaxHighlighter API used by the rules ---
+
+    def setFormat(self, start: int, count: int, fmt: QTextCharFormat) -> None:
+        start = max(0, start)
+        end = min(self._length, start + count)
+        if end <= start:
+            return
+        # Replace the runs it covers, keeping what sticks out at either end
+        runs = self._runs
+        first = bisect.bisect_right(runs, start, key=itemgetter(1))
+        last = bisect.bisect_left(runs, end, lo=first, key=itemgetter(0))
+        pieces = [(start, end, fmt)]
+        if first < last:
+            if runs[first][0] < start:
+                pieces.insert(0, (runs[first][0], start, runs[first][2]))
+            if runs[last - 1][1] > end:
+                pieces.append((end, runs[last - 1][1], runs[last - 1][2]))
+        runs[first:last] = pieces
+
+    def previousBlockState(self) -> int:
+        return self._previous_state
+
+    def setCurrentBlockState(self, state: int) -> None:
+        self._state = state
+
+    def currentBlock(self) -> QTextBlock:
+        return self._block
+
+    # --- Highlighting ---
+
+    def _highlight(self, block: QTextBlock) -> int:
+        """Highlight ``block`` and return its new state."""
+        text = block.text()
+        previous = block.previous()
+        self._block = block
+        self._previous_state = previous.userState() if previous.isValid() else -1
+        self._state = -1
+        self._length = len(text)
+        self._runs = []
+        self.highlightBlock(text)
+
+        # Adjacent runs in the same format become one range
+        merged = []
+        for run in self._runs:
+            if merged and merged[-1][2] is run[2] and merged[-1][1] == run[0]:
+                merged[-1] = (merged[-1][0], run[1], run[2])
             else:
-                # Format just the bullet/number
-                bullet_match = re.match(r"^\s*([-*+]|\d+\.)", text)
-                if bullet_match:
-                    self.setFormat(0, bullet_match.end(), self._formats["list"])
+                merged.append(run)
+        layout = block.layout()
+        current = layout.formats()
+        if len(current) != len(merged) or any(
+            (old.start, old.start + old.length) != (start, end) or old.format != fmt
+            for old, (start, end, fmt) in zip(current, merged)
+        ):
+            ranges = []
+            for start, end, fmt in merged:
+                fmt_range = QTextLayout.FormatRange()
+                fmt_range.start = start
+                fmt_range.length = end - start
+                fmt_range.format = fmt
+                ranges.append(fmt_range)
+            layout.setFormats(ranges)
+            start = block.position()
+            end = start + block.length()
+            if self._dirty is not None:
+                start = min(start, self._dirty[0])
+                end = max(end, self._dirty[1])
+            self._dirty = (start, end)
+        block.setUserState(self._state)
+        return self._state
+
+    def _relayout(self) -> None:
+        """Have the document layout lay out the reformatted blocks again."""
+        if self._dirty is None:
+            return
+        start, end = self._dirty
+        self._dirty = None
+        started = time.monotonic()
+        end = min(end, self._doc.characterCount())
+        self._applying = True
+        try:
+            self._doc.markContentsDirty(start, end - start)
+        finally:
+            self._applying = False
+        self._relayout_ms = (time.monotonic() - started) * 1000
+
+    def _schedule(self, block_number: int, force_until: int) -> None:
+        if self._resume_at is not None:
+            # Keep the pending pass's work: force through where it was
+            force_until = max(force_until, self._resume_at, self._force_until)
+            block_number = min(block_number, self._resume_at)
+        self._resume_at = block_number
+        self._force_until = force_until
+
+    def _run(self, deadline: float = float("inf"), max_blocks: int = -1) -> None:
+        """Continue the pending pass until it settles or runs out of budget,
+        then have the document layout lay out the blocks it reformatted."""
+        if self._resume_at is not None:
+            number = self._resume_at
+            block = self._doc.findBlockByNumber(number)
+            done = 0
+            while block.isValid():
+                if done == max_blocks or (done and time.monotonic() >= deadline):
+                    break
+                old_state = block.userState()
+                changed = self._highlight(block) != old_state
+                number += 1
+                done += 1
+                self._processed_until = max(self._processed_until, number)
+                block = block.next()
+                if not (changed or number < self._force_until):
+                    if number >= self._processed_until:
+                        continue
+                    block = QTextBlock()
+            self._resume_at = number if block.isValid() else None
+        self._relayout()
+
+        if self._resume_at is not None:
+            self._timer.start(0)
+        else:
+            self._timer.stop()
+        self.progressChanged.emit(self._get_progress())
+        if self._resume_at is None:
+            self.finished.emit()
+
+    @Slot()
+    def _run_slice(self) -> None:
+        # Laying the blocks out takes about twice as long as highlighting
+        # them, and then the document layout moves every block after them.
+        # The budget covers all three, except that once the move takes more
+        # than half of it, it is shared by more blocks instead
+        walk_ms = (self._doc.blockCount() - self._resume_at) * self._walk_ms_per_block
+        started = time.monotonic()
+        self._relayout_ms = 0.0
+        self._run(deadline=started + max(self._budget_ms - walk_ms, walk_ms) / 3000)
+        highlight_ms = (time.monotonic() - started) * 1000 - self._relayout_ms
+        walk_ms = self._relayout_ms - 2 * highlight_ms
+        if self._resume_at is not None and walk_ms > 0:
+            after = self._doc.blockCount() - self._resume_at
+            self._walk_ms_per_block = walk_ms / after
+
+    def _on_contents_change(self, position: int, removed: int, added: int) -> None:
+        if self._applying:
+            return
+        first = self._doc.findBlock(position).blockNumber()
+        if first < 0:
+            return
+        last_block = self._doc.findBlock(position + added)
+        if not last_block.isValid():  # The change runs to the end
+            last_block = self._doc.lastBlock()
+        last = last_block.blockNumber()
+
+        # Blocks after the edit were renumbered
+        delta = self._doc.blockCount() - self._block_count
+        self._block_count = self._doc.blockCount()
+        if self._processed_until > first:
+            self._processed_until = max(first, self._processed_until + delta)
+        if self._resume_at is not None and self._resume_at > first:
+            self._resume_at = max(first, self._resume_at + delta)
+            self._force_until = max(first, self._force_until + delta)
+
+        if first >= self._processed_until:
+            return  # Not reached yet; the pending pass will get there
+        self._schedule(first, last + 1)
+        self._run(max_blocks=self.INITIAL_BLOCKS)
+
+    @Slot(int, int)
+    def highlightRange(self, first_position: int, last_position: int) -> None:
+        """Highlight the blocks between two positions now, e.g. on scroll.
+
+        Blocks the pending pass hasn't reached are highlighted from
+        whatever state precedes them, and again in order when it does.
+        Nothing is done once the pass has finished.
+        """
+        if self._resume_at is None:
+            return
+        block = self._doc.findBlock(first_position)
+        if block.blockNumber() < self._resume_at:
+            block = self._doc.findBlockByNumber(self._resume_at)
+        while block.isValid() and block.position() <= last_position:
+            self._highlight(block)
+            block = block.next()
+        self._relayout()
+
+    # --- Properties ---
+
+    def _get_progress(self) -> float:
+        if self._resume_at is None:
+            return 1.0
+        return min(1.0, self._resume_at / max(1, self._doc.blockCount()))
+
+    progress = Property(float, _get_progress, notify=progressChanged)
+
+    def _get_budget_ms(self) -> int:
+        return self._budget_ms
+
+    def _set_budget_ms(self, budget_ms: int) -> None:
+        if budget_ms != self._budget_ms:
+            self._budget_ms = max(1, budget_ms)
+            self.budgetMsChanged.emit()
+
+    budgetMs = Property(int, _get_budget_ms, _set_budget_ms, notify=budgetMsChanged)
+
+
+class HighlighterRegistry(QObject):
+    """One highlighter per QTextDocument, dropped when the document goes.
+
+    Documents are keyed by their C++ address, which stays the same for
+    the document's lifetime whatever Python wrapper refers to it.
+    Highlighters are children of their document, so Qt deletes them with
+    it; the registry only forgets them.
+    """
+
+    countChanged = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._highlighters: dict[int, IncrementalMarkdownHighlighter] = {}
+
+    @staticmethod
+    def _key(document: QTextDocument) -> int:
+        return shiboken6.getCppPointer(document)[0]
+
+    def attach(self, document: QTextDocument) -> IncrementalMarkdownHighlighter:
+        """Return the document's highlighter, creating it on first use."""
+        key = self._key(document)
+        highlighter = self._highlighters.get(key)
+        if highlighter is None:
+            highlighter = IncrementalMarkdownHighlighter(document)
+            self._highlighters[key] = highlighter
+            document.destroyed.connect(lambda _=None, key=key: self._release(key))
+            self.countChanged.emit()
+        return highlighter
+
+    def get(self, document: QTextDocument):
+        return self._highlighters.get(self._key(document))
+
+    def _release(self, key: int) -> None:
+        # Documents can outlive the registry
+        if not shiboken6.isValid(self):
+            return
+        if self._highlighters.pop(key, None) is not None:
+            self.countChanged.emit()
+
+    def _get_count(self) -> int:
+        return len(self._highlighters)
+
+    count = Property(int, _get_count, notify=countChanged)
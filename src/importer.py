@@ -0,0 +1,183 @@
+"""One-time import of the legacy JSON task files into SQLite."""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from sqlalchemy import delete, update
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from .database import Database, ProjectTaskRecord, TaskRecord
+
+BATCH_SIZE = 1000
+
+TASK_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "completed",
+    "created_at",
+    "pomodoros_completed",
+)
+PROJECT_TASK_FIELDS = ("id", "project_id", "title", "completed", "created_at")
+
+
+def iter_json_array(path: Path, chunk_size: int = 1 << 16) -> Iterator[Any]:
+    """Yield the items of a top-level JSON array without loading it whole."""
+    decoder = json.JSONDecoder()
+    with open(path, "r") as f:
+        buffer = ""
+        pos = 0
+        eof = False
+        opened = False
+        while True:
+            # Skip whitespace and the separators between items
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                pos += 1
+            if pos == len(buffer):
+                if eof:
+                    raise ValueError(f"{path}: unterminated JSON array")
+                buffer, pos = f.read(chunk_size), 0
+                eof = not buffer
+                continue
+            if not opened:
+                if buffer[pos] != "[":
+                    raise ValueError(f"{path}: expected a JSON array")
+                opened = True
+                pos += 1
+                continue
+            if buffer[pos] == "]":
+                return
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Most likely an item split across chunks
+                if eof:
+                    raise
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buffer, pos = buffer[pos:] + chunk, 0
+                continue
+            yield item
+            pos = end
+
+
+def _parse_timestamp(value: Any) -> datetime:
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return datetime.now()
+
+
+def _row(data: dict[str, Any], fields: tuple[str, ...]) -> dict[str, Any]:
+    row = {key: data[key] for key in fields if key in data}
+    if "created_at" in fields:
+        row["created_at"] = _parse_timestamp(data.get("created_at"))
+    if "completed" in row:
+        row["completed"] = bool(row["completed"])
+    return row
+
+
+def _insert_batches(
+    session: Session, model, records: Iterable[Any], fields: tuple[str, ...]
+) -> int:
+    count = 0
+    batch: list[dict[str, Any]] = []
+    statement = insert(model).on_conflict_do_nothing(index_elements=["id"])
+    for record in records:
+        if not isinstance(record, dict) or not record.get("id"):
+            continue
+        batch.append(_row(record, fields))
+        if len(batch) >= BATCH_SIZE:
+            session.execute(statement, batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        session.execute(statement, batch)
+        count += len(batch)
+    return count
+
+
+def _replay_task_log(session: Session, log_file: Path) -> None:
+    """Apply the append-only task journal written next to tasks.json."""
+    with open(log_file, "r") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # A torn final line from a crash mid-append
+                break
+            op = entry.get("op")
+            if op == "add":
+                _insert_batches(session, TaskRecord, [entry["record"]], TASK_FIELDS)
+            elif op == "set":
+                fields = _row(entry["fields"], TASK_FIELDS[1:])
+                if "created_at" not in entry["fields"]:
+                    fields.pop("created_at", None)
+                if fields:
+                    session.execute(
+                        update(TaskRecord)
+                        .where(TaskRecord.id == entry["id"])
+                        .values(**fields)
+                    )
+            elif op == "delete":
+                session.execute(delete(TaskRecord).where(TaskRecord.id == entry["id"]))
+
+
+def _retire(*files: Path) -> None:
+    # Keep the originals around as a backup rather than deleting them
+    for path in files:
+        if path.exists():
+            path.rename(path.with_name(path.name + ".imported"))
+
+
+def import_tasks(db: Database, snapshot_file: Path) -> int:
+    """Import ``tasks.json`` and its journal, then set them aside.
+
+    Safe to re-run: rows that already exist are skipped and journal entries
+    are idempotent. Returns the number of snapshot rows read.
+    """
+    log_file = snapshot_file.with_suffix(".log")
+    if not snapshot_file.exists() and not log_file.exists():
+        return 0
+    session = db.get_session()
+    try:
+        count = 0
+        if snapshot_file.exists():
+            count = _insert_batches(
+                session, TaskRecord, iter_json_array(snapshot_file), TASK_FIELDS
+            )
+        if log_file.exists():
+            _replay_task_log(session, log_file)
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+    _retire(snapshot_file, log_file)
+    return count
+
+
+def import_project_tasks(db: Database, data_file: Path) -> int:
+    """Import ``project_tasks.json``, then set it aside."""
+    if not data_file.exists():
+        return 0
+    session = db.get_session()
+    try:
+        count = _insert_batches(
+            session,
+            ProjectTaskRecord,
+            iter_json_array(data_file),
+            PROJECT_TASK_FIELDS,
+        )
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+    _retire(data_file)
+    return count
@@ -1,29 +1,30 @@
+import hashlib
 import markdown
 import re
+import sys
+from collections import OrderedDict
 from PySide6.QtCore import QObject, Slot
 
-class MarkdownRenderer(QObject):
-    def __init__(self):
-        super().__init__()
-        # Use common extensions for better Markdown support
-        self._md = markdown.Markdown(extensions=['tables', 'fenced_code', 'nl2br', 'sane_lists'])
-
-    @Slot(str, result=str)
-    def render(self, text):
-        if not text:
-            return ""
-
-        # Pre-process task lists (checkboxes) into HTML spans with custom styling colors
-        text = re.sub(r'(?m)^\s*[-*+]\s+\[ \]\s+(.*)$', r'<span style="color: #9CA3AF;">☐ \1</span><br/>', text)
-        text = re.sub(r'(?m)^\s*[-*+]\s+\[[xX]\]\s+(.*)$', r'<span style="color: #10B981; font-weight: bold;">☑ \1</span><br/>', text)
+# Pre-processing of task lists (checkboxes) and strikethroughs into HTML
+# with custom styling colors
+TASK_PATTERN = re.compile(r'(?m)^\s*[-*+]\s+\[([ xX])\]\s+(.*)$')
+STRIKE_PATTERN = re.compile(r'~~([^~]+)~~')
 
-        # Pre-process strikethroughs
-        text = re.sub(r'~~([^~]+)~~', r'<del style="color: #6B7280;">\1</del>', text)
+# Blank lines that may end a top-level block. Not before indented content,
+# list items, blockquotes or raw HTML, which can all continue what precedes
+# them, so such blocks are converted together with it
+BLOCK_BOUNDARY = re.compile(
+    r'\n[ \t]*\n(?:[ \t]*\n)*(?=[^\s>])(?!<|(?:[-*+]|\d+[.)])(?:\s|$))'
+)
+FENCE_PATTERN = re.compile(r'(?m)^(`{3,}|~{3,})(.*)$')
+# Reference definitions and raw HTML blocks can reach across blank lines
+# to any other block; documents with them are converted whole
+WHOLE_DOCUMENT_PATTERN = re.compile(
+    r'(?m)^ {0,3}(?:\[[^\]\n]+\]:|<(?!span style=|del style=))'
+)
 
-        html = self._md.convert(text)
-        
-        # Add basic CSS tailored to the application's dark theme for QML RichText
-        css = """
+# Basic CSS tailored to the application's dark theme for QML RichText
+CSS = """
         <style>
             body { font-family: 'Inter', sans-serif; font-size: 15px; }
             h1, h2, h3, h4, h5 { color: #A78BFA; font-weight: bold; margin-bottom: 8px; }
@@ -37,5 +38,132 @@ class MarkdownRenderer(QObject):
             hr { border: 0; background-color: #374151; height: 1px; margin: 15px 0; }
         </style>
         """
-        
-        return css + "<body>" + html + "</body>"
+
+
+def _task_html(match):
+    if match.group(1) == ' ':
+        return '<span style="color: #9CA3AF;">☐ %s</span><br/>' % match.group(2)
+    return '<span style="color: #10B981; font-weight: bold;">☑ %s</span><br/>' % match.group(2)
+
+
+def _preprocess(text):
+    # Each pass scans the whole text, so skip those that can't match
+    if '[' in text:
+        text = TASK_PATTERN.sub(_task_html, text)
+    if '~~' in text:
+        text = STRIKE_PATTERN.sub(r'<del style="color: #6B7280;">\1</del>', text)
+    return text
+
+
+def _fenced_ranges(text):
+    """(start, end) of each fenced code region; an unclosed one runs on."""
+    ranges = []
+    if '```' not in text and '~~~' not in text:
+        return ranges
+    fence = None
+    for match in FENCE_PATTERN.finditer(text):
+        if fence is None:
+            fence, start = match.group(1), match.start()
+        elif match.group(1) == fence and not match.group(2).strip(' '):
+            ranges.append((start, match.end()))
+            fence = None
+    if fence is not None:
+        ranges.append((start, len(text)))
+    return ranges
+
+
+def split_blocks(text):
+    """Split pre-processed markdown into blocks that convert independently.
+
+    Joining the conversions of the blocks with newlines gives the
+    conversion of the whole text. Blocks are only split at blank lines
+    outside fenced code, before a line that starts a new top-level block.
+    A line that merely looks like a fence keeps blocks together until a
+    matching fence, which errs towards bigger blocks, never wrong ones.
+    """
+    fenced = _fenced_ranges(text)
+    blocks = []
+    begin = 0
+    i = 0
+    for boundary in BLOCK_BOUNDARY.finditer(text):
+        start = boundary.start()
+        while i < len(fenced) and fenced[i][1] <= start:
+            i += 1
+        if i < len(fenced) and fenced[i][0] < start:
+            continue
+        blocks.append(text[begin:start])
+        begin = boundary.end()
+    blocks.append(text[begin:])
+    return blocks
+
+
+class MarkdownRenderer(QObject):
+    """Renders markdown to the RichText HTML shown by the preview.
+
+    QML calls ``render`` on every binding evaluation, including when only
+    the edit/preview toggle changed. Results are kept in an LRU cache keyed
+    by a hash of the text and bounded by ``CACHE_MAX_BYTES``. On a miss,
+    the text is split into top-level blocks and only blocks that weren't in
+    the previous render are converted, so an edit re-converts the block it
+    touched rather than the whole document.
+    """
+
+    CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+    def __init__(self):
+        super().__init__()
+        # Use common extensions for better Markdown support
+        self._md = markdown.Markdown(extensions=['tables', 'fenced_code', 'nl2br', 'sane_lists'])
+        self._cache = OrderedDict()
+        self._cache_bytes = 0
+        # Block source -> HTML, for the blocks of the last render
+        self._blocks = {}
+
+    @Slot(str, result=str)
+    def render(self, text):
+        if not text:
+            return ""
+
+        key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        result = CSS + "<body>" + self._convert(_preprocess(text)) + "</body>"
+        self._store(key, result)
+        return result
+
+    def _convert_block(self, text):
+        # Conversions must not see each other's state, e.g. references
+        self._md.reset()
+        return self._md.convert(text)
+
+    def _convert(self, text):
+        if WHOLE_DOCUMENT_PATTERN.search(text):
+            self._blocks = {}
+            return self._convert_block(text)
+
+        blocks = {}
+        html = []
+        for block in split_blocks(text):
+            converted = blocks.get(block)
+            if converted is None:
+                converted = self._blocks.get(block)
+                if converted is None:
+                    converted = self._convert_block(block)
+                blocks[block] = converted
+            if converted:
+                html.append(converted)
+        self._blocks = blocks
+        return "\n".join(html)
+
+    def _store(self, key, result):
+        size = sys.getsizeof(result)
+        if size > self.CACHE_MAX_BYTES:
+            return
+        self._cache[key] = result
+        self._cache_bytes += size
+        while self._cache_bytes > self.CACHE_MAX_BYTES:
+            _, evicted = self._cache.popitem(last=False)
+            self._cache_bytes -= sys.getsizeof(evicted)
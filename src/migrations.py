@@ -0,0 +1,235 @@
+"""Versioned schema migrations for the SQLite database.
+
+The schema version is stored in SQLite's ``user_version`` pragma. Each entry
+in ``MIGRATIONS`` upgrades the schema by one version and runs inside the
+same transaction as the version bump, so a failed migration leaves the
+database untouched. Migrations run with foreign keys off, as SQLite's table
+rebuild procedure requires, and are checked with ``foreign_key_check``
+before they commit.
+"""
+
+import re
+from typing import Callable
+
+from sqlalchemy.engine import Connection
+
+Migration = Callable[[Connection], None]
+
+
+def get_schema_version(conn: Connection) -> int:
+    return conn.exec_driver_sql("PRAGMA user_version").scalar() or 0
+
+
+def _set_schema_version(conn: Connection, version: int) -> None:
+    # PRAGMA does not accept bound parameters
+    conn.exec_driver_sql(f"PRAGMA user_version = {int(version)}")
+
+
+def column_names(conn: Connection, table: str) -> set[str]:
+    rows = conn.exec_driver_sql(f"PRAGMA table_info({table})").fetchall()
+    return {row[1] for row in rows}
+
+
+def add_column(conn: Connection, table: str, name: str, ddl: str) -> None:
+    """Add a column in place if it doesn't exist yet.
+
+    ``ddl`` is the column definition without the name, for example
+    ``"TEXT NOT NULL DEFAULT ''"``. Existing rows get the default value.
+    """
+    if name not in column_names(conn, table):
+        conn.exec_driver_sql(f"ALTER TABLE {table} ADD COLUMN {name} {ddl}")
+
+
+def rebuild_table(conn: Connection, table: str, create_sql: str, columns: list[str]) -> None:
+    """Recreate ``table`` from ``create_sql`` and copy ``columns`` across.
+
+    Used for changes SQLite can't do with ALTER TABLE, such as changing a
+    column's type or constraints. ``create_sql`` must create a table named
+    ``{table}_new``. This follows SQLite's table rebuild procedure, so it
+    needs foreign keys off, which ``Database`` arranges around migrations;
+    with them on, dropping the old table would cascade into the tables
+    that reference it. The table's indexes and triggers are recreated from
+    their stored SQL, so any that refer to a dropped or renamed column
+    must be dropped first. External-content FTS indexes over the table are
+    rebuilt, since the copied rows get new rowids.
+    """
+    if conn.exec_driver_sql("PRAGMA foreign_keys").scalar():
+        raise RuntimeError(f"Rebuilding {table} needs foreign keys off")
+    dependents = (
+        conn.exec_driver_sql(
+            "SELECT sql FROM sqlite_master WHERE tbl_name = ? "
+            "AND type IN ('index', 'trigger') AND sql IS NOT NULL",
+            (table,),
+        )
+        .scalars()
+        .all()
+    )
+    fts_tables = (
+        conn.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type = 'table' "
+            "AND sql LIKE 'CREATE VIRTUAL TABLE%fts5%' AND sql LIKE ?",
+            (f"%content='{table}'%",),
+        )
+        .scalars()
+        .all()
+    )
+
+    column_list = ", ".join(columns)
+    conn.exec_driver_sql(create_sql)
+    conn.exec_driver_sql(
+        f"INSERT INTO {table}_new ({column_list}) SELECT {column_list} FROM {table}"
+    )
+    conn.exec_driver_sql(f"DROP TABLE {table}")
+    conn.exec_driver_sql(f"ALTER TABLE {table}_new RENAME TO {table}")
+    for sql in dependents:
+        conn.exec_driver_sql(sql)
+    for name in fts_tables:
+        conn.exec_driver_sql(f"INSERT INTO {name}({name}) VALUES ('rebuild')")
+
+
+def _add_project_indexes(conn: Connection) -> None:
+    conn.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS ix_projects_updated_at "
+        "ON projects (updated_at DESC)"
+    )
+    conn.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS ix_projects_status_updated_at "
+        "ON projects (status, updated_at DESC)"
+    )
+
+
+def _add_project_search(conn: Connection) -> None:
+    # External-content FTS5 index over the projects table; the triggers keep
+    # it in sync so the markdown is stored only once. It is keyed on the
+    # implicit rowid, which VACUUM may renumber, so run 'rebuild' after one.
+    conn.exec_driver_sql(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS projects_fts USING fts5("
+        "title, headline, client_name, tags, details_markdown, tasks_markdown, "
+        "content='projects', content_rowid='rowid')"
+    )
+    columns = "title, headline, client_name, tags, details_markdown, tasks_markdown"
+    new_values = (
+        "new.title, new.headline, new.client_name, new.tags, "
+        "new.details_markdown, new.tasks_markdown"
+    )
+    old_values = (
+        "old.title, old.headline, old.client_name, old.tags, "
+        "old.details_markdown, old.tasks_markdown"
+    )
+    conn.exec_driver_sql(
+        "CREATE TRIGGER IF NOT EXISTS projects_fts_ai AFTER INSERT ON projects BEGIN "
+        f"INSERT INTO projects_fts(rowid, {columns}) VALUES (new.rowid, {new_values}); "
+        "END"
+    )
+    conn.exec_driver_sql(
+        "CREATE TRIGGER IF NOT EXISTS projects_fts_ad AFTER DELETE ON projects BEGIN "
+        f"INSERT INTO projects_fts(projects_fts, rowid, {columns}) "
+        f"VALUES ('delete', old.rowid, {old_values}); "
+        "END"
+    )
+    conn.exec_driver_sql(
+        "CREATE TRIGGER IF NOT EXISTS projects_fts_au "
+        f"AFTER UPDATE OF {columns} ON projects BEGIN "
+        f"INSERT INTO projects_fts(projects_fts, rowid, {columns}) "
+        f"VALUES ('delete', old.rowid, {old_values}); "
+        f"INSERT INTO projects_fts(rowid, {columns}) VALUES (new.rowid, {new_values}); "
+        "END"
+    )
+    conn.exec_driver_sql("INSERT INTO projects_fts(projects_fts) VALUES ('rebuild')")
+
+
+def _add_id_to_project_indexes(conn: Connection) -> None:
+    # Keyset paging orders by (updated_at, id); with id in the index the
+    # tie-break doesn't need a temporary sort
+    conn.exec_driver_sql("DROP INDEX IF EXISTS ix_projects_updated_at")
+    conn.exec_driver_sql("DROP INDEX IF EXISTS ix_projects_status_updated_at")
+    conn.exec_driver_sql(
+        "CREATE INDEX ix_projects_updated_at ON projects (updated_at DESC, id DESC)"
+    )
+    conn.exec_driver_sql(
+        "CREATE INDEX ix_projects_status_updated_at "
+        "ON projects (status, updated_at DESC, id DESC)"
+    )
+
+
+def _add_tag_index(conn: Connection) -> None:
+    conn.exec_driver_sql(
+        "CREATE TABLE IF NOT EXISTS project_tags ("
+        "project_id VARCHAR NOT NULL REFERENCES projects (id) ON DELETE CASCADE, "
+        "tag VARCHAR(255) NOT NULL, "
+        "PRIMARY KEY (project_id, tag))"
+    )
+    conn.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS ix_project_tags_tag ON project_tags (tag, project_id)"
+    )
+    conn.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS ix_projects_client_name "
+        "ON projects (client_name, updated_at DESC, id DESC)"
+    )
+    # Backfill from the JSON column, trimmed the same way as normalize_tags
+    conn.exec_driver_sql(
+        "INSERT OR IGNORE INTO project_tags (project_id, tag) "
+        "SELECT p.id, trim(t.value) FROM projects p, json_each(p.tags) t "
+        "WHERE json_valid(p.tags) AND trim(t.value) != ''"
+    )
+
+
+def _add_id_to_task_index(conn: Connection) -> None:
+    # The tasks model pages by (created_at, id), like the projects list
+    conn.exec_driver_sql("DROP INDEX IF EXISTS ix_tasks_created_at")
+    conn.exec_driver_sql(
+        "CREATE INDEX ix_tasks_created_at ON tasks (created_at DESC, id DESC)"
+    )
+
+
+def _require_project_updated_at(conn: Connection) -> None:
+    # Keyset cursors are built from updated_at, so every project needs one
+    conn.exec_driver_sql(
+        "UPDATE projects SET updated_at = "
+        "coalesce(created_at, datetime('now', 'localtime')) WHERE updated_at IS NULL"
+    )
+    rows = conn.exec_driver_sql("PRAGMA table_info(projects)").fetchall()
+    if any(row[1] == "updated_at" and row[3] for row in rows):
+        return
+    create_sql = conn.exec_driver_sql(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'projects'"
+    ).scalar()
+    create_sql, found = re.subn(
+        r"\bupdated_at DATETIME\b", "updated_at DATETIME NOT NULL", create_sql, count=1
+    )
+    if not found:
+        raise RuntimeError("projects.updated_at is not a DATETIME column")
+    # A table that was renamed before is stored as CREATE TABLE "projects"
+    create_sql = re.sub(
+        r'^CREATE TABLE "?projects"?', "CREATE TABLE projects_new", create_sql
+    )
+    rebuild_table(conn, "projects", create_sql, sorted(column_names(conn, "projects")))
+
+
+MIGRATIONS: list[Migration] = [
+    _add_project_indexes,
+    _add_project_search,
+    _add_id_to_project_indexes,
+    _add_tag_index,
+    _add_id_to_task_index,
+    _require_project_updated_at,
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def migrate(conn: Connection) -> int:
+    """Apply all pending migrations and return the resulting version.
+
+    Expects foreign keys to be off and a transaction to be open. Raises if
+    the migrated data violates a foreign key, so the caller rolls back.
+    """
+    version = get_schema_version(conn)
+    for target, migration in enumerate(MIGRATIONS[version:], start=version + 1):
+        migration(conn)
+        _set_schema_version(conn, target)
+    if version < len(MIGRATIONS):
+        violations = conn.exec_driver_sql("PRAGMA foreign_key_check").fetchall()
+        if violations:
+            raise RuntimeError(f"Migration broke foreign keys: {violations[:5]}")
+    return max(version, len(MIGRATIONS))
@@ -0,0 +1,139 @@
+"""Non-blocking desktop notifications."""
+
+import itertools
+import shutil
+import time
+from collections import deque
+from typing import Optional
+
+from PySide6.QtCore import QObject, QProcess, QTimer, Signal
+
+try:
+    from PySide6.QtDBus import (
+        QDBusConnection,
+        QDBusMessage,
+        QDBusPendingCallWatcher,
+    )
+except ImportError:  # QtDBus is not shipped on every platform
+    QDBusConnection = None  # type: ignore
+
+PORTAL_SERVICE = "org.freedesktop.portal.Desktop"
+PORTAL_PATH = "/org/freedesktop/portal/desktop"
+PORTAL_INTERFACE = "org.freedesktop.portal.Notification"
+
+
+class NotificationDispatcher(QObject):
+    """Queues desktop notifications and sends them without blocking.
+
+    Notifications go through the XDG desktop portal over the session bus,
+    which is connected on the first send. The call is asynchronous and
+    nothing waits for the reply, so a portal that D-Bus still has to
+    activate works too. If the bus is missing or the portal call fails,
+    the dispatcher switches to a detached ``notify-send`` for the rest of
+    the session. Sends are at least ``MIN_INTERVAL_MS`` apart. At most
+    ``MAX_QUEUED`` notifications wait their turn; older ones are dropped
+    first, and a notification identical to one already queued is not
+    queued twice.
+
+    ``bus``, ``service`` and ``notify_send`` replace the session bus, the
+    portal's service name and the ``notify-send`` found on PATH, e.g. to
+    run against a stand-in daemon.
+    """
+
+    MIN_INTERVAL_MS = 1500
+    MAX_QUEUED = 5
+
+    sent = Signal(str, str)  # title, body
+    failed = Signal(str)
+
+    def __init__(
+        self,
+        app_name: str = "PomCraft",
+        parent: Optional[QObject] = None,
+        *,
+        bus=None,
+        service: str = PORTAL_SERVICE,
+        notify_send: Optional[str] = None,
+    ) -> None:
+        super().__init__(parent)
+        self._app_name = app_name
+        self._queue: deque[tuple[str, str]] = deque(maxlen=self.MAX_QUEUED)
+        self._last_sent = float("-inf")
+        self._ids = itertools.count(1)
+        # In-flight portal calls, kept alive until they answer
+        self._watchers: set = set()
+
+        self._bus = bus
+        self._service = service
+        # Cleared once the bus or portal turns out not to work
+        self._use_portal = QDBusConnection is not None
+        self._notify_send = notify_send or shutil.which("notify-send")
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._drain)
+
+    def notify(self, title: str, body: str) -> None:
+        """Queue a notification; returns immediately."""
+        if (title, body) not in self._queue:
+            self._queue.append((title, body))
+        if not self._timer.isActive():
+            self._drain()
+
+    def _drain(self) -> None:
+        if not self._queue:
+            return
+        wait_ms = self._last_sent + self.MIN_INTERVAL_MS - time.monotonic() * 1000
+        if wait_ms > 0:
+            self._timer.start(int(wait_ms) + 1)
+            return
+        title, body = self._queue.popleft()
+        self._last_sent = time.monotonic() * 1000
+        self._send(title, body)
+        if self._queue:
+            self._timer.start(self.MIN_INTERVAL_MS)
+
+    def _send(self, title: str, body: str) -> None:
+        if self._use_portal and self._bus is None:
+            self._bus = QDBusConnection.sessionBus()
+        if self._use_portal and not self._bus.isConnected():
+            self._use_portal = False
+        if self._use_portal:
+            self._send_portal(title, body)
+        else:
+            self._send_process(title, body)
+
+    def _send_portal(self, title: str, body: str) -> None:
+        message = QDBusMessage.createMethodCall(
+            self._service, PORTAL_PATH, PORTAL_INTERFACE, "AddNotification"
+        )
+        notification_id = f"{self._app_name.lower()}-{next(self._ids)}"
+        message.setArguments([notification_id, {"title": title, "body": body}])
+        watcher = QDBusPendingCallWatcher(self._bus.asyncCall(message), self)
+        self._watchers.add(watcher)
+        watcher.finished.connect(
+            lambda w, title=title, body=body: self._portal_replied(w, title, body)
+        )
+
+    def _portal_replied(self, watcher, title: str, body: str) -> None:
+        self._watchers.discard(watcher)
+        watcher.deleteLater()
+        if watcher.isError():
+            # Don't keep trying a portal that can't notify
+            self._use_portal = False
+            self._send_process(title, body)
+        else:
+            self.sent.emit(title, body)
+
+    def _send_process(self, title: str, body: str) -> None:
+        if not self._notify_send:
+            self.failed.emit("No notification service available")
+            return
+        # Detached: nothing waits for the process or reaps it here
+        started, _ = QProcess.startDetached(
+            self._notify_send, ["--app-name", self._app_name, title, body]
+        )
+        if started:
+            self.sent.emit(title, body)
+        else:
+            self.failed.emit("Could not start notify-send")
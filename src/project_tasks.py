@@ -1,96 +1,244 @@
 """Project-specific tasks management."""
 
-import json
-from dataclasses import asdict, dataclass
-from datetime import datetime
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Optional
 
-from PySide6.QtCore import QObject, Signal, Slot, Property
+from PySide6.QtCore import QObject, QTimer, Signal, Slot, Property
+from sqlalchemy import Integer, Select, func, insert, select
 
+from .database import Database, ProjectTaskRecord
+from .importer import import_project_tasks
+from .tasks import _usable_generated_tasks, _validate_batch
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
 class ProjectTask:
     id: str
     project_id: str
     title: str
     completed: bool
-    created_at: str
+    created_at: float  # epoch seconds, see tasks.Task
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {
+            "id": self.id,
+            "project_id": self.project_id,
+            "title": self.title,
+            "completed": self.completed,
+            "created_at": datetime.fromtimestamp(self.created_at).isoformat(),
+        }
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "ProjectTask":
-        return cls(**data)
+    def from_record(cls, record: Any) -> "ProjectTask":
+        return cls(
+            id=record.id,
+            project_id=record.project_id,
+            title=record.title,
+            completed=bool(record.completed),
+            created_at=record.created_at.timestamp(),
+        )
+
+
+PROJECT_TASK_COLUMNS = (
+    ProjectTaskRecord.id,
+    ProjectTaskRecord.project_id,
+    ProjectTaskRecord.title,
+    ProjectTaskRecord.completed,
+    ProjectTaskRecord.created_at,
+)
+
+
+def project_tasks_query(project_id: str) -> Select:
+    """A project's tasks, newest first."""
+    return (
+        select(*PROJECT_TASK_COLUMNS)
+        .where(ProjectTaskRecord.project_id == project_id)
+        .order_by(ProjectTaskRecord.created_at.desc())
+    )
+
+
+def project_task_counts_query(project_id: str) -> Select:
+    """Total and completed task counts for one project."""
+    return select(
+        func.count(),
+        func.coalesce(func.sum(ProjectTaskRecord.completed, type_=Integer), 0),
+    ).where(ProjectTaskRecord.project_id == project_id)
 
 
 class ProjectTasksBackend(QObject):
     """Manages project-specific tasks."""
 
     projectTasksChanged = Signal(str)  # project_id
+    errorOccurred = Signal(str)
 
     def __init__(self, parent: Optional[QObject] = None) -> None:
         super().__init__(parent)
-        self._tasks: list[ProjectTask] = []
+        self._db = Database.get_instance()
+        # (total, completed) per project, filled on first use and kept up
+        # to date by the write slots so count calls don't hit the database
+        self._counts: dict[str, list[int]] = {}
+        # Legacy storage, imported into the database on first launch
         self._data_file = Path.home() / ".pomcraft" / "project_tasks.json"
-        self._load_tasks()
-
-    def _load_tasks(self) -> None:
-        if self._data_file.exists():
+        try:
+            import_project_tasks(self._db, self._data_file)
+        except Exception as e:
+            # Leave the file in place; the import is retried next launch
+            logger.exception("Importing %s failed", self._data_file)
+            # Emitted once QML has had a chance to connect
+            message = f"Couldn't import {self._data_file.name}: {e}"
+            QTimer.singleShot(0, self, lambda: self.errorOccurred.emit(message))
+
+    def _project_counts(self, project_id: str) -> list[int]:
+        counts = self._counts.get(project_id)
+        if counts is None:
+            session = self._db.get_session()
             try:
-                with open(self._data_file, "r") as f:
-                    data = json.load(f)
-                    self._tasks = [ProjectTask.from_dict(t) for t in data]
-            except (json.JSONDecodeError, KeyError):
-                self._tasks = []
-
-    def _save_tasks(self) -> None:
-        self._data_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self._data_file, "w") as f:
-            json.dump([t.to_dict() for t in self._tasks], f, indent=2)
+                total, completed = session.execute(
+                    project_task_counts_query(project_id)
+                ).one()
+            finally:
+                session.close()
+            counts = self._counts[project_id] = [total, completed]
+        return counts
+
+    def _insert(self, project_id: str, rows: list[dict[str, Any]]) -> bool:
+        session = self._db.get_session()
+        try:
+            session.execute(insert(ProjectTaskRecord), rows)
+            session.commit()
+        except Exception:
+            session.rollback()
+            return False
+        finally:
+            session.close()
+        if project_id in self._counts:
+            self._counts[project_id][0] += len(rows)
+        return True
 
     @Slot(str, str)
     def addTask(self, project_id: str, title: str) -> None:
         task_id = f"{project_id}_{datetime.now().strftime('%Y%m%d%H%M%S%f')}"
-        task = ProjectTask(
-            id=task_id,
-            project_id=project_id,
-            title=title,
-            completed=False,
-            created_at=datetime.now().isoformat(),
-        )
-        self._tasks.insert(0, task)
-        self._save_tasks()
-        self.projectTasksChanged.emit(project_id)
+        row = {
+            "id": task_id,
+            "project_id": project_id,
+            "title": title,
+            "completed": False,
+            "created_at": datetime.now(),
+        }
+        if self._insert(project_id, [row]):
+            self.projectTasksChanged.emit(project_id)
+
+    @Slot(str, "QVariantList", result="QVariant")
+    def addTasks(self, project_id: str, tasks_data: list[dict[str, Any]]) -> dict[str, Any]:
+        """Insert a batch of tasks for one project in a single transaction.
+
+        Every item needs a non-empty string ``title``; if any is invalid
+        nothing is inserted. Returns ``ids`` (in input order), ``errors`` and
+        ``elapsed_ms``.
+        """
+        started = time.perf_counter()
+        errors = _validate_batch(tasks_data, ("title",))
+        if errors:
+            return {"ids": [], "errors": errors, "elapsed_ms": 0.0}
+
+        now = datetime.now()
+        base_id = f"{project_id}_{now.strftime('%Y%m%d%H%M%S%f')}"
+        # One microsecond apart so the last item sorts first
+        rows = [
+            {
+                "id": f"{base_id}-{i}",
+                "project_id": project_id,
+                "title": data["title"],
+                "completed": False,
+                "created_at": now + timedelta(microseconds=i),
+            }
+            for i, data in enumerate(tasks_data)
+        ]
+        if rows:
+            if not self._insert(project_id, rows):
+                return {"ids": [], "errors": ["Failed to save tasks"], "elapsed_ms": 0.0}
+            self.projectTasksChanged.emit(project_id)
+        return {
+            "ids": [row["id"] for row in rows],
+            "errors": [],
+            "elapsed_ms": (time.perf_counter() - started) * 1000,
+        }
+
+    @Slot(str, "QVariantList", result="QVariant")
+    def setTasksFromAI(self, project_id: str, tasks_data: list[Any]) -> dict[str, Any]:
+        """Insert generated tasks for one project, skipping the ones without
+        a title. Returns the :meth:`addTasks` result, with one error per
+        skipped item.
+        """
+        items, skipped = _usable_generated_tasks(tasks_data)
+        result = self.addTasks(project_id, items)
+        if skipped:
+            result["errors"] = skipped + result["errors"]
+            self.errorOccurred.emit(
+                f"Skipped {len(skipped)} generated task(s) without a title"
+            )
+        return result
 
     @Slot(str)
     def toggleTask(self, task_id: str) -> None:
-        for task in self._tasks:
-            if task.id == task_id:
-                task.completed = not task.completed
-                self._save_tasks()
-                self.projectTasksChanged.emit(task.project_id)
-                break
+        session = self._db.get_session()
+        try:
+            task = session.get(ProjectTaskRecord, task_id)
+            if task is None:
+                return
+            task.completed = not task.completed  # type: ignore
+            project_id, completed = task.project_id, bool(task.completed)
+            session.commit()
+        except Exception:
+            session.rollback()
+            return
+        finally:
+            session.close()
+        if project_id in self._counts:
+            self._counts[project_id][1] += 1 if completed else -1
+        self.projectTasksChanged.emit(project_id)
 
     @Slot(str)
     def deleteTask(self, task_id: str) -> None:
-        task = next((t for t in self._tasks if t.id == task_id), None)
-        if task:
-            project_id = task.project_id
-            self._tasks = [t for t in self._tasks if t.id != task_id]
-            self._save_tasks()
-            self.projectTasksChanged.emit(project_id)
+        session = self._db.get_session()
+        try:
+            task = session.get(ProjectTaskRecord, task_id)
+            if task is None:
+                return
+            project_id, completed = task.project_id, bool(task.completed)
+            session.delete(task)
+            session.commit()
+        except Exception:
+            session.rollback()
+            return
+        finally:
+            session.close()
+        counts = self._counts.get(project_id)
+        if counts is not None:
+            counts[0] -= 1
+            if completed:
+                counts[1] -= 1
+        self.projectTasksChanged.emit(project_id)
 
     @Slot(str, result="QVariantList")
     def getProjectTasks(self, project_id: str) -> list[dict[str, Any]]:
-        tasks = [t.to_dict() for t in self._tasks if t.project_id == project_id]
-        return tasks
+        session = self._db.get_session()
+        try:
+            rows = session.execute(project_tasks_query(project_id))
+            return [ProjectTask.from_record(row).to_dict() for row in rows]
+        finally:
+            session.close()
 
     @Slot(str, result=int)
     def getProjectTaskCount(self, project_id: str) -> int:
-        return sum(1 for t in self._tasks if t.project_id == project_id)
+        return self._project_counts(project_id)[0]
 
     @Slot(str, result=int)
     def getCompletedTaskCount(self, project_id: str) -> int:
-        return sum(1 for t in self._tasks if t.project_id == project_id and t.completed)
+        return self._project_counts(project_id)[1]
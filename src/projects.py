@@ -1,40 +1,147 @@
 """Projects management backend."""
 
 import uuid
+from collections import Counter
 from datetime import datetime
 from typing import Any, Optional
 
-from PySide6.QtCore import QObject, Signal, Slot, Property
+from PySide6.QtCore import QObject, QTimer, Signal, Slot, Property
+from sqlalchemy import func, text
 
-from .database import Database, Project
+from .database import (
+    Database,
+    Project,
+    ProjectTag,
+    filtered_query,
+    normalize_tags,
+    project_page,
+    projects_query,
+    set_project_tags,
+)
+from .projects_model import ProjectsListModel
+from .workers import DatabaseWorker
+
+
+MARKDOWN_FIELDS = {"details": "details_markdown", "tasks": "tasks_markdown"}
+
+# bm25 weights for title, headline, client_name, tags, details, tasks
+SEARCH_WEIGHTS = "10.0, 5.0, 5.0, 3.0, 1.0, 1.0"
+
+
+def _fts_query(query: str) -> str:
+    """Turn free text into an FTS5 query matching all terms.
+
+    Each term is quoted so FTS5 syntax characters in user input are taken
+    literally, and the last term matches as a prefix for search-as-you-type.
+    """
+    terms = ['"' + term.replace('"', '""') + '"' for term in query.split()]
+    if not terms:
+        return ""
+    terms[-1] += "*"
+    return " ".join(terms)
+
+
+def _filter_tags(filters: dict[str, Any]) -> list[str]:
+    """Tags from a QML filter map, given as ``tags`` (list) or ``tag``."""
+    tags = list(filters.get("tags") or [])
+    if filters.get("tag"):
+        tags.append(filters["tag"])
+    return normalize_tags(tags)
 
 
 class ProjectsBackend(QObject):
-    """Manages projects storage and operations."""
+    """Manages projects storage and operations.
+
+    Every operation is available as a synchronous slot and, for QML code that
+    must not block, as an ``...Async`` slot that returns a request id right
+    away. The async variant runs on a worker thread and reports back through
+    the matching result signal (or ``requestFailed``) with that id.
+    """
 
     projectsChanged = Signal()
     projectAdded = Signal(str)
     projectUpdated = Signal(str)
     projectDeleted = Signal(str)
     errorOccurred = Signal(str)
+    pendingWritesChanged = Signal()
+    countsChanged = Signal()
+
+    # Async results: (requestId, payload)
+    projectsLoaded = Signal(int, "QVariantList")
+    projectLoaded = Signal(int, "QVariant")
+    pageLoaded = Signal(int, "QVariant")
+    searchFinished = Signal(int, "QVariantList")
+    requestFinished = Signal(int, "QVariant")
+    requestFailed = Signal(int, str)
+
+    # Idle time after the last markdown edit before it is written to disk
+    FLUSH_DELAY_MS = 750
+
+    DEFAULT_PAGE_SIZE = 50
 
-    def __init__(self, parent: Optional[QObject] = None) -> None:
+    def __init__(
+        self,
+        worker: Optional[DatabaseWorker] = None,
+        parent: Optional[QObject] = None,
+    ) -> None:
         super().__init__(parent)
         self._db = Database.get_instance()
+        # Pass the worker shared by all backends; a worker of its own is
+        # sized so its read threads plus its write thread use exactly the
+        # database's worker connections
+        self._worker = worker or DatabaseWorker(
+            read_threads=self._db.worker_pool_size - 1, parent=self
+        )
 
-    @Slot(result="QVariantList")
-    def getProjects(self) -> list[dict[str, Any]]:
-        """Get all projects."""
+        # Write-behind buffer for markdown edits, keyed by (project_id, field).
+        # Only the latest content per key is kept, so a burst of keystrokes
+        # collapses into a single commit once the editor goes idle. Edits
+        # handed to the worker stay visible in _inflight_markdown until
+        # they have committed.
+        self._pending_markdown: dict[tuple[str, str], str] = {}
+        self._inflight_markdown: dict[tuple[str, str], str] = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_DELAY_MS)
+        self._flush_timer.timeout.connect(self.flush)
+
+        # status -> count, kept in step with create/update/delete so the
+        # dashboard counters never need to hit SQLite
+        self._status_counts: Counter[str] = Counter()
+        self.refreshCounts()
+
+        self._projects_model = ProjectsListModel(self._db, self._worker, self)
+        self._projects_model.errorOccurred.connect(self.errorOccurred)
+        self.projectAdded.connect(self._projects_model.onProjectAdded)
+        self.projectUpdated.connect(self._projects_model.onProjectUpdated)
+        self.projectDeleted.connect(self._projects_model.onProjectDeleted)
+
+    def _get_projects_model(self) -> ProjectsListModel:
+        return self._projects_model
+
+    projectsModel = Property(QObject, _get_projects_model, constant=True)
+
+    @Slot()
+    def shutdown(self) -> None:
+        """Write buffered edits and wait for background work to finish."""
+        self.flush()
+        self._worker.shutdown()
+
+    # --- Data access ---
+    #
+    # These helpers open their own session and raise on failure, so they can
+    # run on either the GUI thread or a worker thread. Signals and cached
+    # state are only touched by the callers on the GUI thread.
+
+    def _query_projects(self, status: Optional[str] = None) -> list[dict[str, Any]]:
         session = self._db.get_session()
         try:
-            projects = session.query(Project).order_by(Project.updated_at.desc()).all()
-            return [p.to_dict() for p in projects]
+            projects = projects_query(session, status).all()
+            return [p.to_dict(include_markdown=False) for p in projects]
         finally:
             session.close()
 
-    @Slot(str, result="QVariant")
-    def getProject(self, project_id: str) -> dict[str, Any]:
-        """Get a single project by ID."""
+    def _query_project(self, project_id: str) -> dict[str, Any]:
         session = self._db.get_session()
         try:
             project = session.query(Project).filter(Project.id == project_id).first()
@@ -42,18 +149,59 @@ class ProjectsBackend(QObject):
         finally:
             session.close()
 
-    @Slot(str, str, str, str, str, str, "QVariantList")
-    def createProject(
+    def _project_exists(self, project_id: str) -> bool:
+        session = self._db.get_session()
+        try:
+            return (
+                session.query(Project.id).filter(Project.id == project_id).first()
+                is not None
+            )
+        finally:
+            session.close()
+
+    def _query_page(
+        self, cursor: str, page_size: int, filters: dict[str, Any]
+    ) -> dict[str, Any]:
+        status = filters.get("status") or None
+        tags = _filter_tags(filters)
+        client_name = filters.get("client_name") or None
+        match_all = bool(filters.get("match_all", True))
+        session = self._db.get_session()
+        try:
+            projects, next_cursor = project_page(
+                session,
+                after=cursor,
+                limit=page_size if page_size > 0 else self.DEFAULT_PAGE_SIZE,
+                status=status,
+                tags=tags,
+                client_name=client_name,
+                match_all=match_all,
+            )
+            # Tag and client filters aren't covered by the cached counts, so
+            # they are counted once, with the first page
+            total = -1
+            if (tags or client_name) and not cursor:
+                total = filtered_query(
+                    session, status, tags, client_name, match_all
+                ).count()
+            return {
+                "projects": [p.to_dict(include_markdown=False) for p in projects],
+                "nextCursor": next_cursor,
+                "totalCount": total,
+            }
+        finally:
+            session.close()
+
+    def _insert_project(
         self,
         title: str,
-        headline: str = "",
-        client_name: str = "",
-        start_date: str = "",
-        deadline: str = "",
-        status: str = "active",
-        tags: Optional[list[str]] = None,
-    ) -> str:
-        """Create a new project."""
+        headline: str,
+        client_name: str,
+        start_date: str,
+        deadline: str,
+        status: str,
+        tags: Optional[list[str]],
+    ) -> tuple[str, str]:
         session = self._db.get_session()
         try:
             project = Project(
@@ -64,24 +212,22 @@ class ProjectsBackend(QObject):
                 start_date=datetime.fromisoformat(start_date) if start_date else None,  # type: ignore
                 deadline=datetime.fromisoformat(deadline) if deadline else None,  # type: ignore
                 status=status,  # type: ignore
-                tags=tags or [],  # type: ignore
+                tags=normalize_tags(tags),  # type: ignore
                 details_markdown="",  # type: ignore
                 tasks_markdown="",  # type: ignore
             )
             session.add(project)
+            session.flush()
+            set_project_tags(session, project.id, project.tags)  # type: ignore
             session.commit()
-            self.projectsChanged.emit()
-            self.projectAdded.emit(project.id)  # type: ignore
-            return project.id  # type: ignore
-        except Exception as e:
+            return project.id, project.status  # type: ignore
+        except Exception:
             session.rollback()
-            self.errorOccurred.emit(str(e))
-            return ""
+            raise
         finally:
             session.close()
 
-    @Slot(str, str, str, str, str, str, str, "QVariantList")
-    def updateProject(
+    def _apply_update(
         self,
         project_id: str,
         title: str,
@@ -91,122 +237,588 @@ class ProjectsBackend(QObject):
         deadline: str,
         status: str,
         tags: list[str],
-    ) -> bool:
-        """Update an existing project's metadata."""
+    ) -> Optional[str]:
+        """Update metadata and return the previous status, or None if missing."""
         session = self._db.get_session()
         try:
             project = session.query(Project).filter(Project.id == project_id).first()
-            if project:
-                project.title = title  # type: ignore
-                project.headline = headline  # type: ignore
-                project.client_name = client_name  # type: ignore
-                project.start_date = (  # type: ignore
-                    datetime.fromisoformat(start_date) if start_date else None
-                )
-                project.deadline = (  # type: ignore
-                    datetime.fromisoformat(deadline) if deadline else None
-                )
-                project.status = status  # type: ignore
-                project.tags = tags or []  # type: ignore
-                session.commit()
-                self.projectsChanged.emit()
-                self.projectUpdated.emit(project_id)
-                return True
-            return False
-        except Exception as e:
+            if not project:
+                return None
+            old_status = project.status
+            project.title = title  # type: ignore
+            project.headline = headline  # type: ignore
+            project.client_name = client_name  # type: ignore
+            project.start_date = (  # type: ignore
+                datetime.fromisoformat(start_date) if start_date else None
+            )
+            project.deadline = (  # type: ignore
+                datetime.fromisoformat(deadline) if deadline else None
+            )
+            project.status = status  # type: ignore
+            new_tags = normalize_tags(tags)
+            if new_tags != (project.tags or []):
+                project.tags = new_tags  # type: ignore
+                set_project_tags(session, project_id, new_tags)
+            session.commit()
+            return old_status  # type: ignore
+        except Exception:
             session.rollback()
-            self.errorOccurred.emit(str(e))
-            return False
+            raise
         finally:
             session.close()
 
-    @Slot(str, str, str, result=bool)
-    def updateProjectMarkdown(self, project_id: str, field: str, content: str) -> bool:
-        """Update either details_markdown or tasks_markdown."""
+    def _remove_project(self, project_id: str) -> Optional[str]:
+        """Delete a project and return its status, or None if missing."""
         session = self._db.get_session()
         try:
             project = session.query(Project).filter(Project.id == project_id).first()
-            if project:
-                if field == "details":
-                    project.details_markdown = content  # type: ignore
-                elif field == "tasks":
-                    project.tasks_markdown = content  # type: ignore
-                session.commit()
-                # Don't emit projectsChanged for every keystroke to avoid UI lag,
-                # but emit specific update signal
-                self.projectUpdated.emit(project_id)
-                return True
-            return False
-        except Exception as e:
+            if not project:
+                return None
+            status = project.status
+            session.delete(project)
+            session.commit()
+            return status  # type: ignore
+        except Exception:
             session.rollback()
-            return False
+            raise
+        finally:
+            session.close()
+
+    def _write_markdown(self, pending: dict[tuple[str, str], str]) -> list[str]:
+        """Commit buffered markdown and return the ids of updated projects."""
+        session = self._db.get_session()
+        try:
+            project_ids = {project_id for project_id, _ in pending}
+            projects = {
+                p.id: p
+                for p in session.query(Project).filter(Project.id.in_(project_ids))
+            }
+            for (project_id, field), content in pending.items():
+                project = projects.get(project_id)
+                if project is not None:
+                    setattr(project, MARKDOWN_FIELDS[field], content)
+            session.commit()
+            return list(projects)
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def _query_facets(self, column, status: Optional[str]) -> list[dict[str, Any]]:
+        session = self._db.get_session()
+        try:
+            count = func.count().label("count")
+            query = session.query(column, count)
+            if column is ProjectTag.tag:
+                query = query.join(Project, Project.id == ProjectTag.project_id)
+            if status:
+                query = query.filter(Project.status == status)
+            if column is Project.client_name:
+                query = query.filter(Project.client_name != "")
+            rows = query.group_by(column).order_by(count.desc(), column).all()
+            return [{"name": name, "count": n} for name, n in rows]
+        finally:
+            session.close()
+
+    def _query_search(self, match: str, limit: int) -> list[dict[str, Any]]:
+        session = self._db.get_session()
+        try:
+            rows = session.execute(
+                text(
+                    "SELECT p.id, p.title, p.client_name, p.status, "
+                    "snippet(projects_fts, -1, '<b>', '</b>', '…', 12) AS snippet, "
+                    f"bm25(projects_fts, {SEARCH_WEIGHTS}) AS rank "
+                    "FROM projects_fts JOIN projects p ON p.rowid = projects_fts.rowid "
+                    "WHERE projects_fts MATCH :match "
+                    "ORDER BY rank LIMIT :limit"
+                ),
+                {"match": match, "limit": max(1, limit)},
+            ).all()
+            return [
+                {
+                    "id": row.id,
+                    "title": row.title,
+                    "client_name": row.client_name or "",
+                    "status": row.status,
+                    "snippet": row.snippet,
+                    "rank": row.rank,
+                }
+                for row in rows
+            ]
         finally:
             session.close()
 
+    # --- Completion handlers (GUI thread) ---
+
+    def _project_created(self, project_id: str, status: str) -> None:
+        self._adjust_count(status, 1)
+        self.countsChanged.emit()
+        self.projectsChanged.emit()
+        self.projectAdded.emit(project_id)
+
+    def _project_updated(self, project_id: str, old_status: str, status: str) -> None:
+        if old_status != status:
+            self._adjust_count(old_status, -1)
+            self._adjust_count(status, 1)
+            self.countsChanged.emit()
+        self.projectsChanged.emit()
+        self.projectUpdated.emit(project_id)
+
+    def _project_deleted(self, project_id: str, status: str) -> None:
+        self._adjust_count(status, -1)
+        self.countsChanged.emit()
+        self.projectsChanged.emit()
+        self.projectDeleted.emit(project_id)
+
+    def _with_pending_markdown(self, data: dict[str, Any]) -> dict[str, Any]:
+        if not data:
+            return data
+        for field, column in MARKDOWN_FIELDS.items():
+            key = (data["id"], field)
+            content = self._pending_markdown.get(key, self._inflight_markdown.get(key))
+            if content is not None:
+                data[column] = content
+        return data
+
+    def _with_total_hint(
+        self, page: dict[str, Any], filters: dict[str, Any]
+    ) -> dict[str, Any]:
+        if _filter_tags(filters) or filters.get("client_name"):
+            return page
+        status = filters.get("status")
+        page["totalCount"] = (
+            self.getProjectCountByStatus(status) if status else self.getProjectCount()
+        )
+        return page
+
+    def _request_failed(self, request_id: int, message: str) -> None:
+        self.errorOccurred.emit(message)
+        self.requestFailed.emit(request_id, message)
+
+    # --- Synchronous API ---
+
+    @Slot(result="QVariantList")
+    def getProjects(self) -> list[dict[str, Any]]:
+        """Get all projects, without their markdown content.
+
+        Use :meth:`getProject` to fetch a single project with its markdown.
+        """
+        return self._query_projects()
+
+    @Slot(str, result="QVariant")
+    def getProject(self, project_id: str) -> dict[str, Any]:
+        """Get a single project by ID, including its markdown content."""
+        return self._with_pending_markdown(self._query_project(project_id))
+
+    @Slot(str, str, str, str, str, str, "QVariantList")
+    def createProject(
+        self,
+        title: str,
+        headline: str = "",
+        client_name: str = "",
+        start_date: str = "",
+        deadline: str = "",
+        status: str = "active",
+        tags: Optional[list[str]] = None,
+    ) -> str:
+        """Create a new project."""
+        try:
+            project_id, status = self._insert_project(
+                title, headline, client_name, start_date, deadline, status, tags
+            )
+        except Exception as e:
+            self.errorOccurred.emit(str(e))
+            return ""
+        self._project_created(project_id, status)
+        return project_id
+
+    @Slot(str, str, str, str, str, str, str, "QVariantList")
+    def updateProject(
+        self,
+        project_id: str,
+        title: str,
+        headline: str,
+        client_name: str,
+        start_date: str,
+        deadline: str,
+        status: str,
+        tags: list[str],
+    ) -> bool:
+        """Update an existing project's metadata."""
+        try:
+            old_status = self._apply_update(
+                project_id, title, headline, client_name, start_date, deadline, status, tags
+            )
+        except Exception as e:
+            self.errorOccurred.emit(str(e))
+            return False
+        if old_status is None:
+            return False
+        self._project_updated(project_id, old_status, status)
+        return True
+
+    @Slot(str, str, str, result=bool)
+    def updateProjectMarkdown(self, project_id: str, field: str, content: str) -> bool:
+        """Queue an update of either details_markdown or tasks_markdown.
+
+        The write is buffered and committed in the background once the editor
+        has been idle for ``FLUSH_DELAY_MS``, or right away by :meth:`flush`.
+        Returns False for an unknown field or project. The project is looked
+        up only on the first edit of a field since the last flush.
+        """
+        if field not in MARKDOWN_FIELDS:
+            return False
+        key = (project_id, field)
+        is_new = key not in self._pending_markdown
+        if (
+            is_new
+            and key not in self._inflight_markdown
+            and not self._project_exists(project_id)
+        ):
+            return False
+        self._pending_markdown[key] = content
+        self._flush_timer.start()
+        if is_new:
+            self.pendingWritesChanged.emit()
+        return True
+
+    @Slot()
+    def flush(self) -> None:
+        """Queue all buffered markdown edits for writing in one transaction.
+
+        This doesn't wait for the commit. The write queue runs in submission
+        order, so the edits land after any earlier write and before any later
+        one. On failure they go back into the buffer for the next flush.
+        """
+        self._flush_timer.stop()
+        if not self._pending_markdown:
+            return
+        pending = self._pending_markdown
+        self._pending_markdown = {}
+        self._inflight_markdown.update(pending)
+        self._worker.submit(
+            lambda: self._write_markdown(pending),
+            lambda _, project_ids: self._markdown_written(pending, project_ids),
+            lambda _, message: self._markdown_failed(pending, message),
+            write=True,
+        )
+
+    def _markdown_written(
+        self, written: dict[tuple[str, str], str], project_ids: list[str]
+    ) -> None:
+        for key, content in written.items():
+            if self._inflight_markdown.get(key) is content:
+                del self._inflight_markdown[key]
+        self.pendingWritesChanged.emit()
+        # Don't emit projectsChanged for markdown edits to avoid UI lag,
+        # but emit specific update signal
+        for project_id in project_ids:
+            self.projectUpdated.emit(project_id)
+
+    def _markdown_failed(self, failed: dict[tuple[str, str], str], message: str) -> None:
+        for key, content in failed.items():
+            if self._inflight_markdown.get(key) is content:
+                del self._inflight_markdown[key]
+        self._requeue_markdown(failed)
+        self._flush_timer.start()
+        self.errorOccurred.emit(message)
+
+    def _requeue_markdown(self, failed: dict[tuple[str, str], str]) -> None:
+        # Keep the edits so the next flush can retry, unless newer content
+        # was queued in the meantime
+        for key, content in failed.items():
+            self._pending_markdown.setdefault(key, content)
+        self.pendingWritesChanged.emit()
+
+    def _get_pending_writes(self) -> int:
+        return len(self._pending_markdown.keys() | self._inflight_markdown.keys())
+
+    pendingWrites = Property(int, _get_pending_writes, notify=pendingWritesChanged)
+
     @Slot(str, result=bool)
     def deleteProject(self, project_id: str) -> bool:
         """Delete a project."""
-        session = self._db.get_session()
+        self._discard_pending(project_id)
         try:
-            project = session.query(Project).filter(Project.id == project_id).first()
-            if project:
-                session.delete(project)
-                session.commit()
-                self.projectsChanged.emit()
-                self.projectDeleted.emit(project_id)
-                return True
-            return False
+            status = self._remove_project(project_id)
         except Exception as e:
-            session.rollback()
             self.errorOccurred.emit(str(e))
             return False
+        if status is None:
+            return False
+        self._project_deleted(project_id, status)
+        return True
+
+    def _discard_pending(self, project_id: str) -> None:
+        dropped = [key for key in self._pending_markdown if key[0] == project_id]
+        for key in dropped:
+            del self._pending_markdown[key]
+        if dropped:
+            self.pendingWritesChanged.emit()
+
+    def _adjust_count(self, status: str, delta: int) -> None:
+        self._status_counts[status] += delta
+        if self._status_counts[status] <= 0:
+            del self._status_counts[status]
+
+    @Slot()
+    def refreshCounts(self) -> None:
+        """Re-validate the cached status counts against the database."""
+        session = self._db.get_session()
+        try:
+            rows = (
+                session.query(Project.status, func.count(Project.id))
+                .group_by(Project.status)
+                .all()
+            )
         finally:
             session.close()
+        counts = Counter({status: count for status, count in rows})
+        if counts != self._status_counts:
+            self._status_counts = counts
+            self.countsChanged.emit()
 
     @Slot(result=int)
     def getProjectCount(self) -> int:
         """Get total project count."""
-        session = self._db.get_session()
-        try:
-            return session.query(Project).count()
-        finally:
-            session.close()
+        return sum(self._status_counts.values())
 
     def _get_total_count(self) -> int:
         return self.getProjectCount()
 
-    totalCount = Property(int, _get_total_count, notify=projectsChanged)
+    totalCount = Property(int, _get_total_count, notify=countsChanged)
 
     @Slot(str, result=int)
     def getProjectCountByStatus(self, status: str) -> int:
         """Get project count by status."""
-        session = self._db.get_session()
-        try:
-            return session.query(Project).filter(Project.status == status).count()
-        finally:
-            session.close()
+        return self._status_counts.get(status, 0)
 
     def _get_active_count(self) -> int:
         return self.getProjectCountByStatus("active")
 
-    activeCount = Property(int, _get_active_count, notify=projectsChanged)
+    activeCount = Property(int, _get_active_count, notify=countsChanged)
 
     def _get_completed_count(self) -> int:
         return self.getProjectCountByStatus("completed")
 
-    completedCount = Property(int, _get_completed_count, notify=projectsChanged)
+    completedCount = Property(int, _get_completed_count, notify=countsChanged)
+
+    @Slot(str, int, result="QVariantList")
+    def search(self, query: str, limit: int = 20) -> list[dict[str, Any]]:
+        """Full-text search over project metadata and markdown, best first.
+
+        Only committed text is searched; :meth:`searchAsync` also covers
+        edits still in the buffer.
+        """
+        match = _fts_query(query)
+        if not match:
+            return []
+        try:
+            return self._query_search(match, limit)
+        except Exception as e:
+            self.errorOccurred.emit(str(e))
+            return []
 
     @Slot(result="QVariantList")
     def getActiveProjects(self) -> list[dict[str, Any]]:
-        """Get all active projects."""
+        """Get all active projects, without their markdown content."""
+        return self._query_projects("active")
+
+    @Slot(str, result="QVariantList")
+    def getTagFacets(self, status: str = "") -> list[dict[str, Any]]:
+        """Tags with their project counts, most used first.
+
+        Pass a status to count only projects with that status.
+        """
+        try:
+            return self._query_facets(ProjectTag.tag, status or None)
+        except Exception as e:
+            self.errorOccurred.emit(str(e))
+            return []
+
+    @Slot(str, result="QVariantList")
+    def getClientFacets(self, status: str = "") -> list[dict[str, Any]]:
+        """Client names with their project counts, most used first."""
+        try:
+            return self._query_facets(Project.client_name, status or None)
+        except Exception as e:
+            self.errorOccurred.emit(str(e))
+            return []
+
+    @Slot("QVariantList", bool, result="QVariantList")
+    def getProjectsByTags(
+        self, tags: list[str], match_all: bool = True
+    ) -> list[dict[str, Any]]:
+        """Projects carrying all (or, without ``match_all``, any) of ``tags``."""
+        return self._query_filtered(tags=tags, match_all=match_all)
+
+    @Slot(str, result="QVariantList")
+    def getProjectsByClient(self, client_name: str) -> list[dict[str, Any]]:
+        """Projects for one client, newest first."""
+        return self._query_filtered(client_name=client_name)
+
+    def _query_filtered(self, **filters: Any) -> list[dict[str, Any]]:
         session = self._db.get_session()
         try:
             projects = (
-                session.query(Project)
-                .filter(Project.status == "active")
-                .order_by(Project.updated_at.desc())
+                filtered_query(session, **filters)
+                .order_by(Project.updated_at.desc(), Project.id.desc())
                 .all()
             )
-            return [p.to_dict() for p in projects]
+            return [p.to_dict(include_markdown=False) for p in projects]
+        except Exception as e:
+            self.errorOccurred.emit(str(e))
+            return []
         finally:
             session.close()
+
+    @Slot(str, int, "QVariantMap", result="QVariant")
+    def getProjectsPage(
+        self, cursor: str, page_size: int, filters: Optional[dict[str, Any]] = None
+    ) -> dict[str, Any]:
+        """Get one page of projects, newest first, without markdown.
+
+        ``filters`` may hold ``status``, ``tags`` (or a single ``tag``),
+        ``match_all`` and ``client_name``. Pass an empty cursor for the first
+        page and the returned ``nextCursor`` for the following ones; it is
+        empty after the last page. ``totalCount`` is a hint for scroll bars:
+        exact for status filters, computed on the first page for tag and
+        client filters and -1 after that.
+        """
+        filters = filters or {}
+        try:
+            page = self._query_page(cursor, page_size, filters)
+        except Exception as e:
+            self.errorOccurred.emit(str(e))
+            return {"projects": [], "nextCursor": "", "totalCount": 0}
+        return self._with_total_hint(page, filters)
+
+    # --- Asynchronous API ---
+
+    @Slot(result=int)
+    def getProjectsAsync(self) -> int:
+        """Load all projects in the background; answers with projectsLoaded."""
+        return self._worker.submit(
+            self._query_projects, self.projectsLoaded.emit, self._request_failed
+        )
+
+    @Slot(result=int)
+    def getActiveProjectsAsync(self) -> int:
+        """Load active projects in the background; answers with projectsLoaded."""
+        return self._worker.submit(
+            lambda: self._query_projects("active"),
+            self.projectsLoaded.emit,
+            self._request_failed,
+        )
+
+    @Slot(str, int, "QVariantMap", result=int)
+    def getProjectsPageAsync(
+        self, cursor: str, page_size: int, filters: Optional[dict[str, Any]] = None
+    ) -> int:
+        """Load a page in the background; answers with pageLoaded."""
+        filters = filters or {}
+        return self._worker.submit(
+            lambda: self._query_page(cursor, page_size, filters),
+            lambda request_id, page: self.pageLoaded.emit(
+                request_id, self._with_total_hint(page, filters)
+            ),
+            self._request_failed,
+        )
+
+    @Slot(str, result=int)
+    def getProjectAsync(self, project_id: str) -> int:
+        """Load one project in the background; answers with projectLoaded."""
+        return self._worker.submit(
+            lambda: self._query_project(project_id),
+            lambda request_id, data: self.projectLoaded.emit(
+                request_id, self._with_pending_markdown(data)
+            ),
+            self._request_failed,
+        )
+
+    @Slot(str, int, result=int)
+    def searchAsync(self, query: str, limit: int = 20) -> int:
+        """Search in the background; answers with searchFinished."""
+        match = _fts_query(query)
+        # Make buffered edits searchable; the write queue commits them first
+        self.flush()
+        if not match:
+            return self._worker.submit(list, self.searchFinished.emit)
+        return self._worker.submit(
+            lambda: self._query_search(match, limit),
+            self.searchFinished.emit,
+            self._request_failed,
+            write=bool(self._inflight_markdown),
+        )
+
+    @Slot(str, str, str, str, str, str, "QVariantList", result=int)
+    def createProjectAsync(
+        self,
+        title: str,
+        headline: str,
+        client_name: str,
+        start_date: str,
+        deadline: str,
+        status: str,
+        tags: list[str],
+    ) -> int:
+        """Create a project in the background; requestFinished gets its id."""
+
+        def done(request_id: int, result: tuple[str, str]) -> None:
+            self._project_created(*result)
+            self.requestFinished.emit(request_id, result[0])
+
+        return self._worker.submit(
+            lambda: self._insert_project(
+                title, headline, client_name, start_date, deadline, status, tags
+            ),
+            done,
+            self._request_failed,
+            write=True,
+        )
+
+    @Slot(str, str, str, str, str, str, str, "QVariantList", result=int)
+    def updateProjectAsync(
+        self,
+        project_id: str,
+        title: str,
+        headline: str,
+        client_name: str,
+        start_date: str,
+        deadline: str,
+        status: str,
+        tags: list[str],
+    ) -> int:
+        """Update a project in the background; requestFinished gets a bool."""
+
+        def done(request_id: int, old_status: Optional[str]) -> None:
+            if old_status is not None:
+                self._project_updated(project_id, old_status, status)
+            self.requestFinished.emit(request_id, old_status is not None)
+
+        return self._worker.submit(
+            lambda: self._apply_update(
+                project_id, title, headline, client_name, start_date, deadline, status, tags
+            ),
+            done,
+            self._request_failed,
+            write=True,
+        )
+
+    @Slot(str, result=int)
+    def deleteProjectAsync(self, project_id: str) -> int:
+        """Delete a project in the background; requestFinished gets a bool."""
+        self._discard_pending(project_id)
+
+        def done(request_id: int, status: Optional[str]) -> None:
+            if status is not None:
+                self._project_deleted(project_id, status)
+            self.requestFinished.emit(request_id, status is not None)
+
+        return self._worker.submit(
+            lambda: self._remove_project(project_id),
+            done,
+            self._request_failed,
+            write=True,
+        )
@@ -0,0 +1,355 @@
+"""List model exposing projects to QML with incremental updates."""
+
+from typing import Any, Optional
+
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QByteArray,
+    QModelIndex,
+    QObject,
+    Qt,
+    Signal,
+    Slot,
+    Property,
+)
+
+from .database import Database, Project, project_page, summary_query
+from .workers import DatabaseWorker
+
+
+class ProjectsListModel(QAbstractListModel):
+    """Projects ordered by ``updated_at``, newest first.
+
+    Rows hold summary data only, loaded in keyset pages as views scroll,
+    through ``canFetchMore``/``fetchMore``. Every query runs on the
+    ``DatabaseWorker``: pages and changed rows are applied when their results
+    arrive, and the markdown roles read as empty until the content a
+    delegate asked for has been fetched. Markdown is only kept for rows a
+    delegate asked about and is dropped when the project changes.
+    """
+
+    PAGE_SIZE = 100
+
+    IdRole = Qt.ItemDataRole.UserRole + 1
+    TitleRole = Qt.ItemDataRole.UserRole + 2
+    HeadlineRole = Qt.ItemDataRole.UserRole + 3
+    ClientNameRole = Qt.ItemDataRole.UserRole + 4
+    StartDateRole = Qt.ItemDataRole.UserRole + 5
+    DeadlineRole = Qt.ItemDataRole.UserRole + 6
+    StatusRole = Qt.ItemDataRole.UserRole + 7
+    TagsRole = Qt.ItemDataRole.UserRole + 8
+    CreatedAtRole = Qt.ItemDataRole.UserRole + 9
+    UpdatedAtRole = Qt.ItemDataRole.UserRole + 10
+    ProjectRole = Qt.ItemDataRole.UserRole + 11
+    DetailsMarkdownRole = Qt.ItemDataRole.UserRole + 12
+    TasksMarkdownRole = Qt.ItemDataRole.UserRole + 13
+
+    _FIELD_ROLES = {
+        IdRole: "id",
+        TitleRole: "title",
+        HeadlineRole: "headline",
+        ClientNameRole: "client_name",
+        StartDateRole: "start_date",
+        DeadlineRole: "deadline",
+        StatusRole: "status",
+        TagsRole: "tags",
+        CreatedAtRole: "created_at",
+        UpdatedAtRole: "updated_at",
+    }
+
+    _MARKDOWN_ROLES = {
+        DetailsMarkdownRole: Project.details_markdown,
+        TasksMarkdownRole: Project.tasks_markdown,
+    }
+
+    countChanged = Signal()
+    statusFilterChanged = Signal()
+    loadingChanged = Signal()
+    errorOccurred = Signal(str)
+
+    def __init__(
+        self, db: Database, worker: DatabaseWorker, parent: Optional[QObject] = None
+    ) -> None:
+        super().__init__(parent)
+        self._db = db
+        self._worker = worker
+        self._rows: list[dict[str, Any]] = []
+        self._status_filter = "all"
+        self._next_cursor = ""
+        # Request id of the page load in flight, or 0. A reload replaces it,
+        # so results of an outdated load are recognised and dropped
+        self._page_request = 0
+        # project id -> request id of its latest summary load
+        self._summary_requests: dict[str, int] = {}
+        # (project id, role) -> markdown, and the loads still in flight
+        self._markdown: dict[tuple[str, int], str] = {}
+        self._markdown_requests: dict[tuple[str, int], int] = {}
+        self.reload()
+
+    # --- QAbstractListModel interface ---
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+        row = self._rows[index.row()]
+        if role in self._FIELD_ROLES:
+            return row[self._FIELD_ROLES[role]]
+        if role == self.ProjectRole:
+            return row
+        if role == Qt.ItemDataRole.DisplayRole:
+            return row["title"]
+        if role in self._MARKDOWN_ROLES:
+            return self._markdown_for(row["id"], role)
+        return None
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and bool(self._next_cursor)
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if parent.isValid() or not self._next_cursor or self._page_request:
+            return
+        self._load_page(self._next_cursor, self._page_appended)
+
+    def roleNames(self) -> dict[int, QByteArray]:
+        names = {
+            role: QByteArray(field.encode()) for role, field in self._FIELD_ROLES.items()
+        }
+        names[self.ProjectRole] = QByteArray(b"project")
+        names[self.DetailsMarkdownRole] = QByteArray(b"details_markdown")
+        names[self.TasksMarkdownRole] = QByteArray(b"tasks_markdown")
+        return names
+
+    # --- Queries (worker thread) ---
+
+    def _fetch_summary(
+        self, project_id: str, status: Optional[str]
+    ) -> tuple[str, Optional[dict[str, Any]]]:
+        session = self._db.get_session()
+        try:
+            query = summary_query(session).filter(Project.id == project_id)
+            if status:
+                query = query.filter(Project.status == status)
+            project = query.first()
+            return project_id, project.to_dict(include_markdown=False) if project else None
+        finally:
+            session.close()
+
+    def _fetch_markdown(self, project_id: str, column) -> str:
+        session = self._db.get_session()
+        try:
+            value = (
+                session.query(column).filter(Project.id == project_id).scalar()
+            )
+            return value or ""
+        finally:
+            session.close()
+
+    def _fetch_page(
+        self, cursor: str, status: Optional[str]
+    ) -> tuple[list[dict[str, Any]], str]:
+        session = self._db.get_session()
+        try:
+            projects, next_cursor = project_page(
+                session, after=cursor, limit=self.PAGE_SIZE, status=status
+            )
+            return [p.to_dict(include_markdown=False) for p in projects], next_cursor
+        finally:
+            session.close()
+
+    # --- Loading ---
+
+    def _status(self) -> Optional[str]:
+        return None if self._status_filter == "all" else self._status_filter
+
+    def _load_page(self, cursor: str, on_result) -> None:
+        status = self._status()
+        was_loading = bool(self._page_request)
+        self._page_request = self._worker.submit(
+            lambda: self._fetch_page(cursor, status), on_result, self._load_failed
+        )
+        if not was_loading:
+            self.loadingChanged.emit()
+
+    def _finish_page(self, request_id: int) -> bool:
+        if request_id != self._page_request:
+            return False
+        self._page_request = 0
+        self.loadingChanged.emit()
+        return True
+
+    @Slot()
+    def reload(self) -> None:
+        """Reload from the first page. Only needed when the filter changes."""
+        # The reloaded rows reflect every change made so far, and summaries
+        # still in flight may have been queried with the old filter
+        self._summary_requests.clear()
+        self._load_page("", self._page_reset)
+
+    def _page_reset(
+        self, request_id: int, result: tuple[list[dict[str, Any]], str]
+    ) -> None:
+        if not self._finish_page(request_id):
+            return
+        self.beginResetModel()
+        self._rows, self._next_cursor = result
+        self._markdown.clear()
+        self._markdown_requests.clear()
+        self.endResetModel()
+        self.countChanged.emit()
+
+    def _page_appended(
+        self, request_id: int, result: tuple[list[dict[str, Any]], str]
+    ) -> None:
+        if not self._finish_page(request_id):
+            return
+        rows, self._next_cursor = result
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+        self.countChanged.emit()
+
+    def _load_failed(self, request_id: int, message: str) -> None:
+        self._finish_page(request_id)
+        for requests in (self._summary_requests, self._markdown_requests):
+            for key in [k for k, v in requests.items() if v == request_id]:
+                del requests[key]
+        self.errorOccurred.emit(message)
+
+    def _markdown_for(self, project_id: str, role: int) -> str:
+        key = (project_id, role)
+        if key in self._markdown:
+            return self._markdown[key]
+        if key not in self._markdown_requests:
+            column = self._MARKDOWN_ROLES[role]
+            self._markdown_requests[key] = self._worker.submit(
+                lambda: self._fetch_markdown(project_id, column),
+                lambda request_id, value: self._markdown_loaded(key, request_id, value),
+                self._load_failed,
+            )
+        return ""
+
+    def _markdown_loaded(
+        self, key: tuple[str, int], request_id: int, value: str
+    ) -> None:
+        if self._markdown_requests.get(key) != request_id:
+            return
+        del self._markdown_requests[key]
+        self._markdown[key] = value
+        row = self._row_of(key[0])
+        if row != -1:
+            index = self.index(row, 0)
+            self.dataChanged.emit(index, index, [key[1]])
+
+    def _forget_markdown(self, project_id: str) -> None:
+        for role in self._MARKDOWN_ROLES:
+            self._markdown.pop((project_id, role), None)
+            self._markdown_requests.pop((project_id, role), None)
+
+    def _row_of(self, project_id: str) -> int:
+        for row, data in enumerate(self._rows):
+            if data["id"] == project_id:
+                return row
+        return -1
+
+    # --- Incremental updates ---
+
+    def _insert_front(self, data: dict[str, Any]) -> None:
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._rows.insert(0, data)
+        self.endInsertRows()
+        self.countChanged.emit()
+
+    def _remove_row(self, row: int) -> None:
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self.endRemoveRows()
+        self.countChanged.emit()
+
+    def _load_summary(self, project_id: str) -> None:
+        status = self._status()
+        self._summary_requests[project_id] = self._worker.submit(
+            lambda: self._fetch_summary(project_id, status),
+            self._summary_loaded,
+            self._load_failed,
+        )
+
+    def _summary_loaded(
+        self, request_id: int, result: tuple[str, Optional[dict[str, Any]]]
+    ) -> None:
+        project_id, data = result
+        if self._summary_requests.get(project_id) != request_id:
+            return
+        del self._summary_requests[project_id]
+
+        row = self._row_of(project_id)
+        if data is None:
+            # Gone, or no longer matching the status filter
+            if row != -1:
+                self._remove_row(row)
+            return
+        if row == -1:
+            self._insert_front(data)
+            return
+
+        # The update bumped updated_at, so the row moves to the front
+        if row > 0:
+            self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), 0)
+            self._rows.insert(0, self._rows.pop(row))
+            self.endMoveRows()
+        self._rows[0] = data
+        index = self.index(0, 0)
+        self.dataChanged.emit(index, index)
+
+    @Slot(str)
+    def onProjectAdded(self, project_id: str) -> None:
+        self._load_summary(project_id)
+
+    @Slot(str)
+    def onProjectUpdated(self, project_id: str) -> None:
+        self._forget_markdown(project_id)
+        self._load_summary(project_id)
+
+    @Slot(str)
+    def onProjectDeleted(self, project_id: str) -> None:
+        self._summary_requests.pop(project_id, None)
+        self._forget_markdown(project_id)
+        row = self._row_of(project_id)
+        if row != -1:
+            self._remove_row(row)
+
+    # --- Properties ---
+
+    def _get_count(self) -> int:
+        return len(self._rows)
+
+    count = Property(int, _get_count, notify=countChanged)
+
+    def _get_loading(self) -> bool:
+        return bool(self._page_request)
+
+    loading = Property(bool, _get_loading, notify=loadingChanged)
+
+    def _get_status_filter(self) -> str:
+        return self._status_filter
+
+    def _set_status_filter(self, status: str) -> None:
+        if status != self._status_filter:
+            self._status_filter = status
+            self.statusFilterChanged.emit()
+            self.reload()
+
+    statusFilter = Property(
+        str, _get_status_filter, _set_status_filter, notify=statusFilterChanged
+    )
+
+    @Slot(int, result="QVariant")
+    def get(self, row: int) -> dict[str, Any]:
+        return self._rows[row] if 0 <= row < len(self._rows) else {}
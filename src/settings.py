@@ -1,10 +1,21 @@
 """Settings management backend."""
 
-import json
 from pathlib import Path
 from typing import Any, Optional
 
-from PySide6.QtCore import QObject, Signal, Slot, Property
+from PySide6.QtCore import QFileSystemWatcher, QObject, Signal, Slot, Property
+
+from .storage import JsonStore
+
+# Change signal of each setting; the API key's signal carries the value
+KEY_SIGNALS = {
+    "work_duration": "workDurationChanged",
+    "short_break_duration": "shortBreakDurationChanged",
+    "long_break_duration": "longBreakDurationChanged",
+    "auto_start_breaks": "autoStartBreaksChanged",
+    "notification_sound": "notificationSoundChanged",
+    "theme": "themeChanged",
+}
 
 
 class SettingsBackend(QObject):
@@ -21,19 +32,37 @@ class SettingsBackend(QObject):
 
     def __init__(self, parent: Optional[QObject] = None) -> None:
         super().__init__(parent)
-        self._settings: dict[str, Any] = {}
         self._settings_file = Path.home() / ".pomcraft" / "settings.json"
-        self._load_settings()
-
-    def _load_settings(self) -> None:
-        if self._settings_file.exists():
-            try:
-                with open(self._settings_file, "r") as f:
-                    self._settings = json.load(f)
-            except json.JSONDecodeError:
-                self._settings = self._default_settings()
-        else:
-            self._settings = self._default_settings()
+        self._store = JsonStore(self._settings_file, self._default_settings)
+        self._settings: dict[str, Any] = self._store.load()
+
+        # Pick up changes written by another running instance
+        self._settings_file.parent.mkdir(parents=True, exist_ok=True)
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.addPath(str(self._settings_file.parent))
+        self._watcher.directoryChanged.connect(self._reload_if_changed)
+
+    def _apply(self, data: dict[str, Any]) -> None:
+        """Adopt ``data`` and emit the signals of every key that differs."""
+        changed = {
+            key
+            for key in data.keys() | self._settings.keys()
+            if data.get(key) != self._settings.get(key)
+        }
+        self._settings = data
+        for key in changed:
+            name = KEY_SIGNALS.get(key)
+            if name:
+                getattr(self, name).emit()
+        if "gemini_api_key" in changed:
+            self.apiKeyChanged.emit(self.get_api_key())
+        if changed - {"gemini_api_key"}:
+            self.settingsChanged.emit()
+
+    @Slot()
+    def _reload_if_changed(self) -> None:
+        if self._store.changed_on_disk():
+            self._apply(self._store.load())
 
     def _default_settings(self) -> dict[str, Any]:
         return {
@@ -48,10 +77,10 @@ class SettingsBackend(QObject):
             "theme": "dark",
         }
 
-    def _save_settings(self) -> None:
-        self._settings_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self._settings_file, "w") as f:
-            json.dump(self._settings, f, indent=2)
+    def _save_settings(self, key: str) -> None:
+        # Only ``key`` is written; other keys keep whatever is on disk,
+        # which may include edits from another instance
+        self._apply(self._store.update({key: self._settings[key]}))
 
     # Work Duration
     def get_work_duration(self) -> int:
@@ -60,7 +89,7 @@ class SettingsBackend(QObject):
     def set_work_duration(self, minutes: int) -> None:
         if self._settings.get("work_duration") != minutes:
             self._settings["work_duration"] = minutes
-            self._save_settings()
+            self._save_settings("work_duration")
             self.workDurationChanged.emit()
             self.settingsChanged.emit()
 
@@ -75,7 +104,7 @@ class SettingsBackend(QObject):
     def set_short_break_duration(self, minutes: int) -> None:
         if self._settings.get("short_break_duration") != minutes:
             self._settings["short_break_duration"] = minutes
-            self._save_settings()
+            self._save_settings("short_break_duration")
             self.shortBreakDurationChanged.emit()
             self.settingsChanged.emit()
 
@@ -93,7 +122,7 @@ class SettingsBackend(QObject):
     def set_long_break_duration(self, minutes: int) -> None:
         if self._settings.get("long_break_duration") != minutes:
             self._settings["long_break_duration"] = minutes
-            self._save_settings()
+            self._save_settings("long_break_duration")
             self.longBreakDurationChanged.emit()
             self.settingsChanged.emit()
 
@@ -111,7 +140,7 @@ class SettingsBackend(QObject):
     def set_api_key(self, key: str) -> None:
         if self._settings.get("gemini_api_key") != key:
             self._settings["gemini_api_key"] = key
-            self._save_settings()
+            self._save_settings("gemini_api_key")
             self.apiKeyChanged.emit(key)
 
     apiKey = Property(str, get_api_key, set_api_key, notify=apiKeyChanged)
@@ -123,7 +152,7 @@ class SettingsBackend(QObject):
     def set_auto_start_breaks(self, enabled: bool) -> None:
         if self._settings.get("auto_start_breaks") != enabled:
             self._settings["auto_start_breaks"] = enabled
-            self._save_settings()
+            self._save_settings("auto_start_breaks")
             self.autoStartBreaksChanged.emit()
             self.settingsChanged.emit()
 
@@ -141,7 +170,7 @@ class SettingsBackend(QObject):
     def set_notification_sound(self, enabled: bool) -> None:
         if self._settings.get("notification_sound") != enabled:
             self._settings["notification_sound"] = enabled
-            self._save_settings()
+            self._save_settings("notification_sound")
             self.notificationSoundChanged.emit()
             self.settingsChanged.emit()
 
@@ -159,7 +188,7 @@ class SettingsBackend(QObject):
     def set_theme(self, theme: str) -> None:
         if self._settings.get("theme") != theme:
             self._settings["theme"] = theme
-            self._save_settings()
+            self._save_settings("theme")
             self.themeChanged.emit()
             self.settingsChanged.emit()
 
@@ -0,0 +1,263 @@
+"""Pomodoro session history and statistics."""
+
+from datetime import date, datetime, timedelta
+from typing import Any, Optional
+
+from PySide6.QtCore import QObject, Signal, Slot
+from sqlalchemy import Select, func, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from .database import Database, DailySessionStat, SessionEvent, WeeklySessionStat
+from .workers import DatabaseWorker
+
+SESSION_EVENTS = ("start", "pause", "reset", "skip", "complete")
+
+
+def _week_of(day: date) -> date:
+    return day - timedelta(days=day.weekday())
+
+
+def _add_to_rollups(
+    session: Session,
+    session_type: str,
+    day: date,
+    project_id: str,
+    seconds: int,
+    completed: int,
+    skipped: int,
+) -> None:
+    values = {"seconds": seconds, "completed": completed, "skipped": skipped}
+    for model, key, period in (
+        (DailySessionStat, "day", day),
+        (WeeklySessionStat, "week", _week_of(day)),
+    ):
+        statement = insert(model).values(
+            session_type=session_type,
+            project_id=project_id,
+            **{key: period.isoformat()},
+            **values,
+        )
+        session.execute(
+            statement.on_conflict_do_update(
+                index_elements=["session_type", key, "project_id"],
+                set_={
+                    column: getattr(model, column) + statement.excluded[column]
+                    for column in values
+                },
+            )
+        )
+
+
+def record_session_event(
+    session: Session,
+    event: str,
+    session_type: str,
+    duration_seconds: int = 0,
+    project_id: Optional[str] = None,
+    task_id: Optional[str] = None,
+    occurred_at: Optional[datetime] = None,
+) -> None:
+    """Store a timer event and fold it into the daily and weekly rollups.
+
+    Runs in the caller's transaction, so the event and the rollups
+    commit together.
+    """
+    if event not in SESSION_EVENTS:
+        raise ValueError(f"Unknown session event: {event}")
+    occurred_at = occurred_at or datetime.now()
+    session.add(
+        SessionEvent(
+            event=event,
+            session_type=session_type,
+            occurred_at=occurred_at,
+            duration_seconds=duration_seconds,
+            project_id=project_id,
+            task_id=task_id,
+        )
+    )
+    completed = int(event == "complete")
+    skipped = int(event == "skip")
+    if duration_seconds or completed or skipped:
+        # Time is credited to the day the running stretch ended on
+        _add_to_rollups(
+            session,
+            session_type,
+            occurred_at.date(),
+            project_id or "",
+            duration_seconds,
+            completed,
+            skipped,
+        )
+
+
+def focus_by_project_day_query(since: str) -> Select:
+    """Work time per project and day, from ``since`` (YYYY-MM-DD) on."""
+    return (
+        select(
+            DailySessionStat.day,
+            DailySessionStat.project_id,
+            DailySessionStat.seconds,
+            DailySessionStat.completed,
+        )
+        .where(
+            DailySessionStat.session_type == "work",
+            DailySessionStat.day >= since,
+        )
+        .order_by(DailySessionStat.day, DailySessionStat.project_id)
+    )
+
+
+def focus_per_week_query(since: str) -> Select:
+    """Work time and completed sessions per week, from ``since`` on."""
+    return (
+        select(
+            WeeklySessionStat.week,
+            func.sum(WeeklySessionStat.seconds),
+            func.sum(WeeklySessionStat.completed),
+        )
+        .where(
+            WeeklySessionStat.session_type == "work",
+            WeeklySessionStat.week >= since,
+        )
+        .group_by(WeeklySessionStat.week)
+        .order_by(WeeklySessionStat.week)
+    )
+
+
+def day_summary_query(day: str) -> Select:
+    """Work seconds, completed and skipped sessions on one day."""
+    return select(
+        func.coalesce(func.sum(DailySessionStat.seconds), 0),
+        func.coalesce(func.sum(DailySessionStat.completed), 0),
+        func.coalesce(func.sum(DailySessionStat.skipped), 0),
+    ).where(
+        DailySessionStat.session_type == "work",
+        DailySessionStat.day == day,
+    )
+
+
+def recent_sessions_query(limit: int) -> Select:
+    return select(SessionEvent).order_by(SessionEvent.occurred_at.desc()).limit(limit)
+
+
+class StatsBackend(QObject):
+    """Records timer events and answers statistics queries from rollups.
+
+    Events are written on the database worker's write thread. Queries only
+    read ``session_stats_daily``/``session_stats_weekly``, whose primary
+    keys lead with ``(session_type, day|week)``, so a year of per-project
+    focus time is one index range scan regardless of how many raw events
+    exist.
+    """
+
+    statsChanged = Signal()
+    errorOccurred = Signal(str)
+
+    def __init__(self, worker: DatabaseWorker, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._db = Database.get_instance()
+        # Shared with the other backends; a worker of its own would need
+        # connections beyond the database's pool
+        self._worker = worker
+
+    @Slot("QVariantMap")
+    def recordEvent(self, data: dict[str, Any]) -> None:
+        """Record a ``TimerBackend.sessionEvent`` payload."""
+        event = dict(data)
+
+        def write() -> None:
+            session = self._db.get_session()
+            try:
+                record_session_event(
+                    session,
+                    event["event"],
+                    event["session_type"],
+                    int(event.get("duration_seconds", 0)),
+                    event.get("project_id") or None,
+                    event.get("task_id") or None,
+                )
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+            finally:
+                session.close()
+
+        self._worker.submit(
+            write,
+            lambda _id, _result: self.statsChanged.emit(),
+            lambda _id, message: self.errorOccurred.emit(message),
+            write=True,
+        )
+
+    def _since(self, days: int) -> str:
+        return (date.today() - timedelta(days=max(0, days - 1))).isoformat()
+
+    @Slot(int, result="QVariantList")
+    def getFocusMinutesByProjectPerDay(self, days: int = 365) -> list[dict[str, Any]]:
+        """Work minutes per project and day over the last ``days`` days,
+        oldest first."""
+        session = self._db.get_session()
+        try:
+            rows = session.execute(focus_by_project_day_query(self._since(days)))
+            return [
+                {
+                    "day": day,
+                    "project_id": project_id,
+                    "minutes": round(seconds / 60, 1),
+                    "completed": completed,
+                }
+                for day, project_id, seconds, completed in rows
+            ]
+        finally:
+            session.close()
+
+    @Slot(int, result="QVariantList")
+    def getFocusMinutesPerWeek(self, weeks: int = 52) -> list[dict[str, Any]]:
+        """Work minutes and completed sessions per week, oldest first."""
+        since = _week_of(date.today()) - timedelta(weeks=max(0, weeks - 1))
+        session = self._db.get_session()
+        try:
+            rows = session.execute(focus_per_week_query(since.isoformat()))
+            return [
+                {"week": week, "minutes": round(seconds / 60, 1), "completed": completed}
+                for week, seconds, completed in rows
+            ]
+        finally:
+            session.close()
+
+    @Slot(result="QVariantMap")
+    def getTodaySummary(self) -> dict[str, Any]:
+        """Today's work minutes, completed and skipped work sessions."""
+        session = self._db.get_session()
+        try:
+            seconds, completed, skipped = session.execute(
+                day_summary_query(date.today().isoformat())
+            ).one()
+            return {
+                "minutes": round(seconds / 60, 1),
+                "completed": completed,
+                "skipped": skipped,
+            }
+        finally:
+            session.close()
+
+    @Slot(int, result="QVariantList")
+    def getRecentSessions(self, limit: int = 50) -> list[dict[str, Any]]:
+        session = self._db.get_session()
+        try:
+            events = session.scalars(recent_sessions_query(limit))
+            return [
+                {
+                    "event": e.event,
+                    "session_type": e.session_type,
+                    "occurred_at": e.occurred_at.isoformat(),
+                    "duration_seconds": e.duration_seconds,
+                    "project_id": e.project_id or "",
+                    "task_id": e.task_id or "",
+                }
+                for e in events
+            ]
+        finally:
+            session.close()
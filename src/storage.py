@@ -0,0 +1,112 @@
+"""Crash-safe JSON files shared between Pomcraft instances."""
+
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, writes are still atomic
+    fcntl = None  # type: ignore
+
+
+def _signature(path: Path) -> Optional[tuple[int, int, int]]:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def atomic_write_json(path: Path, data: Any) -> None:
+    """Write ``data`` to a temp file, fsync it and rename it over ``path``.
+
+    A crash leaves either the old file or the new one, never a truncated
+    mix of both.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+    if hasattr(os, "O_DIRECTORY"):
+        # Make the rename itself durable
+        dir_fd = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+class JsonStore:
+    """A JSON object on disk that several processes may update.
+
+    Updates are read-modify-write under an exclusive ``fcntl`` lock on a
+    ``.lock`` file next to the data, so each update is applied to the
+    latest version on disk and concurrent instances don't clobber each
+    other's keys. The file's inode, mtime and size are remembered after
+    every read or write; :meth:`changed_on_disk` compares against them to
+    notice edits made by another process.
+    """
+
+    def __init__(self, path: Path, default: Callable[[], dict[str, Any]]) -> None:
+        self.path = path
+        self._default = default
+        self._lock_path = path.with_name(path.name + ".lock")
+        self._signature: Optional[tuple[int, int, int]] = None
+
+    @contextmanager
+    def _locked(self, exclusive: bool) -> Iterator[None]:
+        if fcntl is None:
+            yield
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._lock_path, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _read(self) -> dict[str, Any]:
+        signature = _signature(self.path)
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            data = self._default()
+        except json.JSONDecodeError:
+            # Only possible if something other than JsonStore wrote it
+            data = self._default()
+        if not isinstance(data, dict):
+            data = self._default()
+        self._signature = signature
+        return data
+
+    def load(self) -> dict[str, Any]:
+        with self._locked(exclusive=False):
+            return self._read()
+
+    def changed_on_disk(self) -> bool:
+        return _signature(self.path) != self._signature
+
+    def update(self, changes: dict[str, Any]) -> dict[str, Any]:
+        """Merge ``changes`` into the file and return the merged data."""
+        with self._locked(exclusive=True):
+            data = self._read()
+            data.update(changes)
+            atomic_write_json(self.path, data)
+            self._signature = _signature(self.path)
+            return data
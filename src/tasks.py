@@ -1,129 +1,414 @@
 """Tasks management backend."""
 
-import json
-from dataclasses import asdict, dataclass
-from datetime import datetime
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Optional
 
-from PySide6.QtCore import QObject, Signal, Slot, Property
+from PySide6.QtCore import QObject, QTimer, Signal, Slot, Property
+from sqlalchemy import Integer, Select, func, insert, select, tuple_, update
 
+from .database import Database, TaskRecord
+from .importer import import_tasks
+from .tasks_model import TasksListModel
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
 class Task:
+    """A general task.
+
+    ``created_at`` is kept as epoch seconds and only turned into an ISO
+    string by :meth:`to_dict`, at the QML boundary.
+    """
+
     id: str
     title: str
     description: str
     completed: bool
-    created_at: str
+    created_at: float
     pomodoros_completed: int
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "completed": self.completed,
+            "created_at": datetime.fromtimestamp(self.created_at).isoformat(),
+            "pomodoros_completed": self.pomodoros_completed,
+        }
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "Task":
-        return cls(**data)
+    def from_record(cls, record: Any) -> "Task":
+        return cls(
+            id=record.id,
+            title=record.title,
+            description=record.description or "",
+            completed=bool(record.completed),
+            created_at=record.created_at.timestamp(),
+            pomodoros_completed=record.pomodoros_completed or 0,
+        )
+
+
+TASK_COLUMNS = (
+    TaskRecord.id,
+    TaskRecord.title,
+    TaskRecord.description,
+    TaskRecord.completed,
+    TaskRecord.created_at,
+    TaskRecord.pomodoros_completed,
+)
+
+
+def tasks_query(task_ids: Optional[list[str]] = None) -> Select:
+    """The given tasks, or all of them, newest first."""
+    query = select(*TASK_COLUMNS).order_by(
+        TaskRecord.created_at.desc(), TaskRecord.id.desc()
+    )
+    if task_ids is not None:
+        query = query.where(TaskRecord.id.in_(task_ids))
+    return query
+
+
+def task_page_query(after: str = "", limit: int = 100) -> Select:
+    """One page of tasks, newest first, fetching one row extra.
+
+    ``after`` is the cursor returned with the previous page, or empty for
+    the first one.
+    """
+    query = tasks_query()
+    if after:
+        created_at, _, task_id = after.partition("|")
+        query = query.where(
+            tuple_(TaskRecord.created_at, TaskRecord.id)
+            < tuple_(datetime.fromisoformat(created_at), task_id)
+        )
+    return query.limit(limit + 1)
+
+
+def task_counts_query() -> Select:
+    """Total and completed task counts."""
+    return select(
+        func.count(),
+        func.coalesce(func.sum(TaskRecord.completed, type_=Integer), 0),
+    )
 
 
 class TasksBackend(QObject):
-    """Manages tasks storage and operations."""
+    """Manages tasks storage and operations.
+
+    Tasks live in the ``tasks`` table and are read on demand; only the
+    total and completed counts are kept in memory.
+    """
 
     tasksChanged = Signal()
     taskAdded = Signal(str)
+    tasksAdded = Signal("QVariantList")
+    taskUpdated = Signal(str)
     taskCompleted = Signal(str)
     taskDeleted = Signal(str)
     errorOccurred = Signal(str)
+    countsChanged = Signal()
 
     def __init__(self, parent: Optional[QObject] = None) -> None:
         super().__init__(parent)
-        self._tasks: list[Task] = []
+        self._db = Database.get_instance()
+        # Legacy storage, imported into the database on first launch
         self._data_file = Path.home() / ".pomcraft" / "tasks.json"
-        self._load_tasks()
+        self._import_legacy_tasks()
+        self._total = 0
+        self._completed = 0
+        self._load_counts()
 
-    def _load_tasks(self) -> None:
-        if self._data_file.exists():
-            try:
-                with open(self._data_file, "r") as f:
-                    data = json.load(f)
-                    self._tasks = [Task.from_dict(t) for t in data]
-            except (json.JSONDecodeError, KeyError):
-                self._tasks = []
+        self._tasks_model = TasksListModel(
+            self._query_tasks, self._query_task_page, self
+        )
+        self.taskAdded.connect(self._tasks_model.onTaskAdded)
+        self.tasksAdded.connect(self._tasks_model.onTasksAdded)
+        self.taskUpdated.connect(self._tasks_model.onTaskUpdated)
+        self.taskDeleted.connect(self._tasks_model.onTaskDeleted)
+
+    def _get_tasks_model(self) -> TasksListModel:
+        return self._tasks_model
+
+    tasksModel = Property(QObject, _get_tasks_model, constant=True)
+
+    def _import_legacy_tasks(self) -> None:
+        try:
+            import_tasks(self._db, self._data_file)
+        except Exception as e:
+            # Leave the file in place; the import is retried next launch
+            logger.exception("Importing %s failed", self._data_file)
+            # Emitted once QML has had a chance to connect
+            message = f"Couldn't import {self._data_file.name}: {e}"
+            QTimer.singleShot(0, self, lambda: self.errorOccurred.emit(message))
+
+    def _load_counts(self) -> None:
+        session = self._db.get_session()
+        try:
+            total, completed = session.execute(task_counts_query()).one()
+        finally:
+            session.close()
+        self._total = total
+        self._completed = completed
 
-    def _save_tasks(self) -> None:
-        self._data_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self._data_file, "w") as f:
-            json.dump([t.to_dict() for t in self._tasks], f, indent=2)
+    def _query_tasks(self, task_ids: Optional[list[str]] = None) -> list[Task]:
+        """Return the given tasks, or all of them, newest first."""
+        session = self._db.get_session()
+        try:
+            return [
+                Task.from_record(row) for row in session.execute(tasks_query(task_ids))
+            ]
+        finally:
+            session.close()
+
+    def _query_task_page(self, cursor: str, limit: int) -> tuple[list[Task], str]:
+        """Return one page of tasks, newest first, and the next page's cursor.
+
+        Paging is keyset-based on ``(created_at, id)``; the cursor is empty
+        after the last page.
+        """
+        session = self._db.get_session()
+        try:
+            rows = session.execute(task_page_query(cursor, limit)).all()
+        finally:
+            session.close()
+        next_cursor = ""
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = f"{rows[-1].created_at.isoformat()}|{rows[-1].id}"
+        return [Task.from_record(row) for row in rows], next_cursor
+
+    def _set_fields(self, task_id: str, **values: Any) -> bool:
+        session = self._db.get_session()
+        try:
+            result = session.execute(
+                update(TaskRecord).where(TaskRecord.id == task_id).values(**values)
+            )
+            session.commit()
+            return result.rowcount > 0
+        except Exception as e:
+            session.rollback()
+            self.errorOccurred.emit(str(e))
+            return False
+        finally:
+            session.close()
 
     @Slot(str, str)
     def addTask(self, title: str, description: str = "") -> None:
         task_id = datetime.now().strftime("%Y%m%d%H%M%S%f")
-        task = Task(
-            id=task_id,
-            title=title,
-            description=description,
-            completed=False,
-            created_at=datetime.now().isoformat(),
-            pomodoros_completed=0,
-        )
-        self._tasks.insert(0, task)
-        self._save_tasks()
+        session = self._db.get_session()
+        try:
+            session.add(
+                TaskRecord(
+                    id=task_id,
+                    title=title,
+                    description=description,
+                    completed=False,
+                    created_at=datetime.now(),
+                    pomodoros_completed=0,
+                )
+            )
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            self.errorOccurred.emit(str(e))
+            return
+        finally:
+            session.close()
+        self._total += 1
         self.tasksChanged.emit()
         self.taskAdded.emit(task_id)
+        self.countsChanged.emit()
 
     @Slot(str)
     def toggleTask(self, task_id: str) -> None:
-        for task in self._tasks:
-            if task.id == task_id:
-                task.completed = not task.completed
-                self._save_tasks()
-                self.tasksChanged.emit()
-                if task.completed:
-                    self.taskCompleted.emit(task_id)
-                break
+        session = self._db.get_session()
+        try:
+            task = session.get(TaskRecord, task_id)
+            if task is None:
+                return
+            task.completed = not task.completed  # type: ignore
+            completed = bool(task.completed)
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            self.errorOccurred.emit(str(e))
+            return
+        finally:
+            session.close()
+        self._completed += 1 if completed else -1
+        self.tasksChanged.emit()
+        self.taskUpdated.emit(task_id)
+        self.countsChanged.emit()
+        if completed:
+            self.taskCompleted.emit(task_id)
 
     @Slot(str)
     def deleteTask(self, task_id: str) -> None:
-        self._tasks = [t for t in self._tasks if t.id != task_id]
-        self._save_tasks()
+        session = self._db.get_session()
+        try:
+            task = session.get(TaskRecord, task_id)
+            if task is not None:
+                completed = bool(task.completed)
+                session.delete(task)
+                session.commit()
+                self._total -= 1
+                if completed:
+                    self._completed -= 1
+                self.countsChanged.emit()
+        except Exception as e:
+            session.rollback()
+            self.errorOccurred.emit(str(e))
+            return
+        finally:
+            session.close()
         self.tasksChanged.emit()
         self.taskDeleted.emit(task_id)
 
     @Slot(str)
     def incrementPomodoro(self, task_id: str) -> None:
-        for task in self._tasks:
-            if task.id == task_id:
-                task.pomodoros_completed += 1
-                self._save_tasks()
-                self.tasksChanged.emit()
-                break
+        if self._set_fields(
+            task_id, pomodoros_completed=TaskRecord.pomodoros_completed + 1
+        ):
+            self.tasksChanged.emit()
+            self.taskUpdated.emit(task_id)
 
     @Slot(result="QVariantList")
     def getTasks(self) -> list[dict[str, Any]]:
-        return [t.to_dict() for t in self._tasks]
+        return [task.to_dict() for task in self._query_tasks()]
 
     @Slot(result=int)
     def getTaskCount(self) -> int:
-        return len(self._tasks)
+        return self._total
 
     @Slot(result=int)
     def getCompletedCount(self) -> int:
-        return sum(1 for t in self._tasks if t.completed)
+        return self._completed
+
+    taskCount = Property(int, getTaskCount, notify=countsChanged)
+    completedCount = Property(int, getCompletedCount, notify=countsChanged)
+
+    def _get_pending_count(self) -> int:
+        return self._total - self._completed
+
+    pendingCount = Property(int, _get_pending_count, notify=countsChanged)
 
     @Slot(str, str, str)
     def updateTask(self, task_id: str, title: str, description: str) -> None:
-        for task in self._tasks:
-            if task.id == task_id:
-                task.title = title
-                task.description = description
-                self._save_tasks()
-                self.tasksChanged.emit()
-                break
-
-    @Slot("QVariantList")
-    def setTasksFromAI(self, tasks_data: list[dict[str, Any]]) -> None:
-        for task_data in tasks_data:
-            self.addTask(
-                title=task_data.get("title", ""),
-                description=task_data.get("description", ""),
+        if self._set_fields(task_id, title=title, description=description):
+            self.tasksChanged.emit()
+            self.taskUpdated.emit(task_id)
+
+    @Slot("QVariantList", result="QVariant")
+    def addTasks(self, tasks_data: list[dict[str, Any]]) -> dict[str, Any]:
+        """Insert a batch of tasks in one transaction with one signal.
+
+        Every item needs a non-empty string ``title`` and may carry a string
+        ``description``. If any item is invalid nothing is inserted. As with
+        repeated :meth:`addTask` calls, the last item ends up first. Returns
+        ``ids`` (in input order), ``errors`` and ``elapsed_ms``.
+        """
+        started = time.perf_counter()
+        errors = _validate_batch(tasks_data, ("title",), ("description",))
+        if errors:
+            self.errorOccurred.emit(errors[0])
+            return {"ids": [], "errors": errors, "elapsed_ms": 0.0}
+
+        now = datetime.now()
+        base_id = now.strftime("%Y%m%d%H%M%S%f")
+        # One microsecond apart so the newest-first order is well defined
+        rows = [
+            {
+                "id": f"{base_id}-{i}",
+                "title": data["title"],
+                "description": data.get("description", ""),
+                "completed": False,
+                "created_at": now + timedelta(microseconds=i),
+                "pomodoros_completed": 0,
+            }
+            for i, data in enumerate(tasks_data)
+        ]
+        ids = [row["id"] for row in rows]
+        if rows:
+            session = self._db.get_session()
+            try:
+                session.execute(insert(TaskRecord), rows)
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                self.errorOccurred.emit(str(e))
+                return {"ids": [], "errors": [str(e)], "elapsed_ms": 0.0}
+            finally:
+                session.close()
+            self._total += len(rows)
+            self.tasksChanged.emit()
+            self.tasksAdded.emit(ids)
+            self.countsChanged.emit()
+        return {
+            "ids": ids,
+            "errors": [],
+            "elapsed_ms": (time.perf_counter() - started) * 1000,
+        }
+
+    @Slot("QVariantList", result="QVariant")
+    def setTasksFromAI(self, tasks_data: list[Any]) -> dict[str, Any]:
+        """Insert generated tasks, skipping the ones without a title.
+
+        A missing or non-string description becomes empty. Returns the
+        :meth:`addTasks` result, with one error per skipped item.
+        """
+        items, skipped = _usable_generated_tasks(tasks_data, ("description",))
+        result = self.addTasks(items)
+        if skipped:
+            result["errors"] = skipped + result["errors"]
+            self.errorOccurred.emit(
+                f"Skipped {len(skipped)} generated task(s) without a title"
             )
+        return result
+
+
+def _usable_generated_tasks(
+    items: list[Any], optional: tuple[str, ...] = ()
+) -> tuple[list[dict[str, str]], list[str]]:
+    """Split AI output into insertable items and one message per skipped one.
+
+    Items need a non-empty string ``title``; ``optional`` fields that are
+    missing or not strings default to empty.
+    """
+    usable = []
+    skipped = []
+    for i, item in enumerate(items):
+        title = item.get("title") if isinstance(item, dict) else None
+        if not isinstance(title, str) or not title.strip():
+            skipped.append(f"Item {i}: skipped, no title")
+            continue
+        usable_item = {"title": title}
+        for key in optional:
+            value = item.get(key)
+            usable_item[key] = value if isinstance(value, str) else ""
+        usable.append(usable_item)
+    return usable, skipped
+
+
+def _validate_batch(
+    items: list[Any], required: tuple[str, ...], optional: tuple[str, ...] = ()
+) -> list[str]:
+    """Return one message per problem found in a bulk insert payload."""
+    errors = []
+    for i, item in enumerate(items):
+        if not isinstance(item, dict):
+            errors.append(f"Item {i}: expected an object")
+            continue
+        for key in required:
+            value = item.get(key)
+            if not isinstance(value, str) or not value.strip():
+                errors.append(f"Item {i}: '{key}' must be a non-empty string")
+        for key in optional:
+            if key in item and not isinstance(item[key], str):
+                errors.append(f"Item {i}: '{key}' must be a string")
+    return errors
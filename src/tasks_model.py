@@ -0,0 +1,188 @@
+"""List model exposing general tasks to QML with incremental updates."""
+
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QByteArray,
+    QModelIndex,
+    QObject,
+    Qt,
+    Signal,
+    Slot,
+    Property,
+)
+
+if TYPE_CHECKING:
+    from .tasks import Task
+
+FetchTasks = Callable[[Optional[list[str]]], list["Task"]]
+FetchPage = Callable[[str, int], tuple[list["Task"], str]]
+
+
+class TasksListModel(QAbstractListModel):
+    """Tasks ordered by ``created_at``, newest first.
+
+    Rows are ``Task`` objects, loaded in keyset pages through ``fetch_page``
+    as views scroll (``canFetchMore``/``fetchMore``). ``fetch_page`` takes
+    a cursor and a page size and returns the tasks and the next cursor,
+    empty after the last page. ``fetch`` returns the given tasks newest
+    first and is used to pick up individual changes. Changes from
+    ``TasksBackend`` arrive as per-task signals and are applied as row
+    inserts, removals and ``dataChanged`` for just the roles that changed,
+    so a toggle repaints one delegate instead of rebuilding the list.
+    """
+
+    PAGE_SIZE = 100
+
+    IdRole = Qt.ItemDataRole.UserRole + 1
+    TitleRole = Qt.ItemDataRole.UserRole + 2
+    DescriptionRole = Qt.ItemDataRole.UserRole + 3
+    CompletedRole = Qt.ItemDataRole.UserRole + 4
+    CreatedAtRole = Qt.ItemDataRole.UserRole + 5
+    PomodorosCompletedRole = Qt.ItemDataRole.UserRole + 6
+    TaskRole = Qt.ItemDataRole.UserRole + 7
+
+    _FIELD_ROLES = {
+        IdRole: "id",
+        TitleRole: "title",
+        DescriptionRole: "description",
+        CompletedRole: "completed",
+        CreatedAtRole: "created_at",
+        PomodorosCompletedRole: "pomodoros_completed",
+    }
+
+    countChanged = Signal()
+
+    def __init__(
+        self,
+        fetch: FetchTasks,
+        fetch_page: FetchPage,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self._fetch = fetch
+        self._fetch_page = fetch_page
+        self._rows: list["Task"] = []
+        self._next_cursor = ""
+        self.reload()
+
+    # --- QAbstractListModel interface ---
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+        task = self._rows[index.row()]
+        if role == self.CreatedAtRole or role == self.TaskRole:
+            # Converts the timestamp to ISO, which only QML needs
+            data = task.to_dict()
+            return data if role == self.TaskRole else data["created_at"]
+        if role in self._FIELD_ROLES:
+            return getattr(task, self._FIELD_ROLES[role])
+        if role == Qt.ItemDataRole.DisplayRole:
+            return task.title
+        return None
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and bool(self._next_cursor)
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if parent.isValid() or not self._next_cursor:
+            return
+        rows, self._next_cursor = self._fetch_page(self._next_cursor, self.PAGE_SIZE)
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+        self.countChanged.emit()
+
+    def roleNames(self) -> dict[int, QByteArray]:
+        names = {
+            role: QByteArray(field.encode()) for role, field in self._FIELD_ROLES.items()
+        }
+        names[self.TaskRole] = QByteArray(b"task")
+        return names
+
+    # --- Loading ---
+
+    @Slot()
+    def reload(self) -> None:
+        """Reload from the first page."""
+        rows, next_cursor = self._fetch_page("", self.PAGE_SIZE)
+        self.beginResetModel()
+        self._rows = rows
+        self._next_cursor = next_cursor
+        self.endResetModel()
+        self.countChanged.emit()
+
+    def _row_of(self, task_id: str) -> int:
+        for row, task in enumerate(self._rows):
+            if task.id == task_id:
+                return row
+        return -1
+
+    # --- Incremental updates ---
+
+    @Slot(str)
+    def onTaskAdded(self, task_id: str) -> None:
+        self.onTasksAdded([task_id])
+
+    @Slot("QVariantList")
+    def onTasksAdded(self, task_ids: list[str]) -> None:
+        known = {task.id for task in self._rows}
+        tasks = self._fetch([i for i in task_ids if i not in known])
+        if not tasks:
+            return
+        # New tasks are the newest, so they all go in front, already sorted
+        self.beginInsertRows(QModelIndex(), 0, len(tasks) - 1)
+        self._rows[:0] = tasks
+        self.endInsertRows()
+        self.countChanged.emit()
+
+    @Slot(str)
+    def onTaskUpdated(self, task_id: str) -> None:
+        row = self._row_of(task_id)
+        if row == -1:
+            return
+        fetched = self._fetch([task_id])
+        if not fetched:
+            self.onTaskDeleted(task_id)
+            return
+        old, new = self._rows[row], fetched[0]
+        roles = [
+            role
+            for role, field in self._FIELD_ROLES.items()
+            if getattr(old, field) != getattr(new, field)
+        ]
+        if not roles:
+            return
+        self._rows[row] = new
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index, roles + [self.TaskRole])
+
+    @Slot(str)
+    def onTaskDeleted(self, task_id: str) -> None:
+        row = self._row_of(task_id)
+        if row != -1:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._rows[row]
+            self.endRemoveRows()
+            self.countChanged.emit()
+
+    # --- Properties ---
+
+    def _get_count(self) -> int:
+        return len(self._rows)
+
+    count = Property(int, _get_count, notify=countChanged)
+
+    @Slot(int, result="QVariant")
+    def get(self, row: int) -> dict[str, Any]:
+        return self._rows[row].to_dict() if 0 <= row < len(self._rows) else {}
@@ -1,26 +1,38 @@
 """Pomodoro timer backend."""
 
-import subprocess
+import math
+import time
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import QObject, QTimer, Signal, Slot, Property
+from PySide6.QtCore import QObject, Qt, QTimer, Signal, Slot, Property
 from PySide6.QtMultimedia import QSoundEffect
 from PySide6.QtCore import QUrl
 
+from .notifications import NotificationDispatcher
+
 
 class TimerBackend(QObject):
-    """Manages Pomodoro timer state and logic."""
+    """Manages Pomodoro timer state and logic.
+
+    While running, the session end is a fixed ``time.monotonic()`` deadline
+    and the remaining time is derived from it, so a stalled event loop
+    delays a repaint but never stretches the session. Wakeups are
+    single-shot and aimed at the next whole-second boundary.
+    """
 
     # Standard signals
     sessionCompleted = Signal(str)
     stateChanged = Signal(str)
+    # {event, session_type, duration_seconds, project_id, task_id}
+    sessionEvent = Signal("QVariantMap")
 
     # Property change signals
     timeRemainingChanged = Signal()
     isRunningChanged = Signal()
     sessionTypeChanged = Signal()
     completedSessionsChanged = Signal()
+    activeChanged = Signal()
 
     def __init__(self, parent: Optional[QObject] = None) -> None:
         super().__init__(parent)
@@ -33,13 +45,25 @@ class TimerBackend(QObject):
 
         self._remaining_seconds = self._work_duration
         self._total_seconds = self._work_duration
+        # Exact remaining time while paused; the deadline while running
+        self._remaining = float(self._work_duration)
+        self._deadline = 0.0
+        self._run_started = 0.0
+
+        # What the current session is being spent on, for session history
+        self._project_id = ""
+        self._task_id = ""
         self._is_running = False
         self._current_session = "work"
         self._completed_sessions = 0
 
         self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
         self._timer.timeout.connect(self._tick)
 
+        self._notifier = NotificationDispatcher(parent=self)
+
         # Load sound effect
         sound_path = (
             Path(__file__).parent.parent / "resources" / "sounds" / "notification.wav"
@@ -57,18 +81,56 @@ class TimerBackend(QObject):
         if settings_backend:
             self._notification_sound_enabled = settings_backend.notificationSound
 
+    def set_completed_sessions(self, count: int) -> None:
+        """Resume the long-break cadence, e.g. from today's session history."""
+        self._completed_sessions = count
+        self.completedSessionsChanged.emit()
+
     def set_notification_sound_enabled(self, enabled: bool) -> None:
         """Enable or disable notification sound."""
         self._notification_sound_enabled = enabled
 
+    def _set_remaining(self, seconds: float) -> None:
+        """Set the exact remaining time; the display rounds up."""
+        self._remaining = max(0.0, seconds)
+        self._remaining_seconds = math.ceil(self._remaining)
+
+    def _schedule_tick(self) -> None:
+        # Wake when the displayed second next changes, e.g. 1499.3 s left
+        # shows 1500 and is due for 1499 in 0.3 s
+        until_change = self._remaining - (self._remaining_seconds - 1)
+        self._timer.start(max(0, math.ceil(until_change * 1000)))
+
+    def _running_seconds(self) -> int:
+        """Seconds run since the last start, or zero when not running."""
+        if not self._is_running:
+            return 0
+        ended = min(time.monotonic(), self._deadline)
+        return max(0, round(ended - self._run_started))
+
+    def _record(self, event: str, duration_seconds: int = 0) -> None:
+        self.sessionEvent.emit(
+            {
+                "event": event,
+                "session_type": self._current_session,
+                "duration_seconds": duration_seconds,
+                "project_id": self._project_id,
+                "task_id": self._task_id,
+            }
+        )
+
     def _tick(self) -> None:
-        if self._remaining_seconds > 0:
-            self._remaining_seconds -= 1
-            self.timeRemainingChanged.emit()
-        else:
+        displayed = self._remaining_seconds
+        self._set_remaining(self._deadline - time.monotonic())
+        if self._remaining <= 0:
             self._complete_session()
+            return
+        if self._remaining_seconds != displayed:
+            self.timeRemainingChanged.emit()
+        self._schedule_tick()
 
-    def _complete_session(self) -> None:
+    def _complete_session(self, skipped: bool = False) -> None:
+        self._record("skip" if skipped else "complete", self._running_seconds())
         self._timer.stop()
         self._is_running = False
         self.isRunningChanged.emit()
@@ -79,13 +141,8 @@ class TimerBackend(QObject):
             self._sound.play()
 
         # Desktop Notification
-        try:
-            msg = (
-                f"{self._current_session.replace('_', ' ').title()} session completed!"
-            )
-            subprocess.run(["notify-send", "PomCraft", msg], check=False)
-        except Exception:
-            pass
+        msg = f"{self._current_session.replace('_', ' ').title()} session completed!"
+        self._notifier.notify("PomCraft", msg)
 
         if self._current_session == "work":
             self._completed_sessions += 1
@@ -110,27 +167,35 @@ class TimerBackend(QObject):
         else:
             self._total_seconds = self._long_break_duration
 
-        self._remaining_seconds = self._total_seconds
+        self._set_remaining(self._total_seconds)
         self.timeRemainingChanged.emit()
 
     @Slot()
     def start(self) -> None:
         if not self._is_running:
             self._is_running = True
-            self._timer.start(1000)
+            self._run_started = time.monotonic()
+            self._deadline = self._run_started + self._remaining
+            self._record("start")
+            self._schedule_tick()
             self.isRunningChanged.emit()
             self.stateChanged.emit("running")
 
     @Slot()
     def pause(self) -> None:
         if self._is_running:
+            self._record("pause", self._running_seconds())
             self._is_running = False
             self._timer.stop()
+            self._set_remaining(self._deadline - time.monotonic())
+            self.timeRemainingChanged.emit()
             self.isRunningChanged.emit()
             self.stateChanged.emit("paused")
 
     @Slot()
     def reset(self) -> None:
+        if self._is_running:
+            self._record("reset", self._running_seconds())
         self._timer.stop()
         self._is_running = False
         self.isRunningChanged.emit()
@@ -143,13 +208,31 @@ class TimerBackend(QObject):
         else:
             self._total_seconds = self._long_break_duration
 
-        self._remaining_seconds = self._total_seconds
+        self._set_remaining(self._total_seconds)
         self.timeRemainingChanged.emit()
         self.stateChanged.emit("stopped")
 
     @Slot()
     def skip(self) -> None:
-        self._complete_session()
+        self._complete_session(skipped=True)
+
+    @Slot(str)
+    def setActiveProject(self, project_id: str) -> None:
+        """Attribute the following session events to ``project_id``.
+
+        A task chosen under another project no longer applies.
+        """
+        if project_id != self._project_id:
+            self._project_id = project_id
+            self._task_id = ""
+            self.activeChanged.emit()
+
+    @Slot(str)
+    def setActiveTask(self, task_id: str) -> None:
+        """Attribute the following session events to ``task_id``."""
+        if task_id != self._task_id:
+            self._task_id = task_id
+            self.activeChanged.emit()
 
     # --- Properties for QML ---
 
@@ -165,13 +248,19 @@ class TimerBackend(QObject):
     def get_completed_sessions(self) -> int:
         return self._completed_sessions
 
+    def get_active_project_id(self) -> str:
+        return self._project_id
+
+    def get_active_task_id(self) -> str:
+        return self._task_id
+
     @Slot(int)
     def setWorkDuration(self, minutes: int) -> None:
         self._work_duration = minutes * 60
         # If we are in work session and NOT running, update remaining time immediately
         if self._current_session == "work" and not self._is_running:
             self._total_seconds = self._work_duration
-            self._remaining_seconds = self._total_seconds
+            self._set_remaining(self._total_seconds)
             self.timeRemainingChanged.emit()
 
     @Slot(int)
@@ -179,7 +268,7 @@ class TimerBackend(QObject):
         self._short_break_duration = minutes * 60
         if self._current_session == "short_break" and not self._is_running:
             self._total_seconds = self._short_break_duration
-            self._remaining_seconds = self._total_seconds
+            self._set_remaining(self._total_seconds)
             self.timeRemainingChanged.emit()
 
     @Slot(int)
@@ -187,7 +276,7 @@ class TimerBackend(QObject):
         self._long_break_duration = minutes * 60
         if self._current_session == "long_break" and not self._is_running:
             self._total_seconds = self._long_break_duration
-            self._remaining_seconds = self._total_seconds
+            self._set_remaining(self._total_seconds)
             self.timeRemainingChanged.emit()
 
     timeRemaining = Property(int, get_time_remaining, notify=timeRemainingChanged)
@@ -196,3 +285,5 @@ class TimerBackend(QObject):
     completedSessions = Property(
         int, get_completed_sessions, notify=completedSessionsChanged
     )
+    activeProjectId = Property(str, get_active_project_id, notify=activeChanged)
+    activeTaskId = Property(str, get_active_task_id, notify=activeChanged)
@@ -0,0 +1,83 @@
+"""Background execution of database work."""
+
+import itertools
+from typing import Any, Callable, Optional
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+
+class _JobSignals(QObject):
+    finished = Signal(int, object)
+    failed = Signal(int, str)
+
+
+class _Job(QRunnable):
+    def __init__(
+        self, request_id: int, fn: Callable[[], Any], signals: _JobSignals
+    ) -> None:
+        super().__init__()
+        self._request_id = request_id
+        self._fn = fn
+        self._signals = signals
+
+    def run(self) -> None:
+        try:
+            result = self._fn()
+        except Exception as e:
+            self._signals.failed.emit(self._request_id, str(e))
+            return
+        self._signals.finished.emit(self._request_id, result)
+
+
+class DatabaseWorker(QObject):
+    """Runs blocking database calls on worker threads.
+
+    Reads go to a small pool and may run concurrently. Writes go to a
+    single-threaded pool so they commit in submission order, which SQLite
+    needs anyway since it allows one writer at a time. Jobs must open their
+    own sessions; callbacks are invoked on the thread that owns the worker.
+    """
+
+    def __init__(self, read_threads: int = 1, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._read_pool = QThreadPool(self)
+        self._read_pool.setMaxThreadCount(max(1, read_threads))
+        self._write_pool = QThreadPool(self)
+        self._write_pool.setMaxThreadCount(1)
+
+        self._ids = itertools.count(1)
+        self._callbacks: dict[int, tuple[Callable, Optional[Callable]]] = {}
+
+        # Signals emitted from worker threads are queued to this thread
+        self._signals = _JobSignals(self)
+        self._signals.finished.connect(self._on_finished)
+        self._signals.failed.connect(self._on_failed)
+
+    def submit(
+        self,
+        fn: Callable[[], Any],
+        on_result: Callable[[int, Any], None],
+        on_error: Optional[Callable[[int, str], None]] = None,
+        write: bool = False,
+    ) -> int:
+        """Queue ``fn`` and return the request id passed to the callbacks."""
+        request_id = next(self._ids)
+        self._callbacks[request_id] = (on_result, on_error)
+        pool = self._write_pool if write else self._read_pool
+        pool.start(_Job(request_id, fn, self._signals))
+        return request_id
+
+    def shutdown(self) -> None:
+        self._read_pool.clear()
+        self._read_pool.waitForDone()
+        self._write_pool.waitForDone()
+
+    def _on_finished(self, request_id: int, result: Any) -> None:
+        on_result, _ = self._callbacks.pop(request_id, (None, None))
+        if on_result is not None:
+            on_result(request_id, result)
+
+    def _on_failed(self, request_id: int, message: str) -> None:
+        _, on_error = self._callbacks.pop(request_id, (None, None))
+        if on_error is not None:
+            on_error(request_id, message)
@@ -0,0 +1,108 @@
+"""Markdown highlighting throughput: blocks per second, before and after.
+
+"before" is the original highlighter, one ``re`` pass per inline kind
+and per list pattern; "after" is ``MarkdownHighlighter``. Both rehighlight
+the same mixed document offscreen.
+
+Run with ``python tests/bench_highlighter.py [lines]``. Defaults to 20,000
+lines.
+"""
+
+import os
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PySide6.QtGui import QGuiApplication, QSyntaxHighlighter, QTextDocument  # noqa: E402
+
+from src.highlighter import MarkdownHighlighter, shared_formats  # noqa: E402
+
+# PySide6 6.12 drops a reference to None, True or False on some of the
+# void calls it wraps. They are immortal from Python 3.12; before that,
+# hold enough references to last the run.
+_pinned = [None, True, False] * 5_000_000 if sys.version_info < (3, 12) else []
+
+LINES = (
+    "Some paragraph with **bold**, *italic*, `code` and [a link](http://x.y).",
+    "- [ ] A task with ~~struck~~ text",
+    "- A bullet point with *emphasis* in it",
+    "1. A numbered item",
+    "## A heading",
+    "> A quote with **bold** inside",
+    "Plain text without any markup at all, just words and more words.",
+    "",
+)
+
+
+class BaselineHighlighter(QSyntaxHighlighter):
+    """The highlighter as it was before the single-pass scanner."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._formats = shared_formats()
+
+    def highlightBlock(self, text):
+        if text.startswith("#"):
+            self.setFormat(0, len(text), self._formats["header"])
+            return
+        if text.startswith(">"):
+            self.setFormat(0, len(text), self._formats["quote"])
+            return
+        for pattern, kind in (
+            (r"~~[^~]+~~", "strike"),
+            (r"\*\*[^\*]+\*\*", "bold"),
+            (r"(?<!\*)\*[^\*]+\*(?!\*)", "italic"),
+            (r"`[^`]+`", "code"),
+            (r"\[([^\]]+)\]\([^\)]+\)", "link"),
+        ):
+            for match in re.finditer(pattern, text):
+                self.setFormat(
+                    match.start(), match.end() - match.start(), self._formats[kind]
+                )
+        if re.match(r"^\s*([-*+]|\d+\.)\s", text):
+            task_match = re.search(r"^\s*[-*+]\s+\[[ xX]\]", text)
+            if task_match:
+                self.setFormat(0, task_match.end(), self._formats["task"])
+            else:
+                bullet_match = re.match(r"^\s*([-*+]|\d+\.)", text)
+                if bullet_match:
+                    self.setFormat(0, bullet_match.end(), self._formats["list"])
+
+
+def measure(highlighter_class, text: str, repeat: int = 3) -> float:
+    """Best blocks per second over ``repeat`` rehighlights."""
+    doc = QTextDocument()
+    doc.setPlainText(text)
+    highlighter = highlighter_class(doc)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        highlighter.rehighlight()
+        best = min(best, time.perf_counter() - start)
+    return doc.blockCount() / best
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    rng = random.Random(0)
+    text = "\n".join(rng.choice(LINES) for _ in range(count))
+    app = QGuiApplication.instance() or QGuiApplication([])  # noqa: F841
+    for label, highlighter_class in (
+        ("before", BaselineHighlighter),
+        ("after", MarkdownHighlighter),
+    ):
+        rate = measure(highlighter_class, text)
+        print(f"{label:8} {rate:10,.0f} blocks/s")
+    sys.stdout.flush()
+    # Tearing down would release the pinned references along with the ones
+    # PySide6 already dropped
+    os._exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Summary vs full project queries: bytes handed to QML and time taken.
+
+Run with ``python tests/bench_project_summary.py [projects] [markdown_kib]``.
+Defaults to 5,000 projects with 20 KB of markdown each.
+"""
+
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.database import Database, Project, summary_query  # noqa: E402
+
+
+def populate(db: Database, count: int, markdown_bytes: int) -> None:
+    half = "x" * (markdown_bytes // 2)
+    now = datetime.now()
+    session = db.get_session()
+    try:
+        session.bulk_insert_mappings(
+            Project,
+            [
+                {
+                    "id": f"p{i:05d}",
+                    "title": f"Project {i}",
+                    "headline": "Headline",
+                    "client_name": f"Client {i % 50}",
+                    "status": "active" if i % 3 else "completed",
+                    "tags": ["a", "b"],
+                    "details_markdown": half,
+                    "tasks_markdown": half,
+                    "created_at": now - timedelta(minutes=i),
+                    "updated_at": now - timedelta(minutes=i),
+                }
+                for i in range(count)
+            ],
+        )
+        session.commit()
+    finally:
+        session.close()
+
+
+def measure(db: Database, summary: bool, repeat: int = 5) -> tuple[float, int]:
+    best = float("inf")
+    payload = 0
+    for _ in range(repeat):
+        session = db.get_session()
+        try:
+            start = time.perf_counter()
+            query = summary_query(session) if summary else session.query(Project)
+            rows = query.order_by(Project.updated_at.desc()).all()
+            data = [p.to_dict(include_markdown=not summary) for p in rows]
+            best = min(best, time.perf_counter() - start)
+        finally:
+            session.close()
+        payload = len(json.dumps(data).encode())
+    return best * 1000, payload
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    markdown_kib = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(db_path=Path(tmp) / "bench.db")
+        populate(db, count, markdown_kib * 1024)
+        for label, summary in (("full", False), ("summary", True)):
+            ms, payload = measure(db, summary)
+            print(f"{label:8} {ms:8.1f} ms  {payload / 1024 / 1024:8.2f} MiB")
+        db.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""Task object layouts: memory and time to load, list and save, before and after.
+
+"before" is the original ``Task``, a plain dataclass holding an ISO string
+and converted with ``dataclasses.asdict``; "after" is the slotted ``Task``
+holding epoch seconds. Both load the same rows from SQLite, turn them into
+what ``getTasks()`` hands to QML, and save them back.
+
+Run with ``python tests/bench_tasks.py [tasks]``. Defaults to 200,000 tasks.
+"""
+
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import delete, insert  # noqa: E402
+
+from src.database import Database, TaskRecord  # noqa: E402
+from src.tasks import Task, tasks_query  # noqa: E402
+
+
+@dataclass
+class BaselineTask:
+    """``Task`` as it was before the slotted layout."""
+
+    id: str
+    title: str
+    description: str
+    completed: bool
+    created_at: str
+    pomodoros_completed: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_record(cls, record: Any) -> "BaselineTask":
+        return cls(
+            id=record.id,
+            title=record.title,
+            description=record.description or "",
+            completed=bool(record.completed),
+            created_at=record.created_at.isoformat(),
+            pomodoros_completed=record.pomodoros_completed or 0,
+        )
+
+    def to_row(self) -> dict[str, Any]:
+        row = self.to_dict()
+        row["created_at"] = datetime.fromisoformat(self.created_at)
+        return row
+
+
+def _task_to_row(task: Task) -> dict[str, Any]:
+    return {
+        "id": task.id,
+        "title": task.title,
+        "description": task.description,
+        "completed": task.completed,
+        "created_at": datetime.fromtimestamp(task.created_at),
+        "pomodoros_completed": task.pomodoros_completed,
+    }
+
+
+LAYOUTS: dict[str, tuple[Callable[[Any], Any], Callable[[Any], dict[str, Any]]]] = {
+    "before": (BaselineTask.from_record, BaselineTask.to_row),
+    "after": (Task.from_record, _task_to_row),
+}
+
+
+def populate(db: Database, count: int) -> None:
+    now = datetime.now()
+    session = db.get_session()
+    try:
+        session.execute(
+            insert(TaskRecord),
+            [
+                {
+                    "id": f"t{i:07d}",
+                    "title": f"Task {i}",
+                    "description": "Some notes" if i % 2 else "",
+                    "completed": i % 3 == 0,
+                    "created_at": now - timedelta(seconds=i),
+                    "pomodoros_completed": i % 5,
+                }
+                for i in range(count)
+            ],
+        )
+        session.commit()
+    finally:
+        session.close()
+
+
+def measure(db: Database, layout: str) -> dict[str, float]:
+    from_record, to_row = LAYOUTS[layout]
+    session = db.get_session()
+    try:
+        start = time.perf_counter()
+        rows = session.execute(tasks_query()).all()
+        tasks = [from_record(row) for row in rows]
+        load = time.perf_counter() - start
+
+        # Again under tracemalloc, counting the objects but not their rows
+        del tasks
+        tracemalloc.start()
+        tasks = [from_record(row) for row in rows]
+        held, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del rows
+
+        start = time.perf_counter()
+        payload = [task.to_dict() for task in tasks]
+        get_tasks = time.perf_counter() - start
+        del payload
+
+        start = time.perf_counter()
+        session.execute(delete(TaskRecord))
+        session.execute(insert(TaskRecord), [to_row(task) for task in tasks])
+        session.commit()
+        save = time.perf_counter() - start
+    finally:
+        session.close()
+    return {
+        "bytes": held / len(tasks),
+        "load": load * 1000,
+        "get_tasks": get_tasks * 1000,
+        "save": save * 1000,
+    }
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(db_path=Path(tmp) / "bench.db")
+        populate(db, count)
+        print(f"{'':8} {'B/task':>8} {'load ms':>10} {'getTasks ms':>12} {'save ms':>10}")
+        for layout in LAYOUTS:
+            result = measure(db, layout)
+            print(
+                f"{layout:8} {result['bytes']:8.0f} {result['load']:10.1f}"
+                f" {result['get_tasks']:12.1f} {result['save']:10.1f}"
+            )
+        db.dispose()
+
+
+if __name__ == "__main__":
+    main()
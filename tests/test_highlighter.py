@@ -0,0 +1,296 @@
+import pytest
+import shiboken6
+from PySide6.QtCore import QEvent
+from PySide6.QtGui import QTextCharFormat, QTextCursor, QTextDocument
+
+from src.highlighter import (
+    STATE_COMMENT,
+    STATE_FENCE_BACKTICK,
+    STATE_FENCE_TILDE,
+    STATE_FRONT_MATTER,
+    STATE_NORMAL,
+    HighlighterRegistry,
+    IncrementalMarkdownHighlighter,
+    MarkdownHighlighter,
+    shared_formats,
+)
+
+
+LETTERS = {
+    "header": "h",
+    "bold": "b",
+    "italic": "i",
+    "code": "c",
+    "list": "-",
+    "link": "l",
+    "quote": "q",
+    "task": "t",
+    "comment": "!",
+    "meta": "m",
+    "strike": "s",
+}
+# The state of each block as a letter: normal, comment, front matter and
+# inside a backtick or tilde fence
+STATE_LETTERS = {STATE_NORMAL: ".", STATE_COMMENT: "!", STATE_FRONT_MATTER: "m"}
+STATE_LETTERS.update({STATE_FENCE_BACKTICK: "`", STATE_FENCE_TILDE: "~"})
+
+
+def _block_kinds(block) -> str:
+    """One letter per character: the format kind it got, or ``.``."""
+    kinds = ["."] * len(block.text())
+    for span in block.layout().formats():
+        format_ = span.format
+        letter = next(
+            LETTERS[kind] for kind, known in shared_formats().items() if known == format_
+        )
+        kinds[span.start:span.start + span.length] = letter * span.length
+    return "".join(kinds)
+
+
+def _highlight_text(qapp, text: str, highlighter_class=MarkdownHighlighter):
+    """Each block's kinds joined by ``|``, and one letter per block state."""
+    doc = QTextDocument()
+    doc.setPlainText(text)
+    if highlighter_class is MarkdownHighlighter:
+        MarkdownHighlighter(doc).rehighlight()
+    else:
+        _highlight_all(qapp, doc)
+    kinds, states = [], []
+    block = doc.begin()
+    while block.isValid():
+        kinds.append(_block_kinds(block))
+        states.append(STATE_LETTERS[block.userState() & 0xF])
+        block = block.next()
+    return "|".join(kinds), "".join(states)
+
+
+def _kinds(qapp, line: str) -> str:
+    return _highlight_text(qapp, line)[0]
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        # Code overrides emphasis that crosses into it
+        ("x*`xb[])*`#", ".icccccccc."),
+        ("**a `b` c**", "bbbbcccbbbb"),
+        # A link overrides the code and emphasis inside it
+        ("[`x`](u) *[a](b)*", "llllllll.illlllli"),
+        ("~~a **b** c~~", "ssssbbbbbssss"),
+    ],
+)
+def test_inline_precedence(qapp, line, expected):
+    assert _kinds(qapp, line) == expected
+
+
+def _geometry(doc: QTextDocument) -> list:
+    layout = doc.documentLayout()
+    geometry = []
+    block = doc.begin()
+    while block.isValid():
+        lines = block.layout()
+        geometry.append((
+            layout.blockBoundingRect(block).y(),
+            [(lines.lineAt(i).y(), lines.lineAt(i).height(), lines.lineAt(i).textLength())
+             for i in range(lines.lineCount())],
+        ))
+        block = block.next()
+    return geometry
+
+
+def _wait_until_idle(qapp, highlighter) -> None:
+    # QSyntaxHighlighter is done before returning; a small document is
+    # done before the incremental highlighter's constructor returns
+    if isinstance(highlighter, IncrementalMarkdownHighlighter):
+        while highlighter._timer.isActive():
+            qapp.processEvents()
+
+
+def _highlight_all(
+    qapp, doc: QTextDocument, highlighter_class=IncrementalMarkdownHighlighter, **kwargs
+):
+    highlighter = highlighter_class(doc, **kwargs)
+    _wait_until_idle(qapp, highlighter)
+    return highlighter
+
+
+def test_incremental_layout_matches_full_relayout(qapp):
+    paragraph = "Text with **bold**, *italic*, `code` and [a link](u). " * 4
+    lines = [paragraph] * 200
+    lines[0] = lines[100] = lines[160] = "## A heading"
+    doc = QTextDocument()
+    doc.setPlainText("\n".join(lines))
+    doc.setTextWidth(400)
+    doc.size()
+
+    _highlight_all(qapp, doc, budget_ms=2)
+
+    # Reformatted blocks were handed to the document layout
+    assert all(lines for _, lines in _geometry(doc))
+    assert doc.findBlockByNumber(1).layout().formats()
+    geometry = _geometry(doc)
+    doc.markContentsDirty(0, doc.characterCount() - 1)
+    assert _geometry(doc) == geometry
+
+
+def test_background_pass_leaves_no_pending_change(qapp):
+    # Qt records setFormats as a document change; one left pending would
+    # make the next edit relayout and rehighlight everything before it
+    doc = QTextDocument()
+    doc.setPlainText("\n".join(["Text with **bold** and `code`."] * 400))
+    doc.setTextWidth(400)
+    doc.size()
+    _highlight_all(qapp, doc, budget_ms=2)
+    changes = []
+    doc.contentsChange.connect(lambda *change: changes.append(change))
+
+    block = doc.findBlockByNumber(300)
+    QTextCursor(block).insertText("x")
+
+    assert changes == [(block.position(), 0, 1)]
+
+
+HIGHLIGHTERS = pytest.mark.parametrize(
+    "highlighter_class", [MarkdownHighlighter, IncrementalMarkdownHighlighter]
+)
+
+
+@HIGHLIGHTERS
+@pytest.mark.parametrize(
+    "text, kinds, states",
+    [
+        ("```\n**b**\n```\n**b**", "ccc|ccccc|ccc|bbbbb", "``.."),
+        ("~~~\n**b**\n~~~\n**b**", "ccc|ccccc|ccc|bbbbb", "~~.."),
+        # Only a fence of the same character closes
+        ("```\n**b**\n~~~\n**b**", "ccc|ccccc|ccc|ccccc", "````"),
+        ("~~~\n**b**\n```\n**b**", "ccc|ccccc|ccc|ccccc", "~~~~"),
+        # and at least as long, with nothing after it
+        ("````\n**b**\n```\n**b**", "cccc|ccccc|ccc|ccccc", "````"),
+        ("```\n**b**\n`````\n**b**", "ccc|ccccc|ccccc|bbbbb", "``.."),
+        ("```\n**b**\n``` x\n**b**", "ccc|ccccc|ccccc|ccccc", "````"),
+        # An info string is allowed on the opening fence only
+        ("```py\n**b**\n```\n**b**", "ccccc|ccccc|ccc|bbbbb", "``.."),
+        # Backticks after the opening make it inline code instead
+        ("```x```\n**b**", "..ccc..|bbbbb", ".."),
+    ],
+)
+def test_fences(qapp, highlighter_class, text, kinds, states):
+    assert _highlight_text(qapp, text, highlighter_class) == (kinds, states)
+
+
+@HIGHLIGHTERS
+@pytest.mark.parametrize(
+    "text, kinds, states",
+    [
+        # Opened and closed on one line, with markup on either side
+        ("a <!-- b --> **c**", ".." + "!" * 10 + "." + "b" * 5, "."),
+        ("*a*<!-- b -->*c*", "iii" + "!" * 10 + "iii", "."),
+        ("<!-- a --> <!-- b\nc", "!" * 10 + "." + "!" * 6 + "|!", "!!"),
+        # Carried over lines until it closes mid-line
+        ("a <!-- b\n*c*\nd --> *e*", "..!!!!!!|!!!|!!!!!.iii", "!!."),
+    ],
+)
+def test_comments(qapp, highlighter_class, text, kinds, states):
+    assert _highlight_text(qapp, text, highlighter_class) == (kinds, states)
+
+
+@HIGHLIGHTERS
+@pytest.mark.parametrize(
+    "text, kinds, states",
+    [
+        ("---\ntitle: *x*\n---\n*a*", "mmm|mmmmmmmmmm|mmm|iii", "mm.."),
+        ("---\ntitle: *x*\n...\n*a*", "mmm|mmmmmmmmmm|mmm|iii", "mm.."),
+        ("---\ntitle: *x*", "mmm|mmmmmmmmmm", "mm"),
+        # Only at the top of the document
+        ("*a*\n---\ntitle: *x*", "iii|...|.......iii", "..."),
+    ],
+)
+def test_front_matter(qapp, highlighter_class, text, kinds, states):
+    assert _highlight_text(qapp, text, highlighter_class) == (kinds, states)
+
+
+@HIGHLIGHTERS
+def test_fence_edits_rehighlight_only_the_blocks_that_flip(qapp, highlighter_class):
+    highlighted: list[int] = []
+
+    class Recording(highlighter_class):
+        def highlightBlock(self, text):
+            highlighted.append(self.currentBlock().blockNumber())
+            super().highlightBlock(text)
+
+    lines = ["Some *text*"] * 300
+    # A fenced block further down, whose info string means its opening
+    # line can't close a fence opened above it
+    lines[30:41] = ["```python"] + ["code"] * 9 + ["```"]
+    doc = QTextDocument()
+    doc.setPlainText("\n".join(lines))
+    # Edits are only reported once the document has a layout, as it does
+    # in an editor
+    doc.documentLayout()
+    if highlighter_class is MarkdownHighlighter:
+        highlighter = Recording(doc)
+        highlighter.rehighlight()
+    else:
+        highlighter = _highlight_all(qapp, doc, highlighter_class=Recording)
+    assert doc.findBlockByNumber(20).userState() == STATE_NORMAL
+
+    # Open a fence at block 10: the blocks down to the existing fence
+    # flip into it, the existing fence's opening keeps its state
+    highlighted.clear()
+    cursor = QTextCursor(doc.findBlockByNumber(10))
+    cursor.insertText("```\n")
+    _wait_until_idle(qapp, highlighter)
+    assert highlighted == list(range(10, 32))
+    assert doc.findBlockByNumber(20).userState() & 0xF == STATE_FENCE_BACKTICK
+    assert _block_kinds(doc.findBlockByNumber(20)) == "c" * len("Some *text*")
+
+    # Close it again by removing it
+    highlighted.clear()
+    cursor = QTextCursor(doc.findBlockByNumber(10))
+    cursor.movePosition(QTextCursor.MoveOperation.NextBlock, QTextCursor.MoveMode.KeepAnchor)
+    cursor.removeSelectedText()
+    _wait_until_idle(qapp, highlighter)
+    assert highlighted == list(range(10, 31))
+    assert doc.findBlockByNumber(20).userState() == STATE_NORMAL
+    assert _block_kinds(doc.findBlockByNumber(20)) == ".....iiiiii"
+
+
+def test_registry_keeps_one_highlighter_per_document(qapp):
+    registry = HighlighterRegistry()
+    counts = []
+    registry.countChanged.connect(lambda: counts.append(registry.count))
+    doc, other = QTextDocument(), QTextDocument()
+
+    highlighter = registry.attach(doc)
+    assert registry.attach(doc) is highlighter
+    assert registry.get(doc) is highlighter
+    assert registry.attach(other) is not highlighter
+    assert registry.count == 2
+    assert counts == [1, 2]
+
+
+def test_registry_forgets_destroyed_documents(qapp):
+    registry = HighlighterRegistry()
+    doc, other = QTextDocument(), QTextDocument()
+    registry.attach(doc)
+    registry.attach(other)
+
+    shiboken6.delete(doc)
+    assert registry.count == 1
+    other.deleteLater()
+    qapp.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    assert registry.count == 0
+
+
+def test_shared_formats_are_read_only(qapp):
+    formats = shared_formats()
+    with pytest.raises(TypeError):
+        formats["bold"] = QTextCharFormat()
+    with pytest.raises(TypeError):
+        del formats["bold"]
+    assert shared_formats() is formats
+
+    # Every highlighter uses the one table
+    registry = HighlighterRegistry()
+    docs = [QTextDocument(), QTextDocument()]
+    assert all(registry.attach(doc)._formats is formats for doc in docs)
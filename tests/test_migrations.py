@@ -0,0 +1,134 @@
+from datetime import datetime
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Connection
+
+from src import migrations
+from src.database import Database, Project, encode_cursor, project_page, set_project_tags
+
+
+def _rebuild_projects(conn: Connection) -> None:
+    create_sql = conn.exec_driver_sql(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'projects'"
+    ).scalar()
+    columns = sorted(migrations.column_names(conn, "projects"))
+    migrations.rebuild_table(
+        conn,
+        "projects",
+        create_sql.replace("CREATE TABLE projects", "CREATE TABLE projects_new", 1),
+        columns,
+    )
+
+
+def _names(db: Database, kind: str) -> set[str]:
+    with db.engine.connect() as conn:
+        rows = conn.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type = ? AND tbl_name = 'projects'",
+            (kind,),
+        )
+        return {row[0] for row in rows}
+
+
+def _search(db: Database, word: str) -> list[str]:
+    with db.engine.connect() as conn:
+        rows = conn.exec_driver_sql(
+            "SELECT p.id FROM projects_fts JOIN projects p "
+            "ON p.rowid = projects_fts.rowid WHERE projects_fts MATCH ?",
+            (word,),
+        )
+        return [row[0] for row in rows]
+
+
+def test_rebuild_table_keeps_dependents(tmp_path, monkeypatch):
+    path = tmp_path / "pomcraft.db"
+    db = Database(db_path=path)
+    session = db.get_session()
+    for i in range(3):
+        session.add(
+            Project(id=f"p{i}", title=f"Project {i}", details_markdown=f"word{i}")
+        )
+    session.flush()
+    set_project_tags(session, "p1", ["red", "blue"])
+    session.commit()
+    session.close()
+    triggers = _names(db, "trigger")
+    indexes = _names(db, "index")
+    assert triggers and indexes
+    db.dispose()
+
+    monkeypatch.setattr(
+        migrations, "MIGRATIONS", migrations.MIGRATIONS + [_rebuild_projects]
+    )
+    db = Database(db_path=path)
+    try:
+        assert db.schema_version == len(migrations.MIGRATIONS)
+        with db.engine.connect() as conn:
+            assert conn.exec_driver_sql("SELECT count(*) FROM project_tags").scalar() == 2
+            assert conn.exec_driver_sql("PRAGMA foreign_keys").scalar() == 1
+        assert _names(db, "trigger") == triggers
+        assert _names(db, "index") == indexes
+        assert _search(db, "word2") == ["p2"]
+
+        # The recreated triggers keep the search index in step
+        session = db.get_session()
+        session.get(Project, "p0").details_markdown = "changed"
+        session.commit()
+        session.close()
+        assert _search(db, "changed") == ["p0"]
+        assert _search(db, "word0") == []
+    finally:
+        db.dispose()
+
+
+def test_rebuild_table_refuses_foreign_keys_on(db):
+    with db.engine.connect() as conn:
+        try:
+            _rebuild_projects(conn)
+        except RuntimeError:
+            pass
+        else:
+            raise AssertionError("rebuild ran with foreign keys on")
+
+
+def test_projects_without_updated_at_are_backfilled(tmp_path):
+    path = tmp_path / "pomcraft.db"
+    db = Database(db_path=path)
+    db.dispose()
+    # The projects table as it was before updated_at became NOT NULL
+    engine = create_engine(f"sqlite:///{path}")
+    with engine.begin() as conn:
+        create_sql = conn.exec_driver_sql(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'projects'"
+        ).scalar()
+        migrations.rebuild_table(
+            conn,
+            "projects",
+            create_sql.replace("CREATE TABLE projects", "CREATE TABLE projects_new", 1)
+            .replace("updated_at DATETIME NOT NULL", "updated_at DATETIME"),
+            sorted(migrations.column_names(conn, "projects")),
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO projects (id, title, created_at, updated_at) VALUES "
+            "('p0', 'Old', '2024-03-01 09:00:00.000000', NULL), "
+            "('p1', 'Newer', '2024-03-02 09:00:00.000000', '2024-03-05 09:00:00.000000')"
+        )
+        conn.exec_driver_sql(f"PRAGMA user_version = {migrations.SCHEMA_VERSION - 1}")
+    engine.dispose()
+
+    db = Database(db_path=path)
+    try:
+        with db.engine.connect() as conn:
+            rows = conn.exec_driver_sql("PRAGMA table_info(projects)").fetchall()
+            assert [row[3] for row in rows if row[1] == "updated_at"] == [1]
+        session = db.get_session()
+        try:
+            first, cursor = project_page(session, limit=1)
+            rest, _ = project_page(session, after=cursor, limit=1)
+            assert [p.id for p in first + rest] == ["p1", "p0"]
+            assert rest[0].updated_at == datetime(2024, 3, 1, 9)
+            assert encode_cursor(rest[0]) == "2024-03-01T09:00:00|p0"
+        finally:
+            session.close()
+        assert _names(db, "index") >= {"ix_projects_updated_at", "ix_projects_client_name"}
+    finally:
+        db.dispose()
@@ -0,0 +1,165 @@
+import itertools
+import shutil
+import subprocess
+import time
+
+import pytest
+import shiboken6
+
+QtDBus = pytest.importorskip("PySide6.QtDBus")
+
+from src.notifications import PORTAL_INTERFACE, PORTAL_PATH, NotificationDispatcher  # noqa: E402
+
+STAND_IN_SERVICE = "org.example.StandInNotifications"
+_bus_ids = itertools.count()
+
+if shutil.which("dbus-daemon") is None:
+    pytest.skip("dbus-daemon is not installed", allow_module_level=True)
+
+
+def _wait(qapp, predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out waiting for the notification"
+        qapp.processEvents()
+        time.sleep(0.002)
+
+
+class StandInDaemon(QtDBus.QDBusVirtualObject):
+    """Answers AddNotification calls and records when they arrived."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def introspect(self, path):
+        return ""
+
+    def handleMessage(self, message, connection):
+        notification_id, options = message.arguments()
+        self.calls.append((
+            message.interface(),
+            message.member(),
+            notification_id,
+            options.currentSignature(),
+            time.monotonic(),
+        ))
+        connection.send(message.createReply())
+        return True
+
+
+@pytest.fixture
+def bus(qapp):
+    """A private session bus with the stand-in daemon on it."""
+    daemon = subprocess.Popen(
+        ["dbus-daemon", "--session", "--nofork", "--print-address=1"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    address = daemon.stdout.readline().strip()
+    names = [f"{role}-{next(_bus_ids)}" for role in ("stand-in", "dispatcher")]
+    server = QtDBus.QDBusConnection.connectToBus(address, names[0])
+    client = QtDBus.QDBusConnection.connectToBus(address, names[1])
+    stand_in = StandInDaemon()
+    assert server.registerService(STAND_IN_SERVICE)
+    assert server.registerVirtualObject(PORTAL_PATH, stand_in)
+    dispatchers = []
+
+    def make_dispatcher(service=STAND_IN_SERVICE, notify_send="/nonexistent/notify-send"):
+        dispatcher = NotificationDispatcher(
+            bus=client, service=service, notify_send=notify_send
+        )
+        sent = []
+        dispatcher.sent.connect(lambda title, body: sent.append((title, body)))
+        dispatchers.append(dispatcher)
+        return dispatcher, sent
+
+    yield make_dispatcher, stand_in
+    # Dispatchers go before the connection they use
+    for dispatcher in dispatchers:
+        shiboken6.delete(dispatcher)
+    server.unregisterObject(PORTAL_PATH)
+    for name in names:
+        QtDBus.QDBusConnection.disconnectFromBus(name)
+    daemon.terminate()
+    daemon.wait()
+
+
+@pytest.fixture
+def fake_notify_send(tmp_path):
+    """A notify-send that appends its arguments to a file."""
+    output = tmp_path / "notify-send.out"
+    script = tmp_path / "notify-send"
+    script.write_text(f'#!/bin/sh\nprintf "%s|" "$@" >> "{output}"\necho >> "{output}"\n')
+    script.chmod(0o755)
+    return str(script), output
+
+
+def test_sends_through_the_portal_asynchronously(qapp, bus):
+    make_dispatcher, stand_in = bus
+    dispatcher, sent = make_dispatcher()
+
+    dispatcher.notify("PomCraft", "Focus session complete")
+    # Nothing waited for the daemon
+    assert stand_in.calls == [] and sent == []
+
+    _wait(qapp, lambda: sent)
+    assert sent == [("PomCraft", "Focus session complete")]
+    [(interface, member, notification_id, signature, _)] = stand_in.calls
+    assert (interface, member) == (PORTAL_INTERFACE, "AddNotification")
+    assert notification_id == "pomcraft-1"
+    assert signature == "a{sv}"
+
+
+def test_sends_are_rate_limited(qapp, bus, monkeypatch):
+    monkeypatch.setattr(NotificationDispatcher, "MIN_INTERVAL_MS", 200)
+    make_dispatcher, stand_in = bus
+    dispatcher, sent = make_dispatcher()
+
+    for i in range(3):
+        dispatcher.notify("PomCraft", f"Session {i}")
+    _wait(qapp, lambda: len(sent) == 3)
+
+    assert sent == [("PomCraft", f"Session {i}") for i in range(3)]
+    arrivals = [call[-1] for call in stand_in.calls]
+    assert all(b - a >= 0.19 for a, b in zip(arrivals, arrivals[1:]))
+
+
+def test_queue_drops_the_oldest_and_duplicates(qapp, bus, monkeypatch):
+    monkeypatch.setattr(NotificationDispatcher, "MIN_INTERVAL_MS", 20)
+    limit = NotificationDispatcher.MAX_QUEUED
+    make_dispatcher, _ = bus
+    dispatcher, sent = make_dispatcher()
+
+    bodies = [f"Session {i}" for i in range(limit + 3)]
+    for body in bodies:
+        dispatcher.notify("PomCraft", body)
+    dispatcher.notify("PomCraft", bodies[-1])
+    _wait(qapp, lambda: len(sent) == limit + 1)
+    # Give anything left over the chance to arrive
+    _wait(qapp, lambda: not dispatcher._timer.isActive())
+    qapp.processEvents()
+
+    # The first went out at once; of the rest only the newest fit the queue
+    assert [body for _, body in sent] == [bodies[0]] + bodies[-limit:]
+
+
+def test_falls_back_to_notify_send_when_the_portal_fails(
+    qapp, bus, fake_notify_send, monkeypatch
+):
+    monkeypatch.setattr(NotificationDispatcher, "MIN_INTERVAL_MS", 20)
+    make_dispatcher, _ = bus
+    script, output = fake_notify_send
+    dispatcher, sent = make_dispatcher(service="org.example.Missing", notify_send=script)
+
+    dispatcher.notify("PomCraft", "Break over")
+    dispatcher.notify("PomCraft", "Back to work")
+    _wait(qapp, lambda: len(sent) == 2)
+    _wait(qapp, lambda: output.exists() and len(output.read_text().splitlines()) == 2)
+
+    lines = sorted(output.read_text().splitlines())
+    assert lines == [
+        "--app-name|PomCraft|PomCraft|Back to work|",
+        "--app-name|PomCraft|PomCraft|Break over|",
+    ]
@@ -0,0 +1,107 @@
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.database import Database, Project
+from src.projects import ProjectsBackend
+from src.projects_model import ProjectsListModel
+from src.workers import DatabaseWorker
+
+
+def _wait(qapp, predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out waiting for the worker"
+        qapp.processEvents()
+        time.sleep(0.002)
+
+
+@pytest.fixture
+def model(qapp, db):
+    start = datetime(2024, 1, 1)
+    session = db.get_session()
+    session.add_all(
+        Project(
+            id=f"p{i:03}",
+            title=f"Project {i}",
+            details_markdown=f"details {i}",
+            created_at=start,
+            updated_at=start + timedelta(minutes=i),
+        )
+        for i in range(250)
+    )
+    session.commit()
+    session.close()
+
+    worker = DatabaseWorker(read_threads=1)
+    model = ProjectsListModel(db, worker)
+    yield model
+    worker.shutdown()
+
+
+def test_pages_load_in_the_background(qapp, model):
+    # Nothing is queried on the GUI thread while the model is constructed
+    assert model.rowCount() == 0
+    assert model.property("loading")
+
+    _wait(qapp, lambda: not model.property("loading"))
+    assert model.rowCount() == ProjectsListModel.PAGE_SIZE
+    assert model.get(0)["id"] == "p249"
+
+    while model.canFetchMore():
+        model.fetchMore()
+        # A second call while the page is in flight doesn't load it twice
+        model.fetchMore()
+        _wait(qapp, lambda: not model.property("loading"))
+    assert model.rowCount() == 250
+    assert len({model.get(row)["id"] for row in range(250)}) == 250
+
+
+def test_updates_and_markdown_arrive_asynchronously(qapp, db, model):
+    _wait(qapp, lambda: not model.property("loading"))
+
+    session = db.get_session()
+    session.get(Project, "p150").title = "Renamed"
+    session.commit()
+    session.close()
+
+    model.onProjectUpdated("p150")
+    assert model.get(0)["id"] == "p249"
+    _wait(qapp, lambda: model.get(0)["id"] == "p150")
+    assert model.get(0)["title"] == "Renamed"
+
+    index = model.index(0, 0)
+    role = ProjectsListModel.DetailsMarkdownRole
+    assert model.data(index, role) == ""
+    _wait(qapp, lambda: model.data(index, role) == "details 150")
+
+
+def test_status_filter_reloads(qapp, db, model):
+    _wait(qapp, lambda: not model.property("loading"))
+    session = db.get_session()
+    session.get(Project, "p010").status = "completed"
+    session.commit()
+    session.close()
+
+    model.setProperty("statusFilter", "completed")
+    _wait(qapp, lambda: not model.property("loading"))
+    assert [model.get(row)["id"] for row in range(model.rowCount())] == ["p010"]
+
+
+def test_markdown_edits_to_unknown_projects_are_refused(qapp, db, model, monkeypatch):
+    monkeypatch.setattr(Database, "_instance", db)
+    worker = DatabaseWorker(read_threads=1)
+    backend = ProjectsBackend(worker=worker)
+    try:
+        assert not backend.updateProjectMarkdown("missing", "details", "lost")
+        assert not backend.updateProjectMarkdown("p001", "notes", "lost")
+        assert backend.property("pendingWrites") == 0
+
+        assert backend.updateProjectMarkdown("p001", "details", "first")
+        assert backend.updateProjectMarkdown("p001", "details", "second")
+        backend.flush()
+        _wait(qapp, lambda: backend.property("pendingWrites") == 0)
+        assert backend.getProject("p001")["details_markdown"] == "second"
+    finally:
+        backend.shutdown()
@@ -0,0 +1,70 @@
+"""The queries the app runs on hot paths must be served by an index.
+
+The statements are built by the same functions the backends call and
+compiled as they would be executed, so the check follows the code.
+"""
+
+from src.database import Project, page_query, projects_query, summary_query
+from src.project_tasks import project_task_counts_query, project_tasks_query
+from src.stats import (
+    day_summary_query,
+    focus_by_project_day_query,
+    focus_per_week_query,
+    recent_sessions_query,
+)
+from src.tasks import task_page_query, tasks_query
+
+
+def hot_queries(session):
+    return {
+        "projects_by_updated": projects_query(session),
+        "projects_by_status": projects_query(session, "active"),
+        "project_by_id": summary_query(session).filter(Project.id == "x"),
+        "projects_page": page_query(session, status="active"),
+        "projects_page_after": page_query(
+            session, after="2024-01-01T00:00:00|x", status="active"
+        ),
+        "projects_page_client": page_query(session, client_name="Acme"),
+        "tasks": tasks_query(),
+        "tasks_page": task_page_query(),
+        "tasks_page_after": task_page_query("2024-01-01T00:00:00|x"),
+        "project_tasks": project_tasks_query("x"),
+        "project_task_counts": project_task_counts_query("x"),
+        "focus_by_project_day": focus_by_project_day_query("2024-01-01"),
+        "focus_per_week": focus_per_week_query("2024-01-01"),
+        "day_summary": day_summary_query("2024-01-01"),
+        "recent_sessions": recent_sessions_query(50),
+    }
+
+
+def lookup_queries(session):
+    """Queries that find their rows by index and then sort only those."""
+    return {
+        "projects_page_any_tag": page_query(
+            session, tags=["a", "b"], match_all=False
+        ),
+        "projects_page_all_tags": page_query(session, tags=["a", "b"]),
+        "tasks_by_id": tasks_query(["a", "b"]),
+    }
+
+
+def test_hot_queries_use_indexes(db):
+    session = db.get_session()
+    try:
+        queries = hot_queries(session)
+        lookups = lookup_queries(session)
+    finally:
+        session.close()
+    assert db.unindexed_queries(queries) == {}
+    assert db.unindexed_queries(lookups, allow_sort=True) == {}
+
+
+def test_unindexed_query_is_reported(db):
+    session = db.get_session()
+    try:
+        query = summary_query(session).filter(Project.headline == "x")
+    finally:
+        session.close()
+    assert "scan" in db.unindexed_queries({"scan": query}, allow_sort=True)
+    sorted_lookup = tasks_query(["a", "b"])
+    assert "sort" in db.unindexed_queries({"sort": sorted_lookup})
@@ -0,0 +1,127 @@
+from datetime import datetime
+
+from sqlalchemy import select
+
+from src.database import DailySessionStat, SessionEvent, WeeklySessionStat
+from src.stats import (
+    day_summary_query,
+    focus_by_project_day_query,
+    focus_per_week_query,
+    record_session_event,
+)
+
+
+def record(db, *events):
+    session = db.get_session()
+    try:
+        for event, session_type, seconds, project_id, occurred_at in events:
+            record_session_event(
+                session,
+                event,
+                session_type,
+                seconds,
+                project_id,
+                occurred_at=datetime.fromisoformat(occurred_at),
+            )
+        session.commit()
+    finally:
+        session.close()
+
+
+def rollups(db, model):
+    session = db.get_session()
+    try:
+        period = model.day if model is DailySessionStat else model.week
+        rows = session.execute(
+            select(
+                model.session_type,
+                period,
+                model.project_id,
+                model.seconds,
+                model.completed,
+                model.skipped,
+            ).order_by(model.session_type, period, model.project_id)
+        )
+        return [tuple(row) for row in rows]
+    finally:
+        session.close()
+
+
+def test_rollups_follow_start_pause_skip_and_complete(db):
+    record(db, ("start", "work", 0, "p1", "2024-03-12T09:00:00"))
+    # A start credits nothing
+    assert rollups(db, DailySessionStat) == []
+
+    record(
+        db,
+        ("pause", "work", 600, "p1", "2024-03-12T09:10:00"),
+        ("start", "work", 0, "p1", "2024-03-12T09:15:00"),
+        ("complete", "work", 900, "p1", "2024-03-12T09:30:00"),
+        ("start", "short_break", 0, None, "2024-03-12T09:30:00"),
+        ("complete", "short_break", 300, None, "2024-03-12T09:35:00"),
+        ("start", "work", 0, None, "2024-03-12T09:35:00"),
+        ("skip", "work", 120, None, "2024-03-12T09:37:00"),
+    )
+
+    assert rollups(db, DailySessionStat) == [
+        ("short_break", "2024-03-12", "", 300, 1, 0),
+        ("work", "2024-03-12", "", 120, 0, 1),
+        ("work", "2024-03-12", "p1", 1500, 1, 0),
+    ]
+    assert rollups(db, WeeklySessionStat) == [
+        ("short_break", "2024-03-11", "", 300, 1, 0),
+        ("work", "2024-03-11", "", 120, 0, 1),
+        ("work", "2024-03-11", "p1", 1500, 1, 0),
+    ]
+    session = db.get_session()
+    try:
+        assert len(session.scalars(select(SessionEvent)).all()) == 8
+        assert session.execute(day_summary_query("2024-03-12")).one() == (1620, 1, 1)
+    finally:
+        session.close()
+
+
+def test_weeks_start_on_monday(db):
+    record(
+        db,
+        ("complete", "work", 1500, "p1", "2024-03-11T08:00:00"),  # Monday
+        ("complete", "work", 1500, "p2", "2024-03-10T23:59:00"),  # Sunday
+        ("complete", "work", 1200, "p1", "2024-03-04T00:00:00"),  # Monday before
+        ("pause", "work", 300, "p2", "2024-03-17T12:00:00"),  # Sunday after
+    )
+
+    assert rollups(db, WeeklySessionStat) == [
+        ("work", "2024-03-04", "p1", 1200, 1, 0),
+        ("work", "2024-03-04", "p2", 1500, 1, 0),
+        ("work", "2024-03-11", "p1", 1500, 1, 0),
+        ("work", "2024-03-11", "p2", 300, 0, 0),
+    ]
+
+
+def test_focus_queries_are_ordered(db):
+    record(
+        db,
+        ("complete", "work", 1500, "p2", "2024-03-12T10:00:00"),
+        ("complete", "work", 1500, "p1", "2024-03-12T11:00:00"),
+        ("complete", "work", 600, "p1", "2024-03-05T10:00:00"),
+        ("complete", "short_break", 300, "p1", "2024-03-01T10:00:00"),
+        ("complete", "work", 900, "p3", "2024-02-20T10:00:00"),
+    )
+
+    session = db.get_session()
+    try:
+        by_day = session.execute(focus_by_project_day_query("2024-03-01")).all()
+        per_week = session.execute(focus_per_week_query("2024-02-01")).all()
+    finally:
+        session.close()
+
+    assert [tuple(row) for row in by_day] == [
+        ("2024-03-05", "p1", 600, 1),
+        ("2024-03-12", "p1", 1500, 1),
+        ("2024-03-12", "p2", 1500, 1),
+    ]
+    assert [tuple(row) for row in per_week] == [
+        ("2024-02-19", 900, 1),
+        ("2024-03-04", 600, 1),
+        ("2024-03-11", 3000, 2),
+    ]
@@ -0,0 +1,80 @@
+import json
+import multiprocessing
+from pathlib import Path
+
+import pytest
+
+from src.storage import JsonStore, fcntl
+
+WRITERS = 4
+UPDATES = 50
+
+
+def _default() -> dict:
+    return {"version": 1}
+
+
+def _write_keys(path: str, writer: int) -> None:
+    store = JsonStore(Path(path), _default)
+    for i in range(UPDATES):
+        store.update({f"w{writer}-{i}": i})
+
+
+def _read_raw(path: str, stop, reads) -> None:
+    # Reads without the lock: the rename must never expose a partial file
+    while not stop.is_set():
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            continue
+        if not isinstance(data, dict) or data.get("version") != 1:
+            raise AssertionError(f"unexpected content: {data!r}")
+        reads.value += 1
+
+
+@pytest.mark.skipif(fcntl is None, reason="needs fcntl locks")
+def test_concurrent_writers_lose_no_keys(tmp_path):
+    path = tmp_path / "settings.json"
+    ctx = multiprocessing.get_context("spawn")
+    stop = ctx.Event()
+    reads = ctx.Value("i", 0)
+    reader = ctx.Process(target=_read_raw, args=(str(path), stop, reads))
+    writers = [
+        ctx.Process(target=_write_keys, args=(str(path), writer))
+        for writer in range(WRITERS)
+    ]
+    reader.start()
+    for process in writers:
+        process.start()
+    for process in writers:
+        process.join(60)
+    stop.set()
+    reader.join(60)
+
+    assert [process.exitcode for process in writers] == [0] * WRITERS
+    assert reader.exitcode == 0
+    assert reads.value > 0
+
+    data = JsonStore(path, _default).load()
+    expected = {f"w{w}-{i}" for w in range(WRITERS) for i in range(UPDATES)}
+    assert expected - data.keys() == set()
+    assert data["version"] == 1
+    # No temp files are left behind
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "settings.json",
+        "settings.json.lock",
+    ]
+
+
+def test_changed_on_disk(tmp_path):
+    path = tmp_path / "settings.json"
+    mine = JsonStore(path, _default)
+    other = JsonStore(path, _default)
+    mine.update({"a": 1})
+    assert not mine.changed_on_disk()
+
+    other.update({"b": 2})
+    assert mine.changed_on_disk()
+    assert mine.load() == {"version": 1, "a": 1, "b": 2}
+    assert not mine.changed_on_disk()
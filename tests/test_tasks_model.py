@@ -0,0 +1,82 @@
+import pytest
+
+from src.database import Database
+from src.project_tasks import ProjectTasksBackend
+from src.tasks import TasksBackend
+from src.tasks_model import TasksListModel
+
+
+@pytest.fixture
+def backend(qapp, db, tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(Database, "_instance", db)
+    TasksBackend().addTasks([{"title": f"Task {i}"} for i in range(250)])
+    return TasksBackend()
+
+
+def _ids(model: TasksListModel) -> list[str]:
+    return [model.get(row)["id"] for row in range(model.rowCount())]
+
+
+def test_model_loads_pages(backend):
+    model = TasksListModel(backend._query_tasks, backend._query_task_page)
+    assert model.rowCount() == TasksListModel.PAGE_SIZE
+    assert model.get(0)["title"] == "Task 249"
+
+    while model.canFetchMore():
+        model.fetchMore()
+    assert model.rowCount() == 250
+    assert _ids(model) == [task["id"] for task in backend.getTasks()]
+
+
+def test_changes_apply_to_loaded_pages(backend):
+    model = backend.tasksModel
+    assert model.rowCount() == TasksListModel.PAGE_SIZE
+
+    backend.addTask("Newest")
+    assert model.get(0)["title"] == "Newest"
+
+    # Not loaded yet: picked up with its page instead
+    unloaded = backend.getTasks()[150]["id"]
+    backend.updateTask(unloaded, "Renamed", "")
+    while model.canFetchMore():
+        model.fetchMore()
+    assert model.rowCount() == 251
+    assert len(set(_ids(model))) == 251
+    assert model.get(150)["title"] == "Renamed"
+
+
+GENERATED = [
+    {"title": "Outline", "description": "First pass"},
+    {"title": ""},
+    {"description": "No title"},
+    "not an object",
+    {"title": "Draft", "description": None},
+]
+
+
+def test_generated_tasks_without_a_title_are_skipped(backend):
+    errors: list[str] = []
+    backend.errorOccurred.connect(errors.append)
+
+    result = backend.setTasksFromAI(GENERATED)
+
+    assert len(result["ids"]) == 2
+    assert result["errors"] == [f"Item {i}: skipped, no title" for i in (1, 2, 3)]
+    assert errors == ["Skipped 3 generated task(s) without a title"]
+    added = backend.getTasks()[:2]
+    assert [(t["title"], t["description"]) for t in added] == [
+        ("Draft", ""),
+        ("Outline", "First pass"),
+    ]
+
+
+def test_generated_project_tasks_without_a_title_are_skipped(backend):
+    project_tasks = ProjectTasksBackend()
+
+    result = project_tasks.setTasksFromAI("p1", GENERATED)
+
+    assert len(result["ids"]) == 2
+    assert len(result["errors"]) == 3
+    titles = [t["title"] for t in project_tasks.getProjectTasks("p1")]
+    assert titles == ["Draft", "Outline"]
@@ -0,0 +1,65 @@
+import time
+
+import pytest
+from PySide6.QtCore import QTimer
+
+# QtMultimedia needs the platform audio libraries
+pytest.importorskip("PySide6.QtMultimedia", exc_type=ImportError)
+
+from src.timer import TimerBackend  # noqa: E402
+
+SESSION_SECONDS = 3
+# (start, length) of each stall, in seconds after the session started
+STALLS = [(0.2, 0.7), (1.0, 0.7), (1.8, 0.7)]
+MAX_ERROR = 0.1
+
+
+@pytest.fixture
+def timer(qapp, monkeypatch):
+    timer = TimerBackend()
+    monkeypatch.setattr(timer._notifier, "notify", lambda title, body: None)
+    timer.set_notification_sound_enabled(False)
+    # The duration slots take minutes; a short session keeps the test fast
+    timer._work_duration = SESSION_SECONDS
+    timer.reset()
+    return timer
+
+
+def test_stalls_dont_stretch_the_session(qapp, timer):
+    completed_at: list[float] = []
+    shown: list[int] = []
+    timer.sessionCompleted.connect(lambda _: completed_at.append(time.monotonic()))
+    timer.timeRemainingChanged.connect(
+        lambda: completed_at or shown.append(timer.timeRemaining)
+    )
+
+    # Each stall blocks the event loop, as a slow slot on the GUI thread would
+    for start, length in STALLS:
+        QTimer.singleShot(int(start * 1000), lambda length=length: time.sleep(length))
+
+    started = time.monotonic()
+    timer.start()
+    while not completed_at and time.monotonic() - started < SESSION_SECONDS + 5:
+        qapp.processEvents()
+        time.sleep(0.001)
+
+    assert completed_at, "the session never completed"
+    error = completed_at[0] - (started + SESSION_SECONDS)
+    assert abs(error) < MAX_ERROR
+    # The display catches up after a stall but never counts back up
+    assert shown == sorted(shown, reverse=True)
+    assert shown[-1] == 1
+
+
+def test_choosing_another_project_clears_the_task(qapp, timer):
+    changes: list[tuple[str, str]] = []
+    timer.activeChanged.connect(
+        lambda: changes.append((timer.activeProjectId, timer.activeTaskId))
+    )
+
+    timer.setActiveProject("p1")
+    timer.setActiveTask("t1")
+    timer.setActiveProject("p1")
+    timer.setActiveProject("p2")
+
+    assert changes == [("p1", ""), ("p1", "t1"), ("p2", "")]